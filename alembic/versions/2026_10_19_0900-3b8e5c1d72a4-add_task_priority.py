@@ -0,0 +1,43 @@
+"""add task priority
+
+Revision ID: 3b8e5c1d72a4
+Revises: 0f01908e6629
+Create Date: 2026-10-19 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "3b8e5c1d72a4"
+down_revision = "0f01908e6629"
+branch_labels = None
+depends_on = None
+
+
+TASK_PRIORITY_ENUM_NAME = "task_priority"
+TASK_PRIORITY_VALUES = ("HIGH", "NORMAL", "LOW")
+
+
+def upgrade() -> None:
+    task_priority_enum = sa.Enum(*TASK_PRIORITY_VALUES, name=TASK_PRIORITY_ENUM_NAME)
+    task_priority_enum.create(bind=op.get_bind(), checkfirst=True)
+
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "priority",
+            task_priority_enum,
+            nullable=False,
+            server_default=sa.text("'NORMAL'"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "priority")
+
+    task_priority_enum = sa.Enum(*TASK_PRIORITY_VALUES, name=TASK_PRIORITY_ENUM_NAME)
+    task_priority_enum.drop(bind=op.get_bind(), checkfirst=True)
@@ -0,0 +1,35 @@
+"""add task idempotency key
+
+Revision ID: 8d41f0a6c2e9
+Revises: 3b8e5c1d72a4
+Create Date: 2026-10-19 09:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "8d41f0a6c2e9"
+down_revision = "3b8e5c1d72a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("idempotency_key", sa.String(length=255), nullable=True),
+    )
+    op.create_index(
+        "uq_tasks_idempotency_key",
+        "tasks",
+        ["idempotency_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_tasks_idempotency_key", table_name="tasks")
+    op.drop_column("tasks", "idempotency_key")
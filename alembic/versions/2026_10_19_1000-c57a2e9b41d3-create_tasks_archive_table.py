@@ -0,0 +1,59 @@
+"""create tasks archive table
+
+Revision ID: c57a2e9b41d3
+Revises: 8d41f0a6c2e9
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "c57a2e9b41d3"
+down_revision = "8d41f0a6c2e9"
+branch_labels = None
+depends_on = None
+
+
+TASK_STATUS_VALUES = ("PENDING", "PROCESSING", "DONE", "FAILED")
+TASK_PRIORITY_VALUES = ("HIGH", "NORMAL", "LOW")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tasks_archive",
+        sa.Column("id", sa.String(length=36), primary_key=True),
+        sa.Column("title", sa.String(length=255), nullable=False),
+        sa.Column("payload", sa.JSON(), nullable=True),
+        sa.Column("status", sa.Enum(*TASK_STATUS_VALUES, name="task_status"), nullable=False),
+        sa.Column(
+            "priority",
+            sa.Enum(*TASK_PRIORITY_VALUES, name="task_priority"),
+            nullable=False,
+            server_default=sa.text("'NORMAL'"),
+        ),
+        sa.Column("created_at", mysql.DATETIME(fsp=6), nullable=False),
+        sa.Column("updated_at", mysql.DATETIME(fsp=6), nullable=False),
+        sa.Column("finished_at", mysql.DATETIME(fsp=6), nullable=True),
+        sa.Column(
+            "archived_at",
+            mysql.DATETIME(fsp=6),
+            server_default=sa.text("CURRENT_TIMESTAMP(6)"),
+            nullable=False,
+        ),
+    )
+    op.create_index("idx_tasks_archive_status", "tasks_archive", ["status"])
+    op.create_index("idx_tasks_archive_finished_at", "tasks_archive", ["finished_at"])
+
+    op.create_index("idx_tasks_finished_at", "tasks", ["finished_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tasks_finished_at", table_name="tasks")
+
+    op.drop_index("idx_tasks_archive_finished_at", table_name="tasks_archive")
+    op.drop_index("idx_tasks_archive_status", table_name="tasks_archive")
+    op.drop_table("tasks_archive")
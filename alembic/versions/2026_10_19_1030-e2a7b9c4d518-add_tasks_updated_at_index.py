@@ -0,0 +1,24 @@
+"""add tasks updated_at index
+
+Revision ID: e2a7b9c4d518
+Revises: c57a2e9b41d3
+Create Date: 2026-10-19 10:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "e2a7b9c4d518"
+down_revision = "c57a2e9b41d3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_tasks_updated_at", "tasks", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tasks_updated_at", table_name="tasks")
@@ -0,0 +1,51 @@
+"""add cancelled task status
+
+Revision ID: 4f6d2a8b9c13
+Revises: e2a7b9c4d518
+Create Date: 2026-10-19 11:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "4f6d2a8b9c13"
+down_revision = "e2a7b9c4d518"
+branch_labels = None
+depends_on = None
+
+
+TASK_STATUS_ENUM_NAME = "task_status"
+OLD_TASK_STATUS_VALUES = ("PENDING", "PROCESSING", "DONE", "FAILED")
+NEW_TASK_STATUS_VALUES = ("PENDING", "PROCESSING", "DONE", "FAILED", "CANCELLED")
+
+
+# MySQL's MODIFY COLUMN drops a default that is not restated.
+STATUS_SERVER_DEFAULTS = {
+    "tasks": sa.text("'PENDING'"),
+    "tasks_archive": None,
+}
+
+
+def _alter_status(table: str, old_values: tuple[str, ...], new_values: tuple[str, ...]) -> None:
+    op.alter_column(
+        table,
+        "status",
+        existing_type=sa.Enum(*old_values, name=TASK_STATUS_ENUM_NAME),
+        type_=sa.Enum(*new_values, name=TASK_STATUS_ENUM_NAME),
+        existing_nullable=False,
+        existing_server_default=STATUS_SERVER_DEFAULTS[table],
+    )
+
+
+def upgrade() -> None:
+    for table in STATUS_SERVER_DEFAULTS:
+        _alter_status(table, OLD_TASK_STATUS_VALUES, NEW_TASK_STATUS_VALUES)
+
+
+def downgrade() -> None:
+    for table in STATUS_SERVER_DEFAULTS:
+        op.execute(f"UPDATE {table} SET status = 'FAILED' WHERE status = 'CANCELLED'")
+        _alter_status(table, NEW_TASK_STATUS_VALUES, OLD_TASK_STATUS_VALUES)
@@ -0,0 +1,55 @@
+"""add task run_at and scheduled status
+
+Revision ID: 9a3c7e1f5b20
+Revises: 4f6d2a8b9c13
+Create Date: 2026-10-19 11:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "9a3c7e1f5b20"
+down_revision = "4f6d2a8b9c13"
+branch_labels = None
+depends_on = None
+
+
+TASK_STATUS_ENUM_NAME = "task_status"
+OLD_TASK_STATUS_VALUES = ("PENDING", "PROCESSING", "DONE", "FAILED", "CANCELLED")
+NEW_TASK_STATUS_VALUES = ("SCHEDULED", "PENDING", "PROCESSING", "DONE", "FAILED", "CANCELLED")
+
+# MySQL's MODIFY COLUMN drops a default that is not restated.
+STATUS_SERVER_DEFAULTS = {
+    "tasks": sa.text("'PENDING'"),
+    "tasks_archive": None,
+}
+
+
+def _alter_status(table: str, old_values: tuple[str, ...], new_values: tuple[str, ...]) -> None:
+    op.alter_column(
+        table,
+        "status",
+        existing_type=sa.Enum(*old_values, name=TASK_STATUS_ENUM_NAME),
+        type_=sa.Enum(*new_values, name=TASK_STATUS_ENUM_NAME),
+        existing_nullable=False,
+        existing_server_default=STATUS_SERVER_DEFAULTS[table],
+    )
+
+
+def upgrade() -> None:
+    for table in STATUS_SERVER_DEFAULTS:
+        _alter_status(table, OLD_TASK_STATUS_VALUES, NEW_TASK_STATUS_VALUES)
+        op.add_column(table, sa.Column("run_at", mysql.DATETIME(fsp=6), nullable=True))
+    op.create_index("idx_tasks_status_run_at", "tasks", ["status", "run_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_tasks_status_run_at", table_name="tasks")
+    for table in STATUS_SERVER_DEFAULTS:
+        op.drop_column(table, "run_at")
+        op.execute(f"UPDATE {table} SET status = 'PENDING' WHERE status = 'SCHEDULED'")
+        _alter_status(table, NEW_TASK_STATUS_VALUES, OLD_TASK_STATUS_VALUES)
@@ -0,0 +1,75 @@
+"""add task dependencies
+
+Revision ID: d81b6f4e2a97
+Revises: 9a3c7e1f5b20
+Create Date: 2026-10-19 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d81b6f4e2a97"
+down_revision = "9a3c7e1f5b20"
+branch_labels = None
+depends_on = None
+
+
+TASK_STATUS_ENUM_NAME = "task_status"
+OLD_TASK_STATUS_VALUES = ("SCHEDULED", "PENDING", "PROCESSING", "DONE", "FAILED", "CANCELLED")
+NEW_TASK_STATUS_VALUES = (
+    "SCHEDULED",
+    "WAITING",
+    "PENDING",
+    "PROCESSING",
+    "DONE",
+    "FAILED",
+    "CANCELLED",
+)
+
+# MySQL's MODIFY COLUMN drops a default that is not restated.
+STATUS_SERVER_DEFAULTS = {
+    "tasks": sa.text("'PENDING'"),
+    "tasks_archive": None,
+}
+
+
+def _alter_status(table: str, old_values: tuple[str, ...], new_values: tuple[str, ...]) -> None:
+    op.alter_column(
+        table,
+        "status",
+        existing_type=sa.Enum(*old_values, name=TASK_STATUS_ENUM_NAME),
+        type_=sa.Enum(*new_values, name=TASK_STATUS_ENUM_NAME),
+        existing_nullable=False,
+        existing_server_default=STATUS_SERVER_DEFAULTS[table],
+    )
+
+
+def upgrade() -> None:
+    for table in STATUS_SERVER_DEFAULTS:
+        _alter_status(table, OLD_TASK_STATUS_VALUES, NEW_TASK_STATUS_VALUES)
+    op.add_column(
+        "tasks",
+        sa.Column("pending_dependencies", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_table(
+        "task_dependencies",
+        sa.Column("task_id", sa.String(length=36), primary_key=True),
+        sa.Column("depends_on_id", sa.String(length=36), primary_key=True),
+    )
+    op.create_index(
+        "idx_task_dependencies_depends_on_id",
+        "task_dependencies",
+        ["depends_on_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_task_dependencies_depends_on_id", table_name="task_dependencies")
+    op.drop_table("task_dependencies")
+    op.drop_column("tasks", "pending_dependencies")
+    for table in STATUS_SERVER_DEFAULTS:
+        op.execute(f"UPDATE {table} SET status = 'CANCELLED' WHERE status = 'WAITING'")
+        _alter_status(table, NEW_TASK_STATUS_VALUES, OLD_TASK_STATUS_VALUES)
@@ -0,0 +1,30 @@
+"""add task progress and checkpoint
+
+Revision ID: 5e2f8c0d3b61
+Revises: d81b6f4e2a97
+Create Date: 2026-10-19 12:30:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "5e2f8c0d3b61"
+down_revision = "d81b6f4e2a97"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("progress", sa.Float(), nullable=False, server_default="0"),
+    )
+    op.add_column("tasks", sa.Column("checkpoint", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "checkpoint")
+    op.drop_column("tasks", "progress")
@@ -0,0 +1,25 @@
+"""add task partition key
+
+Revision ID: b47d9e2c6f08
+Revises: 5e2f8c0d3b61
+Create Date: 2026-10-19 13:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b47d9e2c6f08"
+down_revision = "5e2f8c0d3b61"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("tasks", sa.Column("partition_key", sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("tasks", "partition_key")
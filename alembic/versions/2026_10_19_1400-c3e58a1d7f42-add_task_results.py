@@ -0,0 +1,46 @@
+"""add task results
+
+Revision ID: c3e58a1d7f42
+Revises: b47d9e2c6f08
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "c3e58a1d7f42"
+down_revision = "b47d9e2c6f08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "task_results",
+        sa.Column("task_id", sa.String(length=36), primary_key=True),
+        sa.Column("content_type", sa.String(length=255), nullable=False),
+        sa.Column("size", sa.BigInteger(), nullable=False),
+        sa.Column("chunk_size", sa.Integer(), nullable=True),
+        sa.Column("data", mysql.MEDIUMBLOB(), nullable=True),
+        sa.Column(
+            "created_at",
+            mysql.DATETIME(fsp=6),
+            nullable=False,
+            server_default=sa.text("CURRENT_TIMESTAMP(6)"),
+        ),
+    )
+    op.create_table(
+        "task_result_chunks",
+        sa.Column("task_id", sa.String(length=36), primary_key=True),
+        sa.Column("seq", sa.Integer(), primary_key=True),
+        sa.Column("data", mysql.MEDIUMBLOB(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("task_result_chunks")
+    op.drop_table("task_results")
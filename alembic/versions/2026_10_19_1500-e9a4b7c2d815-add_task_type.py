@@ -0,0 +1,38 @@
+"""add task type
+
+Revision ID: e9a4b7c2d815
+Revises: c3e58a1d7f42
+Create Date: 2026-10-19 15:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e9a4b7c2d815"
+down_revision = "c3e58a1d7f42"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("tasks", "tasks_archive")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column(
+                "task_type",
+                sa.String(length=64),
+                nullable=False,
+                server_default="default",
+            ),
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_column(table, "task_type")
@@ -0,0 +1,35 @@
+"""archive idempotency key
+
+Revision ID: f1c6d3a8b294
+Revises: e9a4b7c2d815
+Create Date: 2026-10-19 16:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "f1c6d3a8b294"
+down_revision = "e9a4b7c2d815"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks_archive",
+        sa.Column("idempotency_key", sa.String(length=255), nullable=True),
+    )
+    op.create_index(
+        "uq_tasks_archive_idempotency_key",
+        "tasks_archive",
+        ["idempotency_key"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_tasks_archive_idempotency_key", table_name="tasks_archive")
+    op.drop_column("tasks_archive", "idempotency_key")
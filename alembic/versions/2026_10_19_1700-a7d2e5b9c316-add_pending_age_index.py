@@ -0,0 +1,32 @@
+"""add pending age index
+
+Revision ID: a7d2e5b9c316
+Revises: f1c6d3a8b294
+Create Date: 2026-10-19 17:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "a7d2e5b9c316"
+down_revision = "f1c6d3a8b294"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Extends (status, run_at), which the scheduler's due-task scan still uses,
+    # so the oldest PENDING task by created_at is one index probe.
+    op.create_index(
+        "idx_tasks_status_run_at_created_at",
+        "tasks",
+        ["status", "run_at", "created_at"],
+    )
+    op.drop_index("idx_tasks_status_run_at", table_name="tasks")
+
+
+def downgrade() -> None:
+    op.create_index("idx_tasks_status_run_at", "tasks", ["status", "run_at"])
+    op.drop_index("idx_tasks_status_run_at_created_at", table_name="tasks")
@@ -0,0 +1,45 @@
+"""store run_at with microseconds
+
+Revision ID: b5e8f1c4d720
+Revises: a7d2e5b9c316
+Create Date: 2026-10-19 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+revision = "b5e8f1c4d720"
+down_revision = "a7d2e5b9c316"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("tasks", "tasks_archive")
+
+
+# Databases migrated before 9a3c7e1f5b20 was corrected hold run_at as a
+# whole-second DATETIME; on the corrected chain this is a no-op.
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "run_at",
+            existing_type=sa.DateTime(timezone=True),
+            type_=mysql.DATETIME(fsp=6),
+            existing_nullable=True,
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(
+            table,
+            "run_at",
+            existing_type=mysql.DATETIME(fsp=6),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=True,
+        )
@@ -0,0 +1,46 @@
+"""scope idempotency keys by client
+
+Revision ID: c8e2a6d4f913
+Revises: b5e8f1c4d720
+Create Date: 2026-10-19 19:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c8e2a6d4f913"
+down_revision = "b5e8f1c4d720"
+branch_labels = None
+depends_on = None
+
+
+TABLES = ("tasks", "tasks_archive")
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.add_column(table, sa.Column("client_key", sa.String(length=64), nullable=True))
+        op.add_column(table, sa.Column("payload_hash", sa.String(length=64), nullable=True))
+        # Keys used before scoping have no known client; the empty client keeps
+        # them unique among themselves without matching any real caller.
+        op.execute(
+            sa.text(f"UPDATE {table} SET client_key = '' WHERE idempotency_key IS NOT NULL")
+        )
+        op.drop_index(f"uq_{table}_idempotency_key", table_name=table)
+        op.create_index(
+            f"uq_{table}_client_key_idempotency_key",
+            table,
+            ["client_key", "idempotency_key"],
+            unique=True,
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.drop_index(f"uq_{table}_client_key_idempotency_key", table_name=table)
+        op.create_index(f"uq_{table}_idempotency_key", table, ["idempotency_key"], unique=True)
+        op.drop_column(table, "payload_hash")
+        op.drop_column(table, "client_key")
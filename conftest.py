@@ -0,0 +1,20 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+import pytest
+import pytest_asyncio
+
+from taskflow_core import Database
+
+
+@pytest_asyncio.fixture()
+async def sqlite_database(tmp_path):
+    """A SQLite database created from the models, for tests that need real SQL behaviour."""
+    pytest.importorskip("aiosqlite")
+    database = Database(f"sqlite+aiosqlite:///{tmp_path / 'taskflow.db'}", pool_pre_ping=False)
+    await database.create_all()
+    try:
+        yield database
+    finally:
+        await database.dispose()
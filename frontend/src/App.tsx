@@ -4,7 +4,7 @@ import TaskDetail from "./components/TaskDetail";
 import TaskForm from "./components/TaskForm";
 import ToastOverlay, { ToastMessage } from "./components/ToastOverlay";
 
-export type TaskStatus = "PENDING" | "PROCESSING" | "DONE" | "FAILED";
+export type TaskStatus = "SCHEDULED" | "WAITING" | "PENDING" | "PROCESSING" | "DONE" | "FAILED" | "CANCELLED";
 
 export interface Task {
   task_id: string;
@@ -14,6 +14,8 @@ export interface Task {
   created_at: string;
   updated_at: string;
   finished_at?: string | null;
+  run_at?: string | null;
+  task_type?: string;
 }
 
 const API_BASE = process.env.REACT_APP_API_BASE ?? "http://localhost:8000";
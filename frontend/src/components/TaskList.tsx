@@ -7,10 +7,13 @@ interface TaskListProps {
 }
 
 const STATUS_LABEL: Record<string, string> = {
+  SCHEDULED: "Scheduled",
+  WAITING: "Waiting",
   PENDING: "Pending",
   PROCESSING: "Processing",
   DONE: "Done",
   FAILED: "Failed",
+  CANCELLED: "Cancelled",
 };
 
 function TaskList({ tasks, selectedId, onSelect }: TaskListProps) {
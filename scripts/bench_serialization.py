@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Microbenchmark of the validated and row-encoded task serialization paths.
+
+Measures rows/sec for ``GET /tasks`` and ``GET /tasks/{id}`` through the real
+FastAPI app (in-process, no network) with ``FAST_SERIALIZATION_ROUTES`` off
+and on, plus the bare encoding cost. The database is replaced by in-memory
+rows, so the numbers isolate serialization; the Core ``select`` used by the
+fast path additionally skips ORM hydration, which this does not measure::
+
+    python scripts/bench_serialization.py --rows 1000 --requests 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+from collections import namedtuple
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import httpx  # noqa: E402
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+
+from taskflow_core import Task, TaskPriority, TaskRead, TaskStatus  # noqa: E402
+
+from service_api.api.rows import TaskRowsResponse  # noqa: E402
+from service_api.app import create_app  # noqa: E402
+from service_api.core.config import get_settings  # noqa: E402
+from service_api.dependencies import get_task_service  # noqa: E402
+from service_api.services.export import EXPORT_COLUMNS  # noqa: E402
+from service_api.services.tasks import _to_schema  # noqa: E402
+
+TaskRow = namedtuple("TaskRow", EXPORT_COLUMNS)
+
+
+def make_tasks(count: int) -> list[Task]:
+    """Build detached ORM rows resembling a typical task table."""
+    started = datetime(2026, 10, 19, 9, 0)
+    statuses = list(TaskStatus)
+    return [
+        Task(
+            id=f"00000000-0000-4000-8000-{index:012d}",
+            title=f"Generate report {index}",
+            payload={"report": "daily", "rows": index, "filters": {"region": "eu", "active": True}},
+            status=statuses[index % len(statuses)],
+            priority=TaskPriority.NORMAL,
+            created_at=started + timedelta(seconds=index),
+            updated_at=started + timedelta(seconds=index, milliseconds=250),
+            finished_at=started + timedelta(seconds=index + 1) if index % 2 else None,
+            run_at=None,
+            task_type="default",
+        )
+        for index in range(count)
+    ]
+
+
+class BenchTaskService:
+    """Serves the same tasks as ORM objects (validated path) or column rows (fast path)."""
+
+    def __init__(self, tasks: list[Task]):
+        self._tasks = tasks
+        self._rows = [TaskRow(*(getattr(task, name) for name in EXPORT_COLUMNS)) for task in tasks]
+        self._by_id = {task.id: task for task in tasks}
+        self._rows_by_id = {row.id: row for row in self._rows}
+
+    async def get_list_version(self):
+        return len(self._tasks), self._tasks[-1].updated_at
+
+    async def list_tasks(self) -> list[TaskRead]:
+        return [_to_schema(task) for task in self._tasks]
+
+    async def list_task_rows(self) -> list[TaskRow]:
+        return self._rows
+
+    async def get_task(self, task_id: str) -> Optional[TaskRead]:
+        task = self._by_id.get(task_id)
+        return _to_schema(task) if task else None
+
+    async def get_task_row(self, task_id: str) -> Optional[TaskRow]:
+        return self._rows_by_id.get(task_id)
+
+
+def time_call(func: Callable[[], object], repeat: int) -> float:
+    """Return the best per-call wall time of ``func`` over ``repeat`` runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_encoding(service: BenchTaskService, rows: int, repeat: int) -> dict[str, float]:
+    """Rows/sec of building the list body, without HTTP or FastAPI validation."""
+
+    def validated() -> bytes:
+        models = [_to_schema(task) for task in service._tasks]
+        return json.dumps(jsonable_encoder(models), separators=(",", ":")).encode()
+
+    def fast() -> bytes:
+        return TaskRowsResponse(service._rows).body
+
+    assert json.loads(validated()) == json.loads(fast())
+    return {
+        "validated": rows / time_call(validated, repeat),
+        "fast": rows / time_call(fast, repeat),
+    }
+
+
+async def bench_endpoints(service: BenchTaskService, rows: int, requests: int) -> dict[str, float]:
+    """Rows/sec served by ``list_tasks`` and ``get_task`` with the fast path off and on."""
+    app = create_app(with_infra=False)
+
+    async def override_service() -> BenchTaskService:
+        return service
+
+    app.dependency_overrides[get_task_service] = override_service
+    settings = get_settings()
+    ids = [row.id for row in service._rows]
+    results: dict[str, float] = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for mode, routes in (("validated", ""), ("fast", "list_tasks,get_task")):
+            settings.fast_serialization_routes = routes
+            await client.get("/tasks")  # warm up
+
+            started = time.perf_counter()
+            for _ in range(requests):
+                response = await client.get("/tasks")
+                response.raise_for_status()
+            results[f"list_tasks/{mode}"] = rows * requests / (time.perf_counter() - started)
+
+            started = time.perf_counter()
+            for index in range(requests * 10):
+                response = await client.get(f"/tasks/{ids[index % len(ids)]}")
+                response.raise_for_status()
+            results[f"get_task/{mode}"] = requests * 10 / (time.perf_counter() - started)
+    return results
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="tasks returned by GET /tasks")
+    parser.add_argument("--requests", type=int, default=100, help="list requests per mode (x10 for get)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs of the bare encoding benchmark")
+    args = parser.parse_args(argv)
+
+    service = BenchTaskService(make_tasks(args.rows))
+    encoding = bench_encoding(service, args.rows, args.repeat)
+    endpoints = asyncio.run(bench_endpoints(service, args.rows, args.requests))
+
+    print(f"{'benchmark':<24}{'validated':>14}{'fast':>14}{'speedup':>10}   (rows/sec)")
+    for name, validated, fast in (
+        ("encode list body", encoding["validated"], encoding["fast"]),
+        ("GET /tasks", endpoints["list_tasks/validated"], endpoints["list_tasks/fast"]),
+        ("GET /tasks/{id}", endpoints["get_task/validated"], endpoints["get_task/fast"]),
+    ):
+        print(f"{name:<24}{validated:>14,.0f}{fast:>14,.0f}{fast / validated:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
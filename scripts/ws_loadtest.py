@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""Load and soak test for the ``/ws`` task status stream.
+
+Opens many concurrent WebSocket clients, publishes synthetic status updates
+on the Redis ``task.status`` channel at a fixed rate and reports delivery
+latency percentiles, deliveries per second, RSS per connection and
+event-loop lag.
+
+By default the API runs in this process under uvicorn, wired to Redis the
+way the service wires it (``RedisClient`` built from the ``REDIS_*``
+settings, so ``REDIS_MAX_CONNECTIONS`` applies), and RSS and loop lag
+describe the server side (plus the clients sharing its loop). ``--redis-url``
+overrides ``REDIS_URL``; ``--fake-redis`` starts a fakeredis TCP server
+(``pip install fakeredis``) to point it at instead::
+
+    python scripts/ws_loadtest.py --fake-redis --clients 2000 --rate 50 --duration 60
+    python scripts/ws_loadtest.py --redis-url redis://localhost:6379/0 --clients 5000
+
+Against a running API pass its WebSocket URL and the Redis it subscribes
+to; ``--server-pid`` samples that process's RSS instead of our own::
+
+    python scripts/ws_loadtest.py --url ws://localhost:8000/ws \\
+        --redis-url redis://localhost:6379/0 --server-pid 4242 --duration 3600
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import resource
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from websockets.asyncio.client import connect  # noqa: E402
+
+from service_api import dependencies  # noqa: E402
+from service_api.app import _redis_client, create_app  # noqa: E402
+from service_api.core.config import Settings, get_settings  # noqa: E402
+from service_api.infra.pubsub import BROADCAST_CHANNEL  # noqa: E402
+from taskflow_core.redis_pool import create_redis_client  # noqa: E402
+
+RESERVOIR_SIZE = 100_000
+LAG_PROBE_INTERVAL = 0.05
+
+
+def percentile(values: list[float], quantile: float) -> float:
+    """Nearest-rank percentile of ``values``; 0 when empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(quantile * len(ordered)))]
+
+
+def rss_bytes(pid: Optional[int] = None) -> int:
+    """Current resident set size of ``pid`` (default: this process) from /proc."""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # Not Linux: fall back to the peak RSS of this process.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+@dataclass
+class Stats:
+    """Delivery and loop-lag measurements, per report interval and overall."""
+
+    delivered: int = 0
+    interval_delivered: int = 0
+    interval_latencies: list[float] = field(default_factory=list)
+    reservoir: list[float] = field(default_factory=list)
+    seen: int = 0
+    interval_lag: list[float] = field(default_factory=list)
+    max_lag: float = 0.0
+    connected: int = 0
+    failed: int = 0
+    disconnected: int = 0
+
+    def record(self, latency: float) -> None:
+        self.delivered += 1
+        self.interval_delivered += 1
+        self.interval_latencies.append(latency)
+        # Reservoir sampling keeps overall percentiles in bounded memory on long soaks.
+        self.seen += 1
+        if len(self.reservoir) < RESERVOIR_SIZE:
+            self.reservoir.append(latency)
+        else:
+            slot = random.randrange(self.seen)
+            if slot < RESERVOIR_SIZE:
+                self.reservoir[slot] = latency
+
+    def take_interval(self) -> tuple[int, list[float], list[float]]:
+        delivered, latencies, lag = self.interval_delivered, self.interval_latencies, self.interval_lag
+        self.interval_delivered, self.interval_latencies, self.interval_lag = 0, [], []
+        return delivered, latencies, lag
+
+
+async def probe_loop_lag(stats: Stats) -> None:
+    """Measure how late a periodic sleep wakes up; the overshoot is event-loop lag."""
+    while True:
+        started = time.monotonic()
+        await asyncio.sleep(LAG_PROBE_INTERVAL)
+        lag = max(0.0, time.monotonic() - started - LAG_PROBE_INTERVAL)
+        stats.interval_lag.append(lag)
+        stats.max_lag = max(stats.max_lag, lag)
+
+
+async def run_client(url: str, stats: Stats, gate: asyncio.Semaphore) -> None:
+    """Hold one WebSocket open and record the latency of every status update."""
+    try:
+        async with gate:
+            websocket = await connect(url, ping_interval=None, max_queue=None, open_timeout=30)
+        stats.connected += 1
+    except Exception:
+        stats.failed += 1
+        return
+    try:
+        async for raw in websocket:
+            received = time.monotonic()
+            sent_at = json.loads(raw).get("sent_at")
+            if sent_at is not None:
+                stats.record(received - sent_at)
+    except Exception:
+        stats.disconnected += 1
+    finally:
+        stats.connected -= 1
+        await websocket.close()
+
+
+async def wait_for_subscribers(redis, stats: Stats, count: int, timeout: float) -> int:
+    """Wait until ``count`` clients settled and the API subscribed; return how many connected.
+
+    The API shares one Pub/Sub subscription among its WebSocket clients, so
+    Redis only tells whether that subscription exists, not how many it serves.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        [(_, subscribed)] = await redis.pubsub_numsub(BROADCAST_CHANNEL)
+        if subscribed and stats.connected + stats.failed >= count:
+            break
+        await asyncio.sleep(0.2)
+    return stats.connected
+
+
+async def publish(redis, rate: float, duration: float) -> int:
+    """Publish updates at ``rate`` per second for ``duration`` seconds on an absolute schedule."""
+    started = time.monotonic()
+    sent = 0
+    while True:
+        now = time.monotonic()
+        if now - started >= duration:
+            return sent
+        due = int((now - started) * rate) + 1
+        while sent < due:
+            payload = {
+                "task_id": f"loadtest-{sent}",
+                "status": "RUNNING",
+                "seq": sent,
+                "sent_at": time.monotonic(),
+            }
+            await redis.publish(BROADCAST_CHANNEL, json.dumps(payload))
+            sent += 1
+        await asyncio.sleep(max(0.0, started + sent / rate - time.monotonic()))
+
+
+async def report(stats: Stats, interval: float, server_pid: Optional[int]) -> None:
+    """Print one line of interval statistics every ``interval`` seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        delivered, latencies, lag = stats.take_interval()
+        print(
+            f"[{time.strftime('%H:%M:%S')}] conns={stats.connected} "
+            f"deliveries/s={delivered / interval:.0f} "
+            f"p50={percentile(latencies, 0.5) * 1000:.1f}ms "
+            f"p99={percentile(latencies, 0.99) * 1000:.1f}ms "
+            f"loop_lag_p99={percentile(lag, 0.99) * 1000:.1f}ms "
+            f"rss={rss_bytes(server_pid) / 2**20:.0f}MiB",
+            flush=True,
+        )
+
+
+async def start_local_api(settings: Settings, port: int):
+    """Serve ``service_api`` in this process with Redis connected from ``settings``.
+
+    MySQL and RabbitMQ are left out; the WebSocket route only needs Redis.
+    """
+    import uvicorn
+
+    dependencies.redis_client = _redis_client(settings)
+    await dependencies.redis_client.connect()
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(with_infra=False),
+            host="127.0.0.1",
+            port=port,
+            log_level="warning",
+            lifespan="on",
+            ws_ping_interval=None,
+            timeout_graceful_shutdown=5,
+        )
+    )
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        if task.done():
+            task.result()
+        await asyncio.sleep(0.05)
+    bound = server.servers[0].sockets[0].getsockname()[1]
+    return server, task, f"ws://127.0.0.1:{bound}/ws"
+
+
+def start_fake_redis():
+    """Serve fakeredis over TCP on a free local port; return the server and its URL."""
+    try:
+        from fakeredis import TcpFakeServer
+    except ImportError:
+        sys.exit("fakeredis is not installed: pip install fakeredis, or pass --redis-url")
+    server = TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address[:2]
+    return server, f"redis://{host}:{port}/0"
+
+
+def summarize(
+    args: argparse.Namespace,
+    stats: Stats,
+    *,
+    subscribed: int,
+    connect_seconds: float,
+    published: int,
+    elapsed: float,
+    per_connection: float,
+    rss: int,
+    redis_max_connections: int,
+) -> dict[str, float]:
+    """Condense one run into the figures printed (or emitted as JSON) at the end."""
+    expected = published * subscribed
+    return {
+        "clients": args.clients,
+        "subscribed": subscribed,
+        "connect_failures": stats.failed,
+        "disconnects": stats.disconnected,
+        "connect_seconds": round(connect_seconds, 3),
+        "published": published,
+        "delivered": stats.delivered,
+        "delivery_ratio": round(stats.delivered / expected, 4) if expected else 0.0,
+        "deliveries_per_second": round(stats.delivered / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_p50_ms": round(percentile(stats.reservoir, 0.5) * 1000, 2),
+        "latency_p95_ms": round(percentile(stats.reservoir, 0.95) * 1000, 2),
+        "latency_p99_ms": round(percentile(stats.reservoir, 0.99) * 1000, 2),
+        "latency_max_ms": round(max(stats.reservoir, default=0.0) * 1000, 2),
+        "rss_per_connection_kib": round(per_connection / 1024, 1),
+        "rss_mib": round(rss / 2**20, 1),
+        "loop_lag_max_ms": round(stats.max_lag * 1000, 2),
+        "redis_max_connections": redis_max_connections,
+    }
+
+
+def raise_fd_limit(needed: int) -> None:
+    """Lift the soft open-file limit towards the hard limit for ``needed`` sockets."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = needed if hard == resource.RLIM_INFINITY else min(hard, needed)
+    if soft != resource.RLIM_INFINITY and soft < target:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+async def main(args: argparse.Namespace) -> dict[str, float]:
+    """Run one load test and return its summary."""
+    if args.url and not args.redis_url:
+        sys.exit("--url needs --redis-url: the publisher must reach the API's Redis")
+    # Each client costs a socket on both ends in-process.
+    raise_fd_limit(args.clients * 3 + 256)
+
+    settings = get_settings()
+    fake_redis = None
+    if args.fake_redis:
+        fake_redis, settings.redis_url = start_fake_redis()
+    elif args.redis_url:
+        settings.redis_url = args.redis_url
+    # Stands in for the worker: publishes through a pool sized like the API's.
+    redis = create_redis_client(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        acquire_timeout=settings.redis_acquire_timeout,
+    )
+    server = server_task = None
+    url = args.url
+    if url is None:
+        server, server_task, url = await start_local_api(settings, args.port)
+    server_pid = args.server_pid if args.url else None
+
+    stats = Stats()
+    probes = [asyncio.create_task(probe_loop_lag(stats))]
+    baseline_rss = rss_bytes(server_pid)
+    gate = asyncio.Semaphore(args.connect_concurrency)
+    connect_started = time.monotonic()
+    clients = [asyncio.create_task(run_client(url, stats, gate)) for _ in range(args.clients)]
+    subscribed = await wait_for_subscribers(redis, stats, args.clients, args.connect_timeout)
+    connect_seconds = time.monotonic() - connect_started
+    per_connection = (rss_bytes(server_pid) - baseline_rss) / max(1, subscribed)
+    print(
+        f"{stats.connected} connected, {stats.failed} failed, {subscribed} subscribed "
+        f"in {connect_seconds:.1f}s; ~{per_connection / 1024:.1f} KiB RSS per connection",
+        flush=True,
+    )
+
+    probes.append(asyncio.create_task(report(stats, args.report_interval, server_pid)))
+    published_started = time.monotonic()
+    published = await publish(redis, args.rate, args.duration)
+    await asyncio.sleep(args.settle)
+    elapsed = time.monotonic() - published_started
+
+    summary = summarize(
+        args,
+        stats,
+        subscribed=subscribed,
+        connect_seconds=connect_seconds,
+        published=published,
+        elapsed=elapsed,
+        per_connection=per_connection,
+        rss=rss_bytes(server_pid),
+        redis_max_connections=settings.redis_max_connections,
+    )
+
+    for task in [*probes, *clients]:
+        task.cancel()
+    await asyncio.gather(*probes, *clients, return_exceptions=True)
+    if server is not None:
+        # Server-side handlers only notice their client left when they next send.
+        await redis.publish(BROADCAST_CHANNEL, json.dumps({"status": "shutdown"}))
+        await asyncio.sleep(0.5)
+        server.should_exit = True
+        await server_task
+        await dependencies.redis_client.close()
+        dependencies.redis_client = None
+    await redis.aclose()
+    if fake_redis is not None:
+        fake_redis.shutdown()
+        fake_redis.server_close()
+    return summary
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=1000, help="concurrent WebSocket clients")
+    parser.add_argument("--rate", type=float, default=20.0, help="status updates published per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds to publish for (soak: hours)")
+    parser.add_argument("--url", help="WebSocket URL of a running API (default: serve one in-process)")
+    parser.add_argument("--redis-url", help="Redis the API subscribes to (default: REDIS_URL)")
+    parser.add_argument("--fake-redis", action="store_true", help="serve fakeredis over TCP instead")
+    parser.add_argument("--server-pid", type=int, help="with --url, sample this process's RSS")
+    parser.add_argument("--port", type=int, default=0, help="port for the in-process API (0 picks one)")
+    parser.add_argument("--connect-concurrency", type=int, default=200, help="handshakes in flight")
+    parser.add_argument("--connect-timeout", type=float, default=120.0, help="seconds to wait for subscribers")
+    parser.add_argument("--report-interval", type=float, default=5.0, help="seconds between progress lines")
+    parser.add_argument("--settle", type=float, default=2.0, help="seconds to wait for stragglers after publishing")
+    parser.add_argument("--json", action="store_true", help="print the summary as JSON")
+    args = parser.parse_args(argv)
+    if args.fake_redis and (args.url or args.redis_url):
+        parser.error("--fake-redis serves the in-process API only; drop --url/--redis-url")
+    return args
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    result = asyncio.run(main(arguments))
+    if arguments.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key:>24}: {value}")
@@ -0,0 +1,38 @@
+"""Entity tag helpers for conditional GET requests."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import datetime, timezone
+from typing import Optional
+
+
+def _micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return 0
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1_000_000)
+
+
+def make_etag(*parts: object) -> str:
+    """Build a weak ETag from version parts; datetimes are normalised to UTC microseconds.
+
+    Weak validators stay valid when the body is served gzip-compressed.
+    """
+    normalised = "|".join(
+        str(_micros(part)) if isinstance(part, datetime) else str(part) for part in parts
+    )
+    digest = hashlib.blake2b(normalised.encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return True when an ``If-None-Match`` header matches ``etag`` using weak comparison."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    if "*" in candidates:
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.removeprefix("W/") == opaque for tag in candidates)
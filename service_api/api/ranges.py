@@ -0,0 +1,43 @@
+"""Parsing of single byte-range ``Range`` request headers."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+
+class RangeNotSatisfiable(ValueError):
+    """Raised when a syntactically valid range lies entirely outside the body."""
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Return the inclusive ``(start, end)`` requested by ``header``, or None for the full body.
+
+    Only a single ``bytes=`` range is honoured; other units, multiple ranges
+    and malformed headers are ignored as RFC 9110 allows, and the full body
+    is served.
+    """
+    if not header:
+        return None
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    first, dash, last = spec.strip().partition("-")
+    if not dash:
+        return None
+    try:
+        if not first:
+            suffix = int(last)
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if not first:
+        if suffix <= 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - suffix), size - 1
+    if start < 0 or (last and start > end):
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
@@ -2,41 +2,220 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from typing import Optional
 
-from taskflow_core import TaskCreate, TaskRead
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
 
-from ..services.tasks import TaskService
-from ..dependencies import get_task_service
+from taskflow_core import (
+    TaskCreate,
+    TaskLookupRequest,
+    TaskLookupResponse,
+    TaskPriority,
+    TaskRead,
+    TaskStats,
+    TaskStatus,
+)
+from taskflow_core.stats import MAX_WINDOW_MINUTES
+
+from .etag import etag_matches, make_etag
+from .ranges import RangeNotSatisfiable, parse_byte_range
+from .rows import TaskRowResponse, TaskRowsResponse
+from ..services.export import TaskExporter
+from ..services.results import TaskResultReader
+from ..services.tasks import IdempotencyKeyReused, TaskDependencyError, TaskService
+from ..dependencies import (
+    admit_submission,
+    fast_serialization,
+    get_result_reader,
+    get_task_exporter,
+    get_task_service,
+    mark_recent_write,
+    submitting_client,
+)
 
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 
-@router.post("", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "",
+    response_model=TaskRead,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(admit_submission)],
+)
 async def create_task(
     payload: TaskCreate,
+    response: Response,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    client: str = Depends(submitting_client),
     service: TaskService = Depends(get_task_service),
 ) -> TaskRead:
-    """Create a new task row and enqueue it for processing."""
-    return await service.create_task(payload)
+    """Create a new task row and enqueue it, replaying the original task for a reused Idempotency-Key."""
+    try:
+        task = await service.create_task(payload, idempotency_key=idempotency_key, client=client)
+    except (TaskDependencyError, IdempotencyKeyReused) as exc:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc))
+    mark_recent_write(response)
+    return task
+
+
+@router.post("/lookup", response_model=TaskLookupResponse)
+async def lookup_tasks(
+    request: TaskLookupRequest,
+    service: TaskService = Depends(get_task_service),
+) -> TaskLookupResponse:
+    """Resolve up to MAX_LOOKUP_IDS tasks in one call, optionally projecting their fields."""
+    return await service.lookup_tasks(request.task_ids, fields=request.fields)
+
+
+@router.post("/{task_id}/cancel", response_model=TaskRead)
+async def cancel_task(
+    task_id: str,
+    response: Response,
+    service: TaskService = Depends(get_task_service),
+) -> TaskRead:
+    """Cancel a pending or running task; 404 if missing, 409 if it already finished."""
+    task = await service.cancel_task(task_id)
+    if task is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    if task.status != TaskStatus.CANCELLED:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Task already finished with status {task.status}",
+        )
+    mark_recent_write(response)
+    return task
 
 
 @router.get("", response_model=list[TaskRead])
 async def list_tasks(
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: TaskService = Depends(get_task_service),
-) -> list[TaskRead]:
-    """Return all persisted tasks ordered by most recent creation."""
+) -> list[TaskRead] | Response:
+    """Return all persisted tasks ordered by most recent creation, or 304 when unchanged.
+
+    Routes listed in ``FAST_SERIALIZATION_ROUTES`` encode column rows straight
+    to JSON instead of building and re-validating ``TaskRead`` models.
+    """
+    count, latest = await service.get_list_version()
+    etag = make_etag("tasks", count, latest)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    if fast_serialization("list_tasks"):
+        return TaskRowsResponse(await service.list_task_rows(), headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return await service.list_tasks()
 
 
+@router.get("/stats", response_model=TaskStats)
+async def get_task_stats(
+    minutes: int = Query(15, ge=1, le=MAX_WINDOW_MINUTES),
+    service: TaskService = Depends(get_task_service),
+) -> TaskStats:
+    """Return status counts, per-minute throughput and duration percentiles without scanning tasks."""
+    stats = await service.get_stats(minutes=minutes)
+    if stats is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Task statistics unavailable",
+        )
+    return stats
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_tasks(
+    status_filter: Optional[TaskStatus] = Query(None, alias="status"),
+    priority: Optional[TaskPriority] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    include_archived: bool = False,
+    gzip: bool = False,
+    exporter: TaskExporter = Depends(get_task_exporter),
+) -> StreamingResponse:
+    """Stream matching tasks as NDJSON (optionally gzip) from a server-side cursor."""
+    body = exporter.export(
+        gzip=gzip,
+        status=status_filter,
+        priority=priority,
+        created_from=created_from,
+        created_to=created_to,
+        include_archived=include_archived,
+    )
+    filename = "tasks.ndjson.gz" if gzip else "tasks.ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
+    if gzip:
+        # The body is already a gzip file, so keep GZipMiddleware from compressing it again.
+        headers["Content-Encoding"] = "identity"
+    return StreamingResponse(
+        body,
+        media_type="application/gzip" if gzip else "application/x-ndjson",
+        headers=headers,
+    )
+
+
+@router.get("/{task_id}/result", response_class=StreamingResponse)
+async def get_task_result(
+    task_id: str,
+    range_header: Optional[str] = Header(None, alias="Range"),
+    reader: TaskResultReader = Depends(get_result_reader),
+) -> Response:
+    """Stream a finished task's output, honouring a single ``Range: bytes=`` request."""
+    result = await reader.get(task_id)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task result not found")
+
+    headers = {"Accept-Ranges": "bytes"}
+    try:
+        byte_range = parse_byte_range(range_header, result.size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={**headers, "Content-Range": f"bytes */{result.size}"},
+        )
+
+    status_code = status.HTTP_200_OK
+    start, end = 0, result.size - 1
+    if byte_range is not None:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        # Offsets refer to the stored bytes, so keep GZipMiddleware off partial bodies.
+        headers["Content-Encoding"] = "identity"
+        headers["Content-Range"] = f"bytes {start}-{end}/{result.size}"
+    headers["Content-Length"] = str(max(0, end - start + 1))
+    return StreamingResponse(
+        reader.stream(result, start, end),
+        status_code=status_code,
+        media_type=result.content_type,
+        headers=headers,
+    )
+
+
 @router.get("/{task_id}", response_model=TaskRead)
 async def get_task(
     task_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
     service: TaskService = Depends(get_task_service),
-) -> TaskRead:
-    """Fetch a single task by identifier or raise 404 if missing."""
+) -> TaskRead | Response:
+    """Fetch a single task by identifier, 304 when the client copy is current, or 404 if missing."""
+    if if_none_match:
+        version = await service.get_task_version(task_id)
+        if version is not None:
+            etag = make_etag(task_id, version)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    if fast_serialization("get_task"):
+        row = await service.get_task_row(task_id)
+        if row is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+        return TaskRowResponse(row, headers={"ETag": make_etag(row.id, row.updated_at)})
+
     task = await service.get_task(task_id)
     if not task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
+    response.headers["ETag"] = make_etag(task.task_id, task.updated_at)
     return task
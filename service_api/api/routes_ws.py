@@ -5,11 +5,10 @@ from __future__ import annotations
 import json
 
 from fastapi import APIRouter, Depends, WebSocket, WebSocketDisconnect
-from redis.asyncio import Redis
 
 from .responses import websocket_error
-from ..infra.pubsub import stream_task_updates
-from ..dependencies import redis_client_dependency
+from ..infra.pubsub import TaskUpdateBroadcaster
+from ..dependencies import task_updates_dependency
 
 
 router = APIRouter(tags=["websocket"])
@@ -18,10 +17,10 @@ router = APIRouter(tags=["websocket"])
 @router.websocket("/ws")
 async def websocket_endpoint(
     websocket: WebSocket,
-    redis: Redis | None = Depends(redis_client_dependency),
+    updates: TaskUpdateBroadcaster | None = Depends(task_updates_dependency),
 ) -> None:
     """Stream every task status update to the connected WebSocket client."""
-    if redis is None:
+    if updates is None:
         await websocket.accept()
         await websocket.send_text(json.dumps(websocket_error("Realtime updates unavailable")))
         await websocket.close()
@@ -29,7 +28,7 @@ async def websocket_endpoint(
 
     await websocket.accept()
     try:
-        async for payload in stream_task_updates(redis):
+        async for payload in updates.stream():
             await websocket.send_text(payload)
     except WebSocketDisconnect:
         return
@@ -3,19 +3,26 @@
 from __future__ import annotations
 
 from contextlib import asynccontextmanager
-import asyncio
 import logging
+from typing import Optional
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from redis.asyncio import Redis
 
-from taskflow_core import Database
+from taskflow_core import Database, TaskStatus
+from taskflow_core.backlog import backlog_samples, desired_workers, oldest_pending_age, read_backlog
+from taskflow_core.metrics import CONTENT_TYPE, pool_samples, render_prometheus
+from taskflow_core.startup import StartupTimer, connect_with_retry, start_concurrently
+from taskflow_core.stats import TaskStatsRecorder
 
 from .api.routes_tasks import router as tasks_router
 from .api.routes_ws import router as ws_router
-from .core.config import get_settings
+from .core.config import Settings, get_settings
 from .infra.cache import RedisClient
 from .infra.mq import TaskEventPublisher
+from .services.admission import AdmissionControl, LoadShedder, RateLimiter
 
 
 logger = logging.getLogger(__name__)
@@ -31,49 +38,71 @@ def create_app(*, with_infra: bool = True) -> FastAPI:
         from . import dependencies
 
         if with_infra:
-            dependencies.database = Database(settings.db_url, echo=settings.db_echo)
+            timer = StartupTimer("api")
+            replica_urls = [url.strip() for url in settings.db_replica_urls.split(",") if url.strip()]
+            dependencies.database = Database(
+                settings.db_url,
+                echo=settings.db_echo,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout,
+                pool_recycle=settings.db_pool_recycle,
+                pool_pre_ping=settings.db_pool_pre_ping,
+                replica_urls=replica_urls,
+                replica_ejection_seconds=settings.db_replica_ejection_seconds,
+            )
             dependencies.publisher = TaskEventPublisher(
                 settings.rabbitmq_url,
                 exchange_name=settings.rabbitmq_exchange,
                 routing_key=settings.rabbitmq_routing_key,
+                channel_pool_size=settings.amqp_channel_pool_size,
+                acquire_timeout=settings.amqp_acquire_timeout,
+                heartbeat=settings.amqp_heartbeat,
+                partitions=settings.task_partitions,
             )
-            dependencies.redis_client = RedisClient(settings.redis_url)
+            dependencies.redis_client = _redis_client(settings)
+
+            async def connect_database() -> None:
+                await connect_with_retry(
+                    "MySQL",
+                    dependencies.database.check_schema,
+                    attempts=settings.db_connect_attempts,
+                    backoff=settings.db_connect_backoff,
+                )
 
-            db_attempts = settings.db_connect_attempts
-            db_backoff = settings.db_connect_backoff
-            for attempt in range(1, db_attempts + 1):
+            async def connect_publisher() -> None:
                 try:
-                    await dependencies.database.create_all()
-                    break
+                    await dependencies.publisher.connect()
                 except Exception as exc:  # pragma: no cover - exercised in integration setups
-                    if attempt == db_attempts:
-                        logger.warning("Database initialisation failed: %s", exc)
-                        raise
-                    wait_time = db_backoff * attempt
-                    logger.warning(
-                        "Database unavailable (attempt %s/%s): %s. Retrying in %.1fs",
-                        attempt,
-                        db_attempts,
-                        exc,
-                        wait_time,
-                    )
-                    await asyncio.sleep(wait_time)
-
-            try:
-                await dependencies.publisher.connect()
-            except Exception as exc:  # pragma: no cover - exercised in integration setups
-                logger.warning("RabbitMQ connection failed: %s", exc)
-                dependencies.publisher = None
+                    logger.warning("RabbitMQ connection failed: %s", exc)
+                    dependencies.publisher = None
 
-            try:
-                await dependencies.redis_client.connect()
-            except Exception as exc:  # pragma: no cover - exercised in integration setups
-                logger.warning("Redis connection failed: %s", exc)
-                dependencies.redis_client = None
+            async def connect_redis() -> None:
+                try:
+                    await dependencies.redis_client.connect()
+                except Exception as exc:  # pragma: no cover - exercised in integration setups
+                    logger.warning("Redis connection failed: %s", exc)
+                    dependencies.redis_client = None
+
+            await start_concurrently(
+                timer,
+                {
+                    "mysql": connect_database,
+                    "rabbitmq": connect_publisher,
+                    "redis": connect_redis,
+                },
+            )
+            dependencies.admission = _admission_control(
+                settings,
+                dependencies.database,
+                dependencies.redis_client.client if dependencies.redis_client is not None else None,
+            )
+            timer.report()
 
             try:
                 yield
             finally:
+                dependencies.admission = None
                 if dependencies.publisher is not None:
                     await dependencies.publisher.close()
                 if dependencies.redis_client is not None:
@@ -97,14 +126,98 @@ def create_app(*, with_infra: bool = True) -> FastAPI:
         allow_headers=["*"],
     )
 
+    application.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_minimum_size,
+        compresslevel=settings.gzip_compress_level,
+    )
+
     @application.get("/healthz")
     async def healthcheck() -> dict[str, str]:
         """Provide a lightweight readiness indicator."""
         return {"status": "ok"}
 
+    @application.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Expose pool and backlog gauges in Prometheus text format."""
+        from . import dependencies
+
+        samples = []
+        if dependencies.database is not None:
+            samples += await _backlog(settings, dependencies.database, dependencies.redis_client)
+        if dependencies.database is not None:
+            samples += pool_samples("db", dependencies.database.pool_metrics())
+        if dependencies.redis_client is not None:
+            samples += pool_samples("redis", {"default": dependencies.redis_client.pool_metrics()})
+        if dependencies.publisher is not None:
+            samples += pool_samples("amqp", {"channels": dependencies.publisher.pool_metrics()})
+        return Response(render_prometheus(samples), media_type=CONTENT_TYPE)
+
     application.include_router(tasks_router)
     application.include_router(ws_router)
     return application
 
 
+def _redis_client(settings: Settings) -> RedisClient:
+    """Build the Redis client manager from the ``REDIS_*`` settings."""
+    return RedisClient(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        acquire_timeout=settings.redis_acquire_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+    )
+
+
+async def _backlog(
+    settings: Settings,
+    database: Database,
+    redis_client: Optional[RedisClient],
+) -> list[tuple[str, dict[str, str], float]]:
+    """Read the backlog gauges and desired worker count; empty when a backend is down."""
+    stats = TaskStatsRecorder(redis_client.client) if redis_client is not None else None
+
+    async def oldest_age() -> float:
+        async with database.read_session() as session:
+            return await oldest_pending_age(session)
+
+    try:
+        snapshot = await read_backlog(stats, oldest_age)
+    except Exception as exc:
+        logger.warning("Failed to read task backlog: %s", exc)
+        return []
+    desired = desired_workers(
+        snapshot,
+        slots_per_worker=settings.autoscale_slots_per_worker,
+        drain_seconds=settings.autoscale_drain_seconds,
+        minimum=settings.autoscale_min_workers,
+        maximum=settings.autoscale_max_workers or None,
+    )
+    return backlog_samples(snapshot, desired)
+
+
+def _admission_control(
+    settings: Settings,
+    database: Database,
+    redis: Optional[Redis],
+) -> AdmissionControl:
+    """Build the rate limiter and load shedder guarding ``POST /tasks``."""
+    limiter = None
+    if settings.rate_limit_per_second > 0:
+        limiter = RateLimiter(
+            redis,
+            rate=settings.rate_limit_per_second,
+            burst=settings.rate_limit_burst,
+        )
+    stats = TaskStatsRecorder(redis) if redis is not None else None
+    shedder = LoadShedder(
+        backlog=(lambda: stats.status_count(TaskStatus.PENDING)) if stats is not None else None,
+        pool_stats=lambda: database.pool_stats,
+        max_backlog=settings.shed_max_backlog,
+        max_pool_wait=settings.shed_max_pool_wait,
+        retry_after=settings.shed_retry_after,
+        interval=settings.shed_check_interval,
+    )
+    return AdmissionControl(limiter=limiter, shedder=shedder)
+
+
 app = create_app()
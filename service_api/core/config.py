@@ -18,9 +18,40 @@ class Settings(BaseSettings):
     rabbitmq_exchange: str = Field("task.topic", env="RABBITMQ_EXCHANGE")
     rabbitmq_routing_key: str = Field("task.created", env="RABBITMQ_ROUTING_KEY")
     db_echo: bool = Field(False, env="DB_ECHO")
+    db_pool_size: int = Field(5, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, env="DB_POOL_PRE_PING")
+    redis_max_connections: int = Field(100, env="REDIS_MAX_CONNECTIONS")
+    redis_acquire_timeout: float = Field(5.0, env="REDIS_ACQUIRE_TIMEOUT")
+    redis_health_check_interval: int = Field(30, env="REDIS_HEALTH_CHECK_INTERVAL")
+    amqp_channel_pool_size: int = Field(8, env="AMQP_CHANNEL_POOL_SIZE")
+    amqp_acquire_timeout: float = Field(5.0, env="AMQP_ACQUIRE_TIMEOUT")
+    amqp_heartbeat: int = Field(60, env="AMQP_HEARTBEAT")
+    task_partitions: int = Field(1, env="TASK_PARTITIONS")
+    db_replica_urls: str = Field("", env="DB_REPLICA_URLS")
+    db_replica_ejection_seconds: float = Field(30.0, env="DB_REPLICA_EJECTION_SECONDS")
+    read_your_writes_window: int = Field(5, env="READ_YOUR_WRITES_WINDOW")
     db_connect_attempts: int = Field(10, env="DB_CONNECT_ATTEMPTS")
-    db_connect_backoff: float = Field(2.0, env="DB_CONNECT_BACKOFF")
+    db_connect_backoff: float = Field(0.25, env="DB_CONNECT_BACKOFF")
     cors_allow_origins: str = Field("*", env="CORS_ALLOW_ORIGINS")
+    idempotency_cache_ttl: int = Field(600, env="IDEMPOTENCY_CACHE_TTL")
+    task_state_cache_ttl: int = Field(60, env="TASK_STATE_CACHE_TTL")
+    gzip_minimum_size: int = Field(1024, env="GZIP_MINIMUM_SIZE")
+    gzip_compress_level: int = Field(6, env="GZIP_COMPRESS_LEVEL")
+    export_batch_size: int = Field(1000, env="EXPORT_BATCH_SIZE")
+    fast_serialization_routes: str = Field("list_tasks,get_task", env="FAST_SERIALIZATION_ROUTES")
+    rate_limit_per_second: float = Field(20.0, env="RATE_LIMIT_PER_SECOND")
+    rate_limit_burst: int = Field(40, env="RATE_LIMIT_BURST")
+    shed_max_backlog: int = Field(100_000, env="SHED_MAX_BACKLOG")
+    shed_max_pool_wait: float = Field(0.5, env="SHED_MAX_POOL_WAIT")
+    shed_retry_after: float = Field(5.0, env="SHED_RETRY_AFTER")
+    shed_check_interval: float = Field(1.0, env="SHED_CHECK_INTERVAL")
+    autoscale_slots_per_worker: int = Field(8, env="AUTOSCALE_SLOTS_PER_WORKER")
+    autoscale_drain_seconds: float = Field(60.0, env="AUTOSCALE_DRAIN_SECONDS")
+    autoscale_min_workers: int = Field(1, env="AUTOSCALE_MIN_WORKERS")
+    autoscale_max_workers: int = Field(50, env="AUTOSCALE_MAX_WORKERS")
 
     class Config:
         env_file = ".env"
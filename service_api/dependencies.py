@@ -2,20 +2,32 @@
 
 from __future__ import annotations
 
-from fastapi import Depends
+import math
+import time
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Request, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from redis.asyncio import Redis
 
 from taskflow_core import Database
 
+from .core.config import get_settings
 from .infra.mq import TaskEventPublisher
 from .infra.cache import RedisClient
+from .infra.pubsub import TaskUpdateBroadcaster
+from .services.admission import AdmissionControl, AdmissionRejected, client_key
+from .services.export import TaskExporter
+from .services.results import TaskResultReader
 from .services.tasks import TaskService
 
 database: Database | None = None
 publisher: TaskEventPublisher | None = None
 redis_client: RedisClient | None = None
+admission: AdmissionControl | None = None
+
+READ_YOUR_WRITES_COOKIE = "taskflow_rw_until"
 
 
 async def get_session() -> AsyncSession:
@@ -26,11 +38,40 @@ async def get_session() -> AsyncSession:
         yield session
 
 
-async def get_task_service(
-    session: AsyncSession = Depends(get_session),
-) -> TaskService:
-    """Provide a TaskService instance wired with the current DB session and MQ publisher."""
-    return TaskService(session=session, publisher=publisher)
+async def get_read_session(request: Request) -> AsyncSession:
+    """Return a session for reads: a replica, or the primary shortly after this client wrote."""
+    if database is None:
+        raise RuntimeError("Database dependency not configured.")
+    session_scope = database.session() if _recent_write(request) else database.read_session()
+    async with session_scope as session:
+        yield session
+
+
+def _recent_write(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(READ_YOUR_WRITES_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def mark_recent_write(response: Response) -> None:
+    """Pin the client's reads to the primary for the read-your-writes window."""
+    window = get_settings().read_your_writes_window
+    if window <= 0:
+        return
+    response.set_cookie(
+        READ_YOUR_WRITES_COOKIE,
+        str(time.time() + window),
+        max_age=window,
+        httponly=True,
+        samesite="lax",
+    )
+
+
+def fast_serialization(route: str) -> bool:
+    """Whether ``route`` encodes database rows straight to JSON (``FAST_SERIALIZATION_ROUTES``)."""
+    routes = get_settings().fast_serialization_routes.split(",")
+    return route in (name.strip() for name in routes)
 
 
 async def redis_client_dependency() -> Redis | None:
@@ -41,3 +82,67 @@ async def redis_client_dependency() -> Redis | None:
         return redis_client.client
     except RuntimeError:
         return None
+
+
+async def task_updates_dependency() -> TaskUpdateBroadcaster | None:
+    """Expose the shared task update subscription; None when Redis is not configured."""
+    if redis_client is None:
+        return None
+    try:
+        return redis_client.updates
+    except RuntimeError:
+        return None
+
+
+async def submitting_client(
+    request: Request,
+    x_api_key: Optional[str] = Header(None),
+) -> str:
+    """Identify the caller by its API key, or its address when it sends none."""
+    host = request.client.host if request.client is not None else None
+    return client_key(x_api_key, host)
+
+
+async def admit_submission(client: str = Depends(submitting_client)) -> None:
+    """Refuse task submissions with 429 and ``Retry-After`` while rate limited or overloaded."""
+    if admission is None:
+        return
+    try:
+        await admission.admit(client)
+    except AdmissionRejected as exc:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=exc.reason,
+            headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        )
+
+
+async def get_task_service(
+    session: AsyncSession = Depends(get_session),
+    read_session: AsyncSession = Depends(get_read_session),
+    redis: Redis | None = Depends(redis_client_dependency),
+) -> TaskService:
+    """Provide a TaskService wired with primary and read sessions, MQ publisher and Redis cache."""
+    settings = get_settings()
+    return TaskService(
+        session=session,
+        read_session=read_session,
+        publisher=publisher,
+        redis=redis,
+        idempotency_ttl=settings.idempotency_cache_ttl,
+        state_ttl=settings.task_state_cache_ttl,
+    )
+
+
+async def get_task_exporter() -> TaskExporter:
+    """Provide a TaskExporter that opens its own streaming session per export."""
+    if database is None:
+        raise RuntimeError("Database dependency not configured.")
+    return TaskExporter(database, batch_size=get_settings().export_batch_size)
+
+
+async def get_result_reader() -> TaskResultReader:
+    """Provide a TaskResultReader that opens its own read sessions."""
+    if database is None:
+        raise RuntimeError("Database dependency not configured.")
+    return TaskResultReader(database)
@@ -4,28 +4,71 @@ from __future__ import annotations
 
 from typing import Optional
 
-from redis.asyncio import Redis, from_url
+from redis.asyncio import Redis
+
+from taskflow_core.redis_pool import create_redis_client
+
+from .pubsub import TaskUpdateBroadcaster
 
 
 class RedisClient:
-    """Lazy Redis connection manager."""
+    """Lazy Redis connection manager backed by a bounded, instrumented pool.
+
+    The pool (``max_connections``) serves request-path commands only.
+    WebSocket clients share one Pub/Sub subscription through ``updates``,
+    which holds a single connection on a client of its own.
+    """
 
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        max_connections: int = 100,
+        acquire_timeout: float = 5.0,
+        health_check_interval: int = 30,
+    ):
         self._redis_url = redis_url
+        self._max_connections = max_connections
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
         self._client: Optional[Redis] = None
+        self._pubsub_client: Optional[Redis] = None
+        self._updates: Optional[TaskUpdateBroadcaster] = None
 
     async def connect(self) -> Redis:
         """Lazily allocate and cache a Redis client."""
         if self._client is None:
-            self._client = from_url(
+            self._client = create_redis_client(
+                self._redis_url,
+                max_connections=self._max_connections,
+                acquire_timeout=self._acquire_timeout,
+                health_check_interval=self._health_check_interval,
+            )
+        if self._updates is None:
+            self._pubsub_client = Redis.from_url(
                 self._redis_url,
+                socket_connect_timeout=self._acquire_timeout,
+                health_check_interval=self._health_check_interval,
                 encoding="utf-8",
                 decode_responses=True,
             )
+            self._updates = TaskUpdateBroadcaster(self._pubsub_client)
         return self._client
 
+    def pool_metrics(self) -> dict[str, float]:
+        """Return connection pool gauges and wait counters; empty when disconnected."""
+        if self._client is None:
+            return {}
+        return self._client.connection_pool.metrics()
+
     async def close(self) -> None:
-        """Close the cached Redis connection if present."""
+        """Close the cached Redis connections if present."""
+        if self._updates is not None:
+            await self._updates.close()
+            self._updates = None
+        if self._pubsub_client is not None:
+            await self._pubsub_client.aclose()
+            self._pubsub_client = None
         if self._client is not None:
             await self._client.close()
             self._client = None
@@ -36,3 +79,10 @@ class RedisClient:
         if self._client is None:
             raise RuntimeError("Redis client has not been initialised.")
         return self._client
+
+    @property
+    def updates(self) -> TaskUpdateBroadcaster:
+        """Return the shared task update subscription or raise if not initialised."""
+        if self._updates is None:
+            raise RuntimeError("Redis client has not been initialised.")
+        return self._updates
@@ -2,56 +2,121 @@
 
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
 
 import aio_pika
+from aio_pika.pool import Pool
 
+from taskflow_core.db import PoolStats
+from taskflow_core.routing import task_routing_key
 from taskflow_core.schemas import TaskCreatedMessage
 
 
 class TaskEventPublisher:
-    """Publish task events to RabbitMQ."""
+    """Publish task events to RabbitMQ over a bounded pool of channels.
+
+    Concurrent requests publish on separate channels instead of serialising
+    on one; when all ``channel_pool_size`` channels are busy, callers wait up
+    to ``acquire_timeout`` seconds and the wait is recorded in ``pool_stats``.
+    With ``partitions`` > 1 each message goes to the partition its
+    partition key hashes to, so tasks sharing a key stay in order.
+    """
 
     def __init__(
         self,
         amqp_url: str,
         exchange_name: str = "task.topic",
         routing_key: str = "task.created",
+        *,
+        channel_pool_size: int = 8,
+        acquire_timeout: float = 5.0,
+        heartbeat: int = 60,
+        partitions: int = 1,
     ):
         self._amqp_url = amqp_url
         self._exchange_name = exchange_name
         self._routing_key = routing_key
+        self._channel_pool_size = channel_pool_size
+        self._acquire_timeout = acquire_timeout
+        self._heartbeat = heartbeat
+        self._partitions = max(1, partitions)
         self._connection: Optional[aio_pika.RobustConnection] = None
-        self._channel: Optional[aio_pika.Channel] = None
-        self._exchange: Optional[aio_pika.Exchange] = None
+        self._channels: Optional[Pool[aio_pika.abc.AbstractChannel]] = None
+        self._checked_out = 0
+        self.pool_stats = PoolStats()
 
     async def connect(self) -> None:
-        """Establish a connection and declare the exchange if needed."""
+        """Establish a connection, declare the exchange and prepare the channel pool."""
         if self._connection:
             return
-        self._connection = await aio_pika.connect_robust(self._amqp_url)
-        self._channel = await self._connection.channel()
-        self._exchange = await self._channel.declare_exchange(
-            self._exchange_name,
-            aio_pika.ExchangeType.TOPIC,
-            durable=True,
+        self._connection = await aio_pika.connect_robust(
+            self._amqp_url,
+            heartbeat=self._heartbeat,
         )
+        async with self._connection.channel() as channel:
+            await channel.declare_exchange(
+                self._exchange_name,
+                aio_pika.ExchangeType.TOPIC,
+                durable=True,
+            )
+        self._channels = Pool(self._connection.channel, max_size=self._channel_pool_size)
 
     async def close(self) -> None:
-        """Gracefully close the AMQP connection."""
+        """Gracefully close the pooled channels and the AMQP connection."""
+        if self._channels is not None:
+            await self._channels.close()
         if self._connection:
             await self._connection.close()
         self._connection = None
-        self._channel = None
-        self._exchange = None
+        self._channels = None
 
     async def publish_task_created(self, message: TaskCreatedMessage) -> None:
-        """Send a `task.created` message to the configured exchange."""
-        if self._connection is None or self._channel is None or self._exchange is None:
+        """Send a `task.created` message on the routing key for its priority and partition."""
+        if self._connection is None or self._channels is None:
             await self.connect()
 
         body = message.json().encode("utf-8")
-        await self._exchange.publish(
-            aio_pika.Message(body=body),
-            routing_key=self._routing_key,
+        async with self._channel() as channel:
+            exchange = await channel.get_exchange(self._exchange_name, ensure=False)
+            await exchange.publish(
+                aio_pika.Message(body=body),
+                routing_key=task_routing_key(
+                    self._routing_key,
+                    message.priority,
+                    message.routing_partition_key,
+                    self._partitions,
+                ),
+            )
+
+    def pool_metrics(self) -> dict[str, float]:
+        """Return channel pool gauges and wait counters."""
+        return self.pool_stats.snapshot(
+            size=self._channel_pool_size,
+            checked_out=self._checked_out,
         )
+
+    @asynccontextmanager
+    async def _channel(self) -> AsyncIterator[aio_pika.abc.AbstractChannel]:
+        """Borrow a pooled channel, waiting at most ``acquire_timeout`` seconds."""
+        borrowed = self._channels.acquire()
+        self.pool_stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            async with asyncio.timeout(self._acquire_timeout):
+                channel = await borrowed.__aenter__()
+        except TimeoutError:
+            self.pool_stats.timeouts += 1
+            raise
+        finally:
+            self.pool_stats.waiting -= 1
+            self.pool_stats.record_wait(time.perf_counter() - started)
+
+        self._checked_out += 1
+        try:
+            yield channel
+        finally:
+            self._checked_out -= 1
+            await borrowed.__aexit__(None, None, None)
@@ -2,26 +2,99 @@
 
 from __future__ import annotations
 
-from typing import AsyncIterator
+import asyncio
+import logging
+from typing import AsyncIterator, Optional
 
 from redis.asyncio import Redis
 
 
+logger = logging.getLogger(__name__)
+
 BROADCAST_CHANNEL = "task.status"
+CANCEL_CHANNEL = "task.cancel"
+
+
+class TaskUpdateBroadcaster:
+    """Fan one Redis subscription to ``task.status`` out to every WebSocket client.
+
+    The subscription holds a single connection of ``redis``, which should be a
+    client of its own: WebSocket clients then never take connections from the
+    bounded pool that request-path commands use, however many are open. Each
+    client reads from a queue of ``queue_size`` updates; a client that falls
+    that far behind loses its oldest updates rather than growing memory. The
+    subscription is opened with the first client and re-established after a
+    Redis error.
+    """
 
+    def __init__(
+        self,
+        redis: Redis,
+        *,
+        channel: str = BROADCAST_CHANNEL,
+        queue_size: int = 1000,
+        reconnect_delay: float = 1.0,
+    ):
+        self._redis = redis
+        self._channel = channel
+        self._queue_size = queue_size
+        self._reconnect_delay = reconnect_delay
+        self._subscribers: set[asyncio.Queue] = set()
+        self._runner: Optional[asyncio.Task] = None
 
-async def stream_task_updates(redis: Redis) -> AsyncIterator[str]:
-    """Yield messages for all task status updates from Redis."""
+    @property
+    def subscribers(self) -> int:
+        """Number of clients currently streaming updates."""
+        return len(self._subscribers)
 
-    pubsub = redis.pubsub()
-    await pubsub.subscribe(BROADCAST_CHANNEL)
-    try:
-        async for message in pubsub.listen():
-            if message["type"] != "message":
-                continue
-            data = message.get("data")
-            if data:
+    async def stream(self) -> AsyncIterator[str]:
+        """Yield every update published after the call, until the broadcaster closes."""
+        queue: asyncio.Queue = asyncio.Queue(self._queue_size)
+        self._subscribers.add(queue)
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._run())
+        try:
+            while True:
+                data = await queue.get()
+                if data is None:
+                    return
                 yield data
-    finally:
-        await pubsub.unsubscribe(BROADCAST_CHANNEL)
-        await pubsub.close()
+        finally:
+            self._subscribers.discard(queue)
+
+    async def close(self) -> None:
+        """Drop the Redis subscription and end every open stream."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+        for queue in self._subscribers:
+            self._offer(queue, None)
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self._channel)
+                async for message in pubsub.listen():
+                    if message["type"] != "message":
+                        continue
+                    data = message.get("data")
+                    if data:
+                        for queue in self._subscribers:
+                            self._offer(queue, data)
+            except Exception as exc:
+                logger.warning("Task update subscription lost: %s", exc)
+            finally:
+                await pubsub.aclose()
+            await asyncio.sleep(self._reconnect_delay)
+
+    @staticmethod
+    def _offer(queue: asyncio.Queue, data: Optional[str]) -> None:
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(data)
+
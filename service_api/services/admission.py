@@ -0,0 +1,238 @@
+"""Admission control for task submission: per-client rate limits and load shedding."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional
+
+from redis.asyncio import Redis
+
+from taskflow_core.db import PoolStats
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_KEY_PREFIX = "task:ratelimit:"
+
+# Refill and take from a bucket stored as a hash, timed by the Redis clock so
+# every API process agrees on it. Returns the tokens left and, when the
+# request was refused, the seconds until enough tokens are back.
+_TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local retry_after = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  retry_after = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return {tostring(tokens), tostring(retry_after)}
+"""
+
+
+class AdmissionRejected(Exception):
+    """Raised when a submission must be refused; carries the suggested retry delay."""
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """In-process token bucket refilled at ``rate`` tokens per second up to ``burst``."""
+
+    def __init__(self, rate: float, burst: float, *, clock: Callable[[], float] = time.monotonic):
+        self._rate = rate
+        self._burst = burst
+        self._clock = clock
+        self._tokens = burst
+        self._updated = clock()
+
+    def take(self, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens; return 0 when granted, else seconds until they are available."""
+        self._refill()
+        if self._tokens >= cost:
+            self._tokens -= cost
+            return 0.0
+        return (cost - self._tokens) / self._rate
+
+    def sync(self, tokens: float) -> None:
+        """Adopt the token count reported by the shared bucket."""
+        self._refill()
+        self._tokens = min(self._burst, max(0.0, tokens))
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """Per-client token buckets shared by every API process through Redis.
+
+    Each process keeps a local copy of the buckets it has seen, synced to
+    the Redis value after every round trip. The shared bucket only drains
+    faster than the local one, so a local refusal is final and a flooding
+    client is turned away without touching Redis; only requests the local
+    copy would grant pay for the atomic script. Without Redis the local
+    buckets alone enforce the limit per process.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        *,
+        rate: float,
+        burst: float,
+        max_clients: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._redis = redis
+        self._rate = rate
+        self._burst = max(1.0, burst)
+        self._max_clients = max_clients
+        self._clock = clock
+        self._buckets: OrderedDict[str, TokenBucket] = OrderedDict()
+        self._script = redis.register_script(_TOKEN_BUCKET_SCRIPT) if redis is not None else None
+
+    async def acquire(self, client: str, cost: float = 1.0) -> float:
+        """Take ``cost`` tokens for ``client``; return 0 when granted, else the retry delay."""
+        bucket = self._bucket(client)
+        retry_after = bucket.take(cost)
+        if retry_after or self._script is None:
+            return retry_after
+        try:
+            tokens, retry_after = await self._script(
+                keys=[f"{RATE_LIMIT_KEY_PREFIX}{client}"],
+                args=[self._rate, self._burst, cost],
+            )
+        except Exception as exc:
+            logger.warning("Shared rate limit unavailable, using the local bucket: %s", exc)
+            return 0.0
+        bucket.sync(float(tokens))
+        return float(retry_after)
+
+    def _bucket(self, client: str) -> TokenBucket:
+        bucket = self._buckets.get(client)
+        if bucket is None:
+            bucket = self._buckets[client] = TokenBucket(self._rate, self._burst, clock=self._clock)
+            while len(self._buckets) > self._max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(client)
+        return bucket
+
+
+class LoadShedder:
+    """Refuse submissions while the backlog or the DB pool says the system is saturated.
+
+    The PENDING backlog and the average DB pool checkout wait are sampled at
+    most every ``interval`` seconds, so the check costs nothing on most
+    requests. A threshold of 0 disables that signal.
+    """
+
+    def __init__(
+        self,
+        *,
+        backlog: Optional[Callable[[], Awaitable[int]]] = None,
+        pool_stats: Optional[Callable[[], Optional[PoolStats]]] = None,
+        max_backlog: int = 0,
+        max_pool_wait: float = 0.0,
+        retry_after: float = 5.0,
+        interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._backlog = backlog
+        self._pool_stats = pool_stats
+        self._max_backlog = max_backlog
+        self._max_pool_wait = max_pool_wait
+        self._retry_after = retry_after
+        self._interval = interval
+        self._clock = clock
+        self._checked_at: Optional[float] = None
+        self._reason: Optional[str] = None
+        self._pool_checkouts = 0
+        self._pool_wait_total = 0.0
+
+    async def check(self) -> Optional[AdmissionRejected]:
+        """Return the rejection to raise while overloaded, None otherwise."""
+        now = self._clock()
+        if self._checked_at is None or now - self._checked_at >= self._interval:
+            # Claim the sample first so concurrent requests reuse the last verdict.
+            self._checked_at = now
+            self._reason = await self._evaluate()
+        if self._reason is None:
+            return None
+        return AdmissionRejected(self._reason, self._retry_after)
+
+    async def _evaluate(self) -> Optional[str]:
+        pool_wait = self._pool_wait_since_last()
+        if self._max_pool_wait and pool_wait > self._max_pool_wait:
+            return f"Database saturated (avg pool wait {pool_wait:.3f}s)"
+        if self._max_backlog and self._backlog is not None:
+            try:
+                backlog = await self._backlog()
+            except Exception as exc:
+                logger.warning("Could not read the task backlog: %s", exc)
+                return None
+            if backlog > self._max_backlog:
+                return f"Task backlog too large ({backlog} pending)"
+        return None
+
+    def _pool_wait_since_last(self) -> float:
+        """Average DB pool checkout wait since the previous sample."""
+        stats = self._pool_stats() if self._pool_stats is not None else None
+        if stats is None:
+            return 0.0
+        checkouts = stats.checkouts - self._pool_checkouts
+        wait_total = stats.wait_seconds_total - self._pool_wait_total
+        self._pool_checkouts = stats.checkouts
+        self._pool_wait_total = stats.wait_seconds_total
+        return wait_total / checkouts if checkouts > 0 else 0.0
+
+
+class AdmissionControl:
+    """Decide whether a task submission from ``client`` may proceed.
+
+    Load shedding is checked first so refused requests do not spend their
+    client's tokens.
+    """
+
+    def __init__(
+        self,
+        *,
+        limiter: Optional[RateLimiter] = None,
+        shedder: Optional[LoadShedder] = None,
+    ):
+        self._limiter = limiter
+        self._shedder = shedder
+
+    async def admit(self, client: str) -> None:
+        """Raise :class:`AdmissionRejected` when the submission must wait."""
+        if self._shedder is not None:
+            rejection = await self._shedder.check()
+            if rejection is not None:
+                raise rejection
+        if self._limiter is not None:
+            retry_after = await self._limiter.acquire(client)
+            if retry_after:
+                raise AdmissionRejected("Rate limit exceeded", retry_after)
+
+
+def client_key(api_key: Optional[str], host: Optional[str]) -> str:
+    """Identify a client by a digest of its API key, falling back to its address."""
+    if api_key:
+        return "key:" + hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:32]
+    return f"ip:{host or 'unknown'}"
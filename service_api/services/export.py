@@ -0,0 +1,120 @@
+"""Streaming NDJSON export of task rows."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from datetime import datetime
+from enum import Enum
+from typing import Any, AsyncIterable, AsyncIterator, Optional, Sequence
+
+from sqlalchemy import select
+
+from taskflow_core import Database, Task, TaskArchive, TaskPriority, TaskStatus
+
+
+EXPORT_COLUMNS = (
+    "id",
+    "title",
+    "payload",
+    "status",
+    "priority",
+    "created_at",
+    "updated_at",
+    "finished_at",
+    "run_at",
+    "task_type",
+)
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def task_columns(model: type[Task] | type[TaskArchive]) -> list[Any]:
+    """Return the ``EXPORT_COLUMNS`` of ``model`` for a Core ``select``."""
+    return [getattr(model, name) for name in EXPORT_COLUMNS]
+
+
+def task_record(row: Any) -> dict[str, Any]:
+    """Map a row of ``EXPORT_COLUMNS`` onto the JSON form of ``TaskRead`` without validating it.
+
+    Rows come straight from the database, so the types are already right;
+    only enums and datetimes need converting to their JSON values.
+    """
+    record = {"task_id": row.id}
+    for name in EXPORT_COLUMNS[1:]:
+        record[name] = _plain(getattr(row, name))
+    return record
+
+
+def to_ndjson_line(row: Any) -> str:
+    """Serialise one exported row using the ``TaskRead`` field names."""
+    return json.dumps(task_record(row), separators=(",", ":")) + "\n"
+
+
+async def encode_ndjson(
+    batches: AsyncIterable[Sequence[Any]],
+    *,
+    gzip: bool = False,
+) -> AsyncIterator[bytes]:
+    """Encode row batches as NDJSON chunks, optionally as one streaming gzip member."""
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16) if gzip else None
+    async for batch in batches:
+        chunk = "".join(to_ndjson_line(row) for row in batch).encode("utf-8")
+        if compressor is not None:
+            chunk = compressor.compress(chunk)
+        if chunk:
+            yield chunk
+    if compressor is not None:
+        yield compressor.flush()
+
+
+class TaskExporter:
+    """Stream tasks from a server-side cursor on a read replica so memory stays flat.
+
+    The exporter opens its own session inside the response generator: the
+    request-scoped session would otherwise be tied to the dependency
+    lifecycle rather than to the lifetime of the streamed body.
+    """
+
+    def __init__(self, database: Database, *, batch_size: int = 1000):
+        self._database = database
+        self._batch_size = batch_size
+
+    async def batches(
+        self,
+        *,
+        status: Optional[TaskStatus] = None,
+        priority: Optional[TaskPriority] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        include_archived: bool = False,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Yield rows in ``batch_size`` partitions, live tasks first, then the archive."""
+        models = (Task, TaskArchive) if include_archived else (Task,)
+        async with self._database.read_session() as session:
+            for model in models:
+                query = select(*task_columns(model))
+                if status is not None:
+                    query = query.where(model.status == status)
+                if priority is not None:
+                    query = query.where(model.priority == priority)
+                if created_from is not None:
+                    query = query.where(model.created_at >= created_from)
+                if created_to is not None:
+                    query = query.where(model.created_at < created_to)
+
+                result = await session.stream(
+                    query.execution_options(yield_per=self._batch_size)
+                )
+                async for partition in result.partitions():
+                    yield partition
+
+    def export(self, *, gzip: bool = False, **filters: Any) -> AsyncIterator[bytes]:
+        """Return the encoded NDJSON body for the filtered tasks."""
+        return encode_ndjson(self.batches(**filters), gzip=gzip)
@@ -0,0 +1,49 @@
+"""Retrieval of stored task results."""
+
+from __future__ import annotations
+
+from typing import AsyncIterator, Optional
+
+from sqlalchemy import select
+
+from taskflow_core import Database, TaskResult, TaskResultChunk
+from taskflow_core.results import chunk_span
+
+
+class TaskResultReader:
+    """Load result metadata and stream result bytes, optionally a byte range.
+
+    Like :class:`TaskExporter`, streaming opens its own read session inside
+    the response generator and only fetches the chunks overlapping the
+    requested range, one row at a time.
+    """
+
+    def __init__(self, database: Database):
+        self._database = database
+
+    async def get(self, task_id: str) -> Optional[TaskResult]:
+        """Return the result header (with inline data, if any); None when there is no result."""
+        async with self._database.read_session() as session:
+            return await session.get(TaskResult, task_id)
+
+    async def stream(self, result: TaskResult, start: int, end: int) -> AsyncIterator[bytes]:
+        """Yield bytes ``start``..``end`` inclusive of ``result``."""
+        span = chunk_span(result, start, end)
+        if span is None:
+            yield (result.data or b"")[start : end + 1]
+            return
+
+        first, last = span
+        async with self._database.read_session() as session:
+            rows = await session.stream(
+                select(TaskResultChunk.seq, TaskResultChunk.data)
+                .where(
+                    TaskResultChunk.task_id == result.task_id,
+                    TaskResultChunk.seq.between(first, last),
+                )
+                .order_by(TaskResultChunk.seq)
+                .execution_options(yield_per=1)
+            )
+            async for seq, data in rows:
+                offset = seq * result.chunk_size
+                yield data[max(0, start - offset) : end + 1 - offset]
@@ -2,60 +2,205 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
-from datetime import datetime, timezone
-from typing import Optional
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Sequence
 from uuid import uuid4
 
-from sqlalchemy import select
+from pydantic import BaseModel
+from redis.asyncio import Redis
+from sqlalchemy import Row, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from taskflow_core import Task, TaskCreate, TaskRead, TaskStatus, TaskCreatedMessage
+from taskflow_core import (
+    TERMINAL_STATUSES,
+    Task,
+    TaskArchive,
+    TaskCreate,
+    TaskCreatedMessage,
+    TaskDependency,
+    TaskLookupResponse,
+    TaskRead,
+    TaskStats,
+    TaskStatus,
+    TaskStatusMessage,
+)
+from taskflow_core.dependencies import resolve_dependents
+from taskflow_core.state import TaskStateCache
+from taskflow_core.stats import TaskStatsRecorder
 
 from ..infra.mq import TaskEventPublisher
+from .export import task_columns
+from ..infra.pubsub import BROADCAST_CHANNEL, CANCEL_CHANNEL
 
 logger = logging.getLogger(__name__)
 
+IDEMPOTENCY_KEY_PREFIX = "task:idempotency:"
 
-def _to_schema(task: Task) -> TaskRead:
+
+class TaskDependencyError(ValueError):
+    """Raised when ``depends_on`` names unknown tasks or tasks that can never succeed."""
+
+
+class IdempotencyKeyReused(ValueError):
+    """Raised when an idempotency key is replayed with a different request body."""
+
+
+class _Replay(BaseModel):
+    """What a used idempotency key resolves to: the original task and its body's hash."""
+
+    payload_hash: Optional[str]
+    task: TaskRead
+
+
+def payload_hash(payload: TaskCreate) -> str:
+    """Digest of the request body, insensitive to key order, to detect reused keys."""
+    return hashlib.sha256(payload.json(sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _to_schema(task: Task | TaskArchive) -> TaskRead:
     return TaskRead(
         task_id=task.id,
         title=task.title,
         payload=task.payload,
         status=task.status,
+        priority=task.priority,
         created_at=task.created_at,
         updated_at=task.updated_at,
         finished_at=task.finished_at,
+        run_at=task.run_at,
+        task_type=task.task_type,
     )
 
 
+def _idempotency_cache_key(client: str, idempotency_key: str) -> str:
+    return f"{IDEMPOTENCY_KEY_PREFIX}{client}:{idempotency_key}"
+
+
+def _replayed(replay: _Replay, body_hash: Optional[str]) -> TaskRead:
+    """Return the original task, unless the key is being reused for a different body."""
+    # Keys stored before bodies were hashed have no hash to compare against.
+    if replay.payload_hash is not None and replay.payload_hash != body_hash:
+        raise IdempotencyKeyReused("Idempotency-Key was already used with a different request body")
+    return replay.task
+
+
+def _due_time(payload: TaskCreate, now: datetime) -> Optional[datetime]:
+    """Return when the task should run, with jitter applied; None to run immediately."""
+    if payload.run_at is None and not payload.jitter_seconds:
+        return None
+    run_at = max(payload.run_at or now, now)
+    return run_at + timedelta(seconds=random.uniform(0, payload.jitter_seconds))
+
+
 class TaskService:
-    """Coordinate database persistence and outbound events for tasks."""
+    """Coordinate database persistence and outbound events for tasks.
+
+    Writes and idempotency checks use ``session`` (the primary); reads that
+    tolerate replica lag use ``read_session`` when one is provided.
+    """
 
     def __init__(
         self,
         session: AsyncSession,
         publisher: TaskEventPublisher | None,
+        redis: Redis | None = None,
+        *,
+        read_session: AsyncSession | None = None,
+        idempotency_ttl: int = 600,
+        state_ttl: int = 60,
     ):
         self._session = session
+        self._read_session = read_session or session
         self._publisher = publisher
+        self._redis = redis
+        self._idempotency_ttl = idempotency_ttl
+        self._stats = TaskStatsRecorder(redis) if redis is not None else None
+        self._state = TaskStateCache(redis, ttl=state_ttl) if redis is not None else None
 
-    async def create_task(self, payload: TaskCreate) -> TaskRead:
-        """Persist a new task and publish a creation event."""
+    async def create_task(
+        self,
+        payload: TaskCreate,
+        idempotency_key: Optional[str] = None,
+        *,
+        client: str = "",
+    ) -> TaskRead:
+        """Persist a new task and publish a creation event.
+
+        Idempotency keys are scoped to ``client``. When a key is supplied and
+        that client already used it, the original task is returned without
+        inserting or publishing again, provided the body is the same; a
+        different body raises :class:`IdempotencyKeyReused`. Tasks due in
+        the future are stored as SCHEDULED and published by the worker's
+        scheduler instead; tasks with unfinished dependencies are stored as
+        WAITING and released by the worker when the last one is DONE.
+        """
+        body_hash = payload_hash(payload) if idempotency_key else None
+        if idempotency_key:
+            existing = await self._find_by_idempotency_key(client, idempotency_key)
+            if existing is not None:
+                return _replayed(existing, body_hash)
+
+        now = datetime.now(timezone.utc)
+        run_at = _due_time(payload, now)
+        depends_on = list(dict.fromkeys(payload.depends_on))
+        pending_dependencies = await self._lock_dependencies(depends_on) if depends_on else 0
+        if pending_dependencies:
+            status = TaskStatus.WAITING
+        elif run_at is not None and run_at > now:
+            status = TaskStatus.SCHEDULED
+        else:
+            status = TaskStatus.PENDING
         task = Task(
             id=str(uuid4()),
             title=payload.title,
             payload=payload.payload,
-            status=TaskStatus.PENDING,
+            status=status,
+            priority=payload.priority,
+            run_at=run_at,
+            idempotency_key=idempotency_key,
+            client_key=client if idempotency_key else None,
+            payload_hash=body_hash,
+            partition_key=payload.partition_key,
+            task_type=payload.task_type,
+            pending_dependencies=pending_dependencies,
         )
         self._session.add(task)
-        await self._session.commit()
+        self._session.add_all(
+            TaskDependency(task_id=task.id, depends_on_id=dependency) for dependency in depends_on
+        )
+        try:
+            await self._session.commit()
+        except IntegrityError:
+            await self._session.rollback()
+            if not idempotency_key:
+                raise
+            # A concurrent request with the same key won the insert.
+            existing = await self._find_by_idempotency_key(client, idempotency_key)
+            if existing is None:
+                raise
+            return _replayed(existing, body_hash)
         await self._session.refresh(task)
+        created = _to_schema(task)
+        if idempotency_key:
+            await self._remember_idempotency_key(
+                client, idempotency_key, _Replay(payload_hash=body_hash, task=created)
+            )
+        await self._record_created(task.status)
+        await self._cache_state(created)
+        if task.status != TaskStatus.PENDING:
+            return created
 
         message = TaskCreatedMessage(
             task_id=task.id,
             payload=payload.payload,
+            priority=task.priority,
             requested_at=datetime.now(timezone.utc),
+            partition_key=task.partition_key,
+            task_type=task.task_type,
         )
         if self._publisher is not None:
             try:
@@ -63,19 +208,295 @@ class TaskService:
             except Exception as exc:
                 logger.exception("Failed to publish task.created event", exc_info=exc)
 
-        return _to_schema(task)
+        return created
 
     async def list_tasks(self) -> list[TaskRead]:
-        """Return all tasks ordered by creation time (most recent first)."""
-        result = await self._session.execute(select(Task).order_by(Task.created_at.desc()))
+        """Return all live (non-archived) tasks ordered by creation time, most recent first."""
+        result = await self._read_session.execute(select(Task).order_by(Task.created_at.desc()))
         tasks = result.scalars().all()
         return [_to_schema(task) for task in tasks]
 
     async def get_task(self, task_id: str) -> Optional[TaskRead]:
-        """Retrieve a task by id, returning None when missing."""
+        """Retrieve a task by id, falling back to the archive; None when missing."""
         query = select(Task).where(Task.id == task_id)
-        result = await self._session.execute(query)
+        result = await self._read_session.execute(query)
         task = result.scalar_one_or_none()
+        if task is None:
+            archived = await self._read_session.execute(
+                select(TaskArchive).where(TaskArchive.id == task_id)
+            )
+            task = archived.scalar_one_or_none()
         if task is None:
             return None
         return _to_schema(task)
+
+    async def list_task_rows(self) -> Sequence[Row]:
+        """Like :meth:`list_tasks`, but as plain column rows for direct JSON encoding.
+
+        A Core ``select`` of columns skips ORM identity-map bookkeeping, and
+        the rows are never turned into ``TaskRead``.
+        """
+        result = await self._read_session.execute(
+            select(*task_columns(Task)).order_by(Task.created_at.desc())
+        )
+        return result.all()
+
+    async def get_task_row(self, task_id: str) -> Optional[Row]:
+        """Like :meth:`get_task`, but as a plain column row; None when missing."""
+        for model in (Task, TaskArchive):
+            result = await self._read_session.execute(
+                select(*task_columns(model)).where(model.id == task_id)
+            )
+            row = result.one_or_none()
+            if row is not None:
+                return row
+        return None
+
+    async def get_task_version(self, task_id: str) -> Optional[datetime]:
+        """Return only ``updated_at`` for a task (live or archived); None when missing."""
+        for model in (Task, TaskArchive):
+            result = await self._read_session.execute(
+                select(model.updated_at).where(model.id == task_id)
+            )
+            version = result.scalar_one_or_none()
+            if version is not None:
+                return version
+        return None
+
+    async def get_list_version(self) -> tuple[int, Optional[datetime]]:
+        """Return the live task count and newest ``updated_at`` as the collection version.
+
+        Runs on every ``GET /tasks``, 304s included. ``max(updated_at)`` is a
+        single probe of ``idx_tasks_updated_at``, but ``count(*)`` walks an
+        index of every live row, so its cost grows with the ``tasks`` table;
+        archival keeps that table to the retention window, and the count is
+        still far cheaper than the full list it guards.
+        """
+        result = await self._read_session.execute(select(func.count(), func.max(Task.updated_at)))
+        count, latest = result.one()
+        return count, latest
+
+    async def lookup_tasks(
+        self,
+        task_ids: Sequence[str],
+        fields: Optional[Sequence[str]] = None,
+    ) -> TaskLookupResponse:
+        """Resolve many tasks at once: cached state first, then one IN query per table.
+
+        ``fields`` projects each result onto a subset of ``TaskRead`` fields;
+        ``task_id`` is always included so results can be matched to requests.
+        """
+        task_ids = list(dict.fromkeys(task_ids))
+        projection = None if fields is None else ["task_id", *(f for f in fields if f != "task_id")]
+
+        found: dict[str, dict[str, Any]] = {}
+        for task_id, task in (await self._cached_states(task_ids)).items():
+            found[task_id] = task.dict(include=set(projection) if projection else None)
+
+        for model in (Task, TaskArchive):
+            remaining = [task_id for task_id in task_ids if task_id not in found]
+            if not remaining:
+                break
+            columns = [
+                getattr(model, "id" if name == "task_id" else name)
+                for name in (projection or TaskRead.__fields__)
+            ]
+            result = await self._read_session.execute(
+                select(*columns).where(model.id.in_(remaining))
+            )
+            for row in result.all():
+                record = dict(zip(projection or TaskRead.__fields__, row))
+                found[record["task_id"]] = record
+
+        return TaskLookupResponse(
+            tasks=[found[task_id] for task_id in task_ids if task_id in found],
+            missing=[task_id for task_id in task_ids if task_id not in found],
+        )
+
+    async def cancel_task(self, task_id: str) -> Optional[TaskRead]:
+        """Mark a task CANCELLED and tell the workers to drop or abort it.
+
+        Returns None when the task does not exist. A task that already
+        finished is returned unchanged, so callers can tell a successful
+        cancellation from a conflict by its status.
+        """
+        result = await self._session.execute(
+            select(Task).where(Task.id == task_id).with_for_update()
+        )
+        task = result.scalar_one_or_none()
+        if task is None:
+            await self._session.rollback()
+            return await self.get_task(task_id)
+        if task.status in TERMINAL_STATUSES:
+            await self._session.rollback()
+            return _to_schema(task)
+
+        previous = task.status
+        now = datetime.now(timezone.utc)
+        task.status = TaskStatus.CANCELLED
+        task.updated_at = now
+        task.finished_at = now
+        dependents = await resolve_dependents(self._session, task.id, TaskStatus.CANCELLED, now)
+        await self._session.commit()
+        cancelled = _to_schema(task)
+
+        await self._record_transition(previous, TaskStatus.CANCELLED, now)
+        await self._cache_state(cancelled)
+        await self._broadcast_cancellation(cancelled)
+        for dependent, waited in dependents:
+            await self._record_transition(waited, dependent.status, now)
+            await self._cache_state(_to_schema(dependent))
+            await self._broadcast_status(_to_schema(dependent), "Dependency cancelled")
+        return cancelled
+
+    async def get_stats(self, minutes: int = 15) -> Optional[TaskStats]:
+        """Return the Redis-maintained task statistics; None when Redis is unavailable."""
+        if self._stats is None:
+            return None
+        try:
+            return await self._stats.snapshot(minutes=minutes)
+        except Exception as exc:
+            logger.warning("Task statistics lookup failed: %s", exc)
+            return None
+
+    async def _record_created(self, status: TaskStatus) -> None:
+        """Bump the created counters; drift is corrected by the worker's reconciliation."""
+        if self._stats is None:
+            return
+        try:
+            await self._stats.record_created(status=status)
+        except Exception as exc:
+            logger.warning("Task statistics update failed: %s", exc)
+
+    async def _record_transition(
+        self,
+        previous: TaskStatus,
+        status: TaskStatus,
+        now: datetime,
+    ) -> None:
+        if self._stats is None:
+            return
+        try:
+            await self._stats.record_transition(previous, status, at=now)
+        except Exception as exc:
+            logger.warning("Task statistics update failed: %s", exc)
+
+    async def _broadcast_cancellation(self, task: TaskRead) -> None:
+        """Notify workers (to skip or abort the task) and WebSocket subscribers."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.publish(CANCEL_CHANNEL, task.task_id)
+        except Exception as exc:
+            logger.warning("Failed to broadcast cancellation of task %s: %s", task.task_id, exc)
+        await self._broadcast_status(task, "Cancelled by request")
+
+    async def _broadcast_status(self, task: TaskRead, reason: str) -> None:
+        if self._redis is None:
+            return
+        message = TaskStatusMessage(
+            task_id=task.task_id,
+            status=task.status,
+            progress=1.0,
+            updated_at=task.updated_at,
+            message=reason,
+        )
+        try:
+            await self._redis.publish(BROADCAST_CHANNEL, message.json(exclude_none=True))
+        except Exception as exc:
+            logger.warning("Failed to broadcast status of task %s: %s", task.task_id, exc)
+
+    async def _lock_dependencies(self, depends_on: list[str]) -> int:
+        """Lock live dependencies and return how many are not DONE yet.
+
+        The row locks keep a dependency from finishing between this count and
+        the commit that inserts the edges, which would leave the new task
+        waiting forever. Archived dependencies are already final.
+        """
+        result = await self._session.execute(
+            select(Task.id, Task.status)
+            .where(Task.id.in_(depends_on))
+            .order_by(Task.id)
+            .with_for_update()
+        )
+        statuses = dict(result.all())
+        missing = [task_id for task_id in depends_on if task_id not in statuses]
+        if missing:
+            archived = await self._session.execute(
+                select(TaskArchive.id, TaskArchive.status).where(TaskArchive.id.in_(missing))
+            )
+            statuses.update(archived.all())
+
+        unknown = [task_id for task_id in depends_on if task_id not in statuses]
+        if unknown:
+            await self._session.rollback()
+            raise TaskDependencyError(f"Unknown dependencies: {', '.join(unknown)}")
+        doomed = [
+            task_id
+            for task_id, status in statuses.items()
+            if status in TERMINAL_STATUSES and status != TaskStatus.DONE
+        ]
+        if doomed:
+            await self._session.rollback()
+            raise TaskDependencyError(f"Dependencies can no longer succeed: {', '.join(doomed)}")
+        return sum(1 for status in statuses.values() if status != TaskStatus.DONE)
+
+    async def _cached_states(self, task_ids: list[str]) -> dict[str, TaskRead]:
+        if self._state is None:
+            return {}
+        try:
+            return await self._state.fetch_many(task_ids)
+        except Exception as exc:
+            logger.warning("Task state cache lookup failed: %s", exc)
+            return {}
+
+    async def _cache_state(self, task: TaskRead) -> None:
+        if self._state is None:
+            return
+        try:
+            await self._state.store(task)
+        except Exception as exc:
+            logger.warning("Task state cache write failed: %s", exc)
+
+    async def _find_by_idempotency_key(
+        self, client: str, idempotency_key: str
+    ) -> Optional[_Replay]:
+        """Resolve a key ``client`` already used via Redis, then the unique indexes.
+
+        Archived tasks keep their key, so a retry arriving after archival
+        still gets the original task instead of creating a duplicate.
+        """
+        if self._redis is not None:
+            try:
+                cached = await self._redis.get(_idempotency_cache_key(client, idempotency_key))
+            except Exception as exc:
+                logger.warning("Idempotency cache lookup failed: %s", exc)
+                cached = None
+            if cached:
+                return _Replay.parse_raw(cached)
+
+        for model in (Task, TaskArchive):
+            result = await self._session.execute(
+                select(model).where(
+                    model.client_key == client, model.idempotency_key == idempotency_key
+                )
+            )
+            task = result.scalar_one_or_none()
+            if task is not None:
+                return _Replay(payload_hash=task.payload_hash, task=_to_schema(task))
+        return None
+
+    async def _remember_idempotency_key(
+        self, client: str, idempotency_key: str, replay: _Replay
+    ) -> None:
+        """Cache the original response so retries skip the database entirely."""
+        if self._redis is None:
+            return
+        try:
+            await self._redis.set(
+                _idempotency_cache_key(client, idempotency_key),
+                replay.json(),
+                ex=self._idempotency_ttl,
+            )
+        except Exception as exc:
+            logger.warning("Idempotency cache write failed: %s", exc)
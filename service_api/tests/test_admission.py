@@ -0,0 +1,104 @@
+"""Unit tests for task submission rate limiting and load shedding."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from taskflow_core.db import PoolStats
+
+from service_api import dependencies
+from service_api.app import create_app
+from service_api.dependencies import get_task_service
+from service_api.services.admission import AdmissionControl, LoadShedder, RateLimiter
+from service_api.tests.test_tasks_api import InMemoryTaskService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_allows_bursts_then_refills_per_client():
+    """Each client gets ``burst`` requests at once and ``rate`` per second afterwards."""
+    clock = FakeClock()
+    limiter = RateLimiter(None, rate=2.0, burst=3, clock=clock)
+
+    assert [await limiter.acquire("a") for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert await limiter.acquire("a") == pytest.approx(0.5)
+    assert await limiter.acquire("b") == 0.0
+
+    clock.now = 0.5
+    assert await limiter.acquire("a") == 0.0
+    assert await limiter.acquire("a") == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_load_shedder_samples_backlog_and_pool_wait():
+    """Shedding follows the sampled signals and only re-reads them once per interval."""
+    clock = FakeClock()
+    backlog = {"pending": 10, "reads": 0}
+    stats = PoolStats()
+
+    async def read_backlog() -> int:
+        backlog["reads"] += 1
+        return backlog["pending"]
+
+    shedder = LoadShedder(
+        backlog=read_backlog,
+        pool_stats=lambda: stats,
+        max_backlog=100,
+        max_pool_wait=0.2,
+        retry_after=7.0,
+        interval=1.0,
+        clock=clock,
+    )
+    assert await shedder.check() is None
+
+    backlog["pending"] = 500
+    assert await shedder.check() is None
+    assert backlog["reads"] == 1
+
+    clock.now = 1.0
+    rejection = await shedder.check()
+    assert rejection is not None and rejection.retry_after == 7.0
+
+    backlog["pending"] = 0
+    stats.record_wait(0.5)
+    clock.now = 2.0
+    rejection = await shedder.check()
+    assert rejection is not None and "pool wait" in rejection.reason
+
+    clock.now = 3.0
+    assert await shedder.check() is None
+
+
+def test_create_task_returns_429_with_retry_after(monkeypatch):
+    """Submissions over the client's budget are refused with a Retry-After hint."""
+    app = create_app(with_infra=False)
+    service = InMemoryTaskService()
+
+    async def override_service() -> InMemoryTaskService:
+        return service
+
+    app.dependency_overrides[get_task_service] = override_service
+    monkeypatch.setattr(
+        dependencies,
+        "admission",
+        AdmissionControl(limiter=RateLimiter(None, rate=0.1, burst=1)),
+    )
+
+    with TestClient(app) as client:
+        first = client.post("/tasks", json={"title": "one"}, headers={"X-API-Key": "k1"})
+        second = client.post("/tasks", json={"title": "two"}, headers={"X-API-Key": "k1"})
+        other = client.post("/tasks", json={"title": "three"}, headers={"X-API-Key": "k2"})
+
+    assert first.status_code == 201
+    assert second.status_code == 429
+    assert second.headers["Retry-After"] == "10"
+    assert other.status_code == 201
+    assert len(service._tasks) == 2
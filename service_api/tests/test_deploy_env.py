@@ -0,0 +1,24 @@
+"""Guard that each service's env files define every variable once."""
+
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+DEPLOY = Path(__file__).resolve().parents[2] / "deploy"
+
+
+def _keys(name: str) -> list[str]:
+    lines = (DEPLOY / name).read_text().splitlines()
+    return [line.split("=", 1)[0] for line in lines if line and not line.startswith("#")]
+
+
+@pytest.mark.parametrize("service_file", ["api.env.example", "worker.env.example"])
+def test_service_env_files_do_not_redefine_variables(service_file):
+    """Compose merges the shared and service files; a repeated key silently overrides."""
+    counts = Counter(_keys("env.example") + _keys(service_file))
+
+    assert [key for key, count in counts.items() if count > 1] == []
+    assert counts["TASK_PARTITIONS"] == 1 and "TASK_PARTITIONS" in _keys("env.example")
@@ -0,0 +1,64 @@
+"""Unit tests for the shared task update subscription."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from service_api.infra.pubsub import BROADCAST_CHANNEL, TaskUpdateBroadcaster
+
+
+async def _next(stream) -> str:
+    return await asyncio.wait_for(stream.__anext__(), 2)
+
+
+async def _wait_subscribed(redis) -> None:
+    for _ in range(100):
+        [(_, subscribed)] = await redis.pubsub_numsub(BROADCAST_CHANNEL)
+        if subscribed:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("broadcaster never subscribed")
+
+
+@pytest.mark.asyncio
+async def test_clients_share_one_subscription_on_a_single_connection():
+    """However many clients stream, Redis sees one subscriber using one connection."""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    broadcaster = TaskUpdateBroadcaster(
+        fakeredis.FakeAsyncRedis(server=server, decode_responses=True, max_connections=1)
+    )
+    redis = fakeredis.FakeAsyncRedis(server=server, decode_responses=True)
+    streams = [broadcaster.stream() for _ in range(150)]
+    pending = [asyncio.ensure_future(_next(stream)) for stream in streams]
+    await _wait_subscribed(redis)
+
+    assert broadcaster.subscribers == 150
+    assert await redis.pubsub_numsub(BROADCAST_CHANNEL) == [(BROADCAST_CHANNEL, 1)]
+    await redis.publish(BROADCAST_CHANNEL, "update")
+    assert await asyncio.gather(*pending) == ["update"] * 150
+
+    await broadcaster.close()
+    for stream in streams:
+        with pytest.raises(StopAsyncIteration):
+            await _next(stream)
+    assert broadcaster.subscribers == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_clients_lose_their_oldest_updates():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    broadcaster = TaskUpdateBroadcaster(redis, queue_size=2)
+    stream = broadcaster.stream()
+    first = asyncio.ensure_future(_next(stream))
+    await _wait_subscribed(redis)
+
+    for index in range(4):
+        await redis.publish(BROADCAST_CHANNEL, f"update-{index}")
+    assert await first == "update-0"
+    await asyncio.sleep(0.05)
+    assert [await _next(stream), await _next(stream)] == ["update-2", "update-3"]
+    await broadcaster.close()
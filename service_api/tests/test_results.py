@@ -0,0 +1,87 @@
+"""Unit tests for task result storage layout and ranged retrieval."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from taskflow_core import TaskResult, TaskResultChunk
+from taskflow_core.results import ResultTooLarge, chunk_span, encode_result, result_rows
+
+from service_api.api.ranges import RangeNotSatisfiable, parse_byte_range
+from service_api.app import create_app
+from service_api.dependencies import get_result_reader
+from service_api.services.results import TaskResultReader
+
+
+class InMemoryResultReader(TaskResultReader):
+    """Reader serving inline results from a dict instead of the database."""
+
+    def __init__(self, results):
+        super().__init__(database=None)
+        self._results = results
+
+    async def get(self, task_id):
+        return self._results.get(task_id)
+
+
+def test_results_are_inlined_or_chunked_by_size():
+    """Small results stay inline; large ones are split and located by chunk number."""
+    data, content_type = encode_result({"rows": [1, 2]})
+    assert (data, content_type) == (b'{"rows":[1,2]}', "application/json")
+    with pytest.raises(ResultTooLarge):
+        encode_result(b"x" * 11, max_size=10)
+
+    (inline,) = result_rows("t1", data, content_type)
+    assert inline.data == data and inline.chunk_size is None
+
+    header, *chunks = result_rows("t2", b"abcdefghij", "text/plain", inline_limit=4, chunk_size=4)
+    assert isinstance(header, TaskResult) and header.data is None and header.size == 10
+    assert all(isinstance(chunk, TaskResultChunk) for chunk in chunks)
+    assert [chunk.data for chunk in chunks] == [b"abcd", b"efgh", b"ij"]
+    assert chunk_span(header, 3, 8) == (0, 2)
+    assert chunk_span(header, 4, 7) == (1, 1)
+
+
+def test_parse_byte_range():
+    """Single byte ranges are honoured; anything unsupported falls back to the full body."""
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=95-200", 100) == (95, 99)
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    assert parse_byte_range("items=0-1", 100) is None
+    assert parse_byte_range("bytes=9-2", 100) is None
+    with pytest.raises(RangeNotSatisfiable):
+        parse_byte_range("bytes=100-", 100)
+
+
+def test_result_endpoint_serves_full_and_partial_bodies():
+    """GET /tasks/{id}/result answers 200, 206, 416 and 404 as appropriate."""
+    body = b"0123456789" * 200
+    app = create_app(with_infra=False)
+    reader = InMemoryResultReader(
+        {"t1": TaskResult(task_id="t1", content_type="text/plain", size=len(body), data=body)}
+    )
+
+    async def override_reader() -> TaskResultReader:
+        return reader
+
+    app.dependency_overrides[get_result_reader] = override_reader
+
+    with TestClient(app) as client:
+        full = client.get("/tasks/t1/result")
+        partial = client.get("/tasks/t1/result", headers={"Range": "bytes=5-14"})
+        beyond = client.get("/tasks/t1/result", headers={"Range": "bytes=5000-"})
+        missing = client.get("/tasks/nope/result")
+
+    assert full.status_code == 200
+    assert full.content == body
+    assert full.headers["Accept-Ranges"] == "bytes"
+    assert partial.status_code == 206
+    assert partial.content == b"5678901234"
+    assert partial.headers["Content-Range"] == f"bytes 5-14/{len(body)}"
+    assert beyond.status_code == 416
+    assert beyond.headers["Content-Range"] == f"bytes */{len(body)}"
+    assert missing.status_code == 404
@@ -0,0 +1,19 @@
+"""Guard that the schema revision checked at boot tracks the Alembic head."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+
+from taskflow_core.db import SCHEMA_REVISION
+
+
+def test_schema_revision_matches_alembic_head():
+    """Adding a migration must also bump taskflow_core.db.SCHEMA_REVISION."""
+    root = Path(__file__).resolve().parents[2]
+    config = Config(str(root / "alembic" / "alembic.ini"))
+    config.set_main_option("script_location", str(root / "alembic"))
+
+    assert ScriptDirectory.from_config(config).get_heads() == [SCHEMA_REVISION]
@@ -2,17 +2,42 @@
 
 from __future__ import annotations
 
+import gzip
+import json
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from typing import Dict, Optional
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
-from taskflow_core import TaskCreate, TaskRead, TaskStatus
+from taskflow_core import (
+    TERMINAL_STATUSES,
+    TaskCreate,
+    TaskLookupResponse,
+    TaskPriority,
+    TaskRead,
+    TaskStats,
+    TaskStatus,
+)
 
+from service_api.api import routes_tasks
 from service_api.app import create_app
-from service_api.dependencies import get_task_service
+from service_api.dependencies import get_task_exporter, get_task_service
+from service_api.services.export import TaskExporter
+from service_api.services.tasks import (
+    IdempotencyKeyReused,
+    TaskDependencyError,
+    TaskService,
+    _due_time,
+    payload_hash,
+)
+
+
+def _as_row(task: TaskRead) -> SimpleNamespace:
+    """Shape a task like a Core row of ``EXPORT_COLUMNS``."""
+    return SimpleNamespace(id=task.task_id, **task.dict(exclude={"task_id"}))
 
 
 class InMemoryTaskService:
@@ -20,20 +45,43 @@ class InMemoryTaskService:
 
     def __init__(self):
         self._tasks: Dict[str, TaskRead] = {}
+        self._idempotency_keys: Dict[tuple[str, str], tuple[str, str]] = {}
 
-    async def create_task(self, payload: TaskCreate) -> TaskRead:
+    async def create_task(
+        self,
+        payload: TaskCreate,
+        idempotency_key: Optional[str] = None,
+        *,
+        client: str = "",
+    ) -> TaskRead:
+        scoped_key = (client, idempotency_key)
+        if scoped_key in self._idempotency_keys:
+            task_id, body_hash = self._idempotency_keys[scoped_key]
+            if body_hash != payload_hash(payload):
+                raise IdempotencyKeyReused("Idempotency-Key was already used with another body")
+            return self._tasks[task_id]
+        unknown = [task_id for task_id in payload.depends_on if task_id not in self._tasks]
+        if unknown:
+            raise TaskDependencyError(f"Unknown dependencies: {', '.join(unknown)}")
+        waiting = any(
+            self._tasks[task_id].status != TaskStatus.DONE for task_id in payload.depends_on
+        )
         task_id = str(uuid4())
         timestamp = datetime.now(timezone.utc)
         task = TaskRead(
             task_id=task_id,
             title=payload.title,
             payload=payload.payload,
-            status=TaskStatus.PENDING,
+            status=TaskStatus.WAITING if waiting else TaskStatus.PENDING,
+            priority=payload.priority,
+            task_type=payload.task_type,
             created_at=timestamp,
             updated_at=timestamp,
             finished_at=None,
         )
         self._tasks[task_id] = task
+        if idempotency_key:
+            self._idempotency_keys[scoped_key] = (task_id, payload_hash(payload))
         return task
 
     async def get_task(self, task_id: str) -> Optional[TaskRead]:
@@ -42,6 +90,79 @@ class InMemoryTaskService:
     async def list_tasks(self) -> list[TaskRead]:
         return list(self._tasks.values())
 
+    async def list_task_rows(self) -> list[SimpleNamespace]:
+        return [_as_row(task) for task in self._tasks.values()]
+
+    async def get_task_row(self, task_id: str) -> Optional[SimpleNamespace]:
+        task = self._tasks.get(task_id)
+        return _as_row(task) if task else None
+
+    async def get_task_version(self, task_id: str) -> Optional[datetime]:
+        task = self._tasks.get(task_id)
+        return task.updated_at if task else None
+
+    async def get_list_version(self):
+        latest = max((task.updated_at for task in self._tasks.values()), default=None)
+        return len(self._tasks), latest
+
+    async def lookup_tasks(self, task_ids, fields=None) -> TaskLookupResponse:
+        include = None if fields is None else {"task_id", *fields}
+        found = [self._tasks[task_id] for task_id in task_ids if task_id in self._tasks]
+        return TaskLookupResponse(
+            tasks=[task.dict(include=include) for task in found],
+            missing=[task_id for task_id in task_ids if task_id not in self._tasks],
+        )
+
+    async def cancel_task(self, task_id: str) -> Optional[TaskRead]:
+        task = self._tasks.get(task_id)
+        if task is None or task.status in TERMINAL_STATUSES:
+            return task
+        timestamp = datetime.now(timezone.utc)
+        self._tasks[task_id] = task.copy(
+            update={
+                "status": TaskStatus.CANCELLED.value,
+                "updated_at": timestamp,
+                "finished_at": timestamp,
+            }
+        )
+        return self._tasks[task_id]
+
+    async def get_stats(self, minutes: int = 15) -> Optional[TaskStats]:
+        counts = {status.value: 0 for status in TaskStatus}
+        for task in self._tasks.values():
+            counts[task.status] += 1
+        return TaskStats(counts=counts)
+
+
+class FakeExporter(TaskExporter):
+    """Exporter yielding canned row batches instead of a database cursor."""
+
+    def __init__(self, batches):
+        super().__init__(database=None)
+        self._batches = batches
+        self.filters = None
+
+    async def batches(self, **filters):
+        self.filters = filters
+        for batch in self._batches:
+            yield batch
+
+
+def _export_row(title: str) -> SimpleNamespace:
+    timestamp = datetime(2026, 10, 19, 9, 0, tzinfo=timezone.utc)
+    return SimpleNamespace(
+        id=str(uuid4()),
+        title=title,
+        payload={"message": title},
+        status=TaskStatus.DONE,
+        priority=TaskPriority.NORMAL,
+        created_at=timestamp,
+        updated_at=timestamp,
+        finished_at=timestamp,
+        run_at=None,
+        task_type="default",
+    )
+
 
 @pytest.fixture()
 def client():
@@ -68,7 +189,154 @@ def test_create_task_returns_pending_status(client: TestClient):
     body = response.json()
     assert body["status"] == TaskStatus.PENDING.value
     assert body["title"] == "Example Task"
+    assert body["priority"] == TaskPriority.NORMAL.value
     assert "task_id" in body
+    assert "taskflow_rw_until" in response.cookies
+
+
+def test_create_task_accepts_priority(client: TestClient):
+    """POST /tasks should persist the requested priority and reject unknown values."""
+    response = client.post("/tasks", json={"title": "Urgent", "priority": "HIGH"})
+    assert response.status_code == 201
+    assert response.json()["priority"] == TaskPriority.HIGH.value
+
+    invalid = client.post("/tasks", json={"title": "Bogus", "priority": "URGENT"})
+    assert invalid.status_code == 422
+
+
+def test_create_task_replays_original_for_reused_idempotency_key(client: TestClient):
+    """Repeated POST /tasks with the same Idempotency-Key should not create a second task."""
+    headers = {"Idempotency-Key": "client-retry-1"}
+    first = client.post("/tasks", json={"title": "Once"}, headers=headers)
+    second = client.post("/tasks", json={"title": "Once"}, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert first.json()["task_id"] == second.json()["task_id"]
+    assert len(client.get("/tasks").json()) == 1
+
+
+def test_idempotency_keys_are_scoped_per_client_and_bound_to_the_body(client: TestClient):
+    """The same Idempotency-Key from another API key is a new task; a different body is rejected."""
+    headers = {"Idempotency-Key": "nightly", "X-API-Key": "tenant-a"}
+    first = client.post("/tasks", json={"title": "Report"}, headers=headers)
+    other_tenant = client.post(
+        "/tasks", json={"title": "Report"}, headers={**headers, "X-API-Key": "tenant-b"}
+    )
+    changed_body = client.post("/tasks", json={"title": "Other report"}, headers=headers)
+
+    assert other_tenant.status_code == 201
+    assert other_tenant.json()["task_id"] != first.json()["task_id"]
+    assert changed_body.status_code == 422
+    assert len(client.get("/tasks").json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_task_service_scopes_idempotency_keys_in_the_database_and_cache(sqlite_database):
+    """Scoping and body checks hold both from the unique index and from the Redis cache."""
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    body = TaskCreate(title="Report", payload={"a": 1, "b": 2})
+    reordered = TaskCreate(title="Report", payload={"b": 2, "a": 1})
+
+    for index, cache in enumerate((redis, None)):
+        tenant_a, tenant_b = f"key:a{index}", f"key:b{index}"
+        async with sqlite_database.session() as session:
+            service = TaskService(session, None, cache)
+            first = await service.create_task(body, "key-1", client=tenant_a)
+            replay = await service.create_task(reordered, "key-1", client=tenant_a)
+            other = await service.create_task(body, "key-1", client=tenant_b)
+            with pytest.raises(IdempotencyKeyReused):
+                await service.create_task(TaskCreate(title="Changed"), "key-1", client=tenant_a)
+
+        assert replay.task_id == first.task_id
+        assert other.task_id != first.task_id
+
+
+def test_create_task_validates_schedule(client: TestClient):
+    """POST /tasks should reject jitter outside 0..3600 seconds."""
+    assert client.post("/tasks", json={"title": "Late", "jitter_seconds": -1}).status_code == 422
+    assert client.post("/tasks", json={"title": "Late", "jitter_seconds": 7200}).status_code == 422
+
+
+def test_create_task_waits_for_dependencies(client: TestClient):
+    """POST /tasks with depends_on should park the task as WAITING and reject unknown ids."""
+    parent_id = client.post("/tasks", json={"title": "Extract"}).json()["task_id"]
+
+    child = client.post("/tasks", json={"title": "Load", "depends_on": [parent_id]})
+    assert child.status_code == 201
+    assert child.json()["status"] == TaskStatus.WAITING.value
+
+    unknown = client.post("/tasks", json={"title": "Orphan", "depends_on": ["missing"]})
+    assert unknown.status_code == 422
+    assert "missing" in unknown.json()["detail"]
+
+
+def test_due_time_applies_jitter_and_runs_past_times_now():
+    """Scheduled times should never be in the past and jitter should only ever delay."""
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+    assert _due_time(TaskCreate(title="Now"), now) is None
+    assert _due_time(TaskCreate(title="Past", run_at="2026-10-19T11:00:00"), now) == now
+
+    later = datetime(2026, 10, 19, 13, 0, tzinfo=timezone.utc)
+    for _ in range(20):
+        due = _due_time(TaskCreate(title="Spread", run_at=later, jitter_seconds=60), now)
+        assert 0 <= (due - later).total_seconds() <= 60
+
+
+def test_lookup_returns_projected_tasks_and_missing_ids(client: TestClient):
+    """POST /tasks/lookup should resolve many ids at once and honour the field projection."""
+    task_id = client.post("/tasks", json={"title": "Tracked"}).json()["task_id"]
+
+    response = client.post(
+        "/tasks/lookup",
+        json={"task_ids": [task_id, "unknown"], "fields": ["status"]},
+    )
+    assert response.status_code == 200
+    body = response.json()
+    assert body["tasks"] == [{"task_id": task_id, "status": TaskStatus.PENDING.value}]
+    assert body["missing"] == ["unknown"]
+
+    invalid = client.post("/tasks/lookup", json={"task_ids": [task_id], "fields": ["secret"]})
+    assert invalid.status_code == 422
+
+
+def test_task_stats_route_is_not_shadowed_by_task_lookup(client: TestClient):
+    """GET /tasks/stats should return aggregate counts rather than a task lookup 404."""
+    client.post("/tasks", json={"title": "Counted"})
+
+    response = client.get("/tasks/stats", params={"minutes": 5})
+    assert response.status_code == 200
+    assert response.json()["counts"][TaskStatus.PENDING.value] == 1
+
+    assert client.get("/tasks/stats", params={"minutes": 0}).status_code == 422
+
+
+def test_cancel_task_is_idempotent_and_rejects_finished_tasks():
+    """POST /tasks/{id}/cancel should cancel once, repeat harmlessly, and 409 on finished tasks."""
+    app = create_app(with_infra=False)
+    service = InMemoryTaskService()
+
+    async def override_service() -> InMemoryTaskService:
+        return service
+
+    app.dependency_overrides[get_task_service] = override_service
+
+    with TestClient(app) as client:
+        task_id = client.post("/tasks", json={"title": "Abandoned"}).json()["task_id"]
+        response = client.post(f"/tasks/{task_id}/cancel")
+        assert response.status_code == 200
+        assert response.json()["status"] == TaskStatus.CANCELLED.value
+        assert response.json()["finished_at"] is not None
+        assert client.post(f"/tasks/{task_id}/cancel").status_code == 200
+
+        assert client.post("/tasks/unknown/cancel").status_code == 404
+
+        finished_id = client.post("/tasks", json={"title": "Finished"}).json()["task_id"]
+        service._tasks[finished_id] = service._tasks[finished_id].copy(
+            update={"status": TaskStatus.DONE.value}
+        )
+        assert client.post(f"/tasks/{finished_id}/cancel").status_code == 409
 
 
 def test_get_task_returns_created_task(client: TestClient):
@@ -83,6 +351,36 @@ def test_get_task_returns_created_task(client: TestClient):
     assert payload["status"] == TaskStatus.PENDING.value
 
 
+def test_get_task_honours_if_none_match(client: TestClient):
+    """GET /tasks/{id} should emit an ETag and answer a matching If-None-Match with 304."""
+    task_id = client.post("/tasks", json={"title": "Polled"}).json()["task_id"]
+
+    first = client.get(f"/tasks/{task_id}")
+    etag = first.headers["etag"]
+    assert etag.startswith('W/"')
+
+    cached = client.get(f"/tasks/{task_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+    stale = client.get(f"/tasks/{task_id}", headers={"If-None-Match": 'W/"stale"'})
+    assert stale.status_code == 200
+
+
+def test_list_etag_changes_when_collection_changes(client: TestClient):
+    """GET /tasks should return 304 until a task is added."""
+    client.post("/tasks", json={"title": "First"})
+    etag = client.get("/tasks").headers["etag"]
+
+    assert client.get("/tasks", headers={"If-None-Match": etag}).status_code == 304
+
+    client.post("/tasks", json={"title": "Second"})
+    refreshed = client.get("/tasks", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+
+
 def test_list_tasks_returns_all_created_tasks(client: TestClient):
     """GET /tasks should return every task created during the test run."""
     titles = ["Task A", "Task B"]
@@ -96,3 +394,49 @@ def test_list_tasks_returns_all_created_tasks(client: TestClient):
     returned_titles = {item["title"] for item in body}
     for title in titles:
         assert title in returned_titles
+
+
+def test_fast_serialization_matches_validated_responses(client: TestClient, monkeypatch):
+    """Row-encoded list and detail bodies are byte-identical to the TaskRead path."""
+    created = client.post(
+        "/tasks", json={"title": "Über", "payload": {"n": 1.5}, "run_at": "2030-01-01T00:00:00Z"}
+    ).json()
+    client.post("/tasks", json={"title": "Second", "priority": "HIGH"})
+
+    fast_list = client.get("/tasks")
+    fast_detail = client.get(f"/tasks/{created['task_id']}")
+    monkeypatch.setattr(routes_tasks, "fast_serialization", lambda route: False)
+    slow_list = client.get("/tasks")
+    slow_detail = client.get(f"/tasks/{created['task_id']}")
+
+    assert fast_list.content == slow_list.content
+    assert fast_detail.content == slow_detail.content
+    assert fast_list.headers["ETag"] == slow_list.headers["ETag"]
+    assert fast_detail.headers["ETag"] == slow_detail.headers["ETag"]
+    assert fast_detail.headers["content-type"] == slow_detail.headers["content-type"]
+
+
+def test_export_streams_ndjson_and_gzip():
+    """GET /tasks/export should emit one JSON object per line, optionally gzip-compressed."""
+    exporter = FakeExporter([[_export_row("A"), _export_row("B")], [_export_row("C")]])
+    app = create_app(with_infra=False)
+
+    async def override_exporter() -> TaskExporter:
+        return exporter
+
+    app.dependency_overrides[get_task_exporter] = override_exporter
+
+    with TestClient(app) as test_client:
+        plain = test_client.get("/tasks/export", params={"status": "DONE"})
+        assert exporter.filters["status"] == TaskStatus.DONE
+        compressed = test_client.get("/tasks/export", params={"gzip": "true"})
+
+    assert plain.status_code == 200
+    assert plain.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in plain.text.splitlines()]
+    assert [line["title"] for line in lines] == ["A", "B", "C"]
+    assert lines[0]["status"] == TaskStatus.DONE.value
+    assert lines[0]["created_at"] == "2026-10-19T09:00:00+00:00"
+
+    assert compressed.headers["content-encoding"] == "identity"
+    assert gzip.decompress(compressed.content).decode() == plain.text
@@ -0,0 +1,87 @@
+"""Unit tests for the WebSocket load test's argument parsing and summary."""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "ws_loadtest.py"
+
+
+@pytest.fixture(scope="module")
+def loadtest():
+    pytest.importorskip("websockets")
+    spec = importlib.util.spec_from_file_location("ws_loadtest", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses resolve their annotations through sys.modules.
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+
+
+def test_parse_args_defaults_and_targets(loadtest):
+    args = loadtest.parse_args([])
+    assert (args.clients, args.rate, args.duration) == (1000, 20.0, 30.0)
+    assert args.url is None and args.redis_url is None and not args.fake_redis
+
+    remote = loadtest.parse_args(
+        ["--url", "ws://api:8000/ws", "--redis-url", "redis://redis:6379/0", "--server-pid", "42", "--json"]
+    )
+    assert (remote.url, remote.redis_url, remote.server_pid, remote.json) == (
+        "ws://api:8000/ws",
+        "redis://redis:6379/0",
+        42,
+        True,
+    )
+
+    assert loadtest.parse_args(["--fake-redis", "--clients", "5"]).clients == 5
+    with pytest.raises(SystemExit):
+        loadtest.parse_args(["--fake-redis", "--redis-url", "redis://redis:6379/0"])
+
+
+def test_summary_reports_delivery_latency_and_memory(loadtest):
+    stats = loadtest.Stats(failed=1, disconnected=2)
+    for latency in (0.010, 0.020, 0.030, 0.040):
+        stats.record(latency)
+    stats.max_lag = 0.005
+
+    summary = loadtest.summarize(
+        loadtest.parse_args(["--clients", "3"]),
+        stats,
+        subscribed=2,
+        connect_seconds=1.23456,
+        published=4,
+        elapsed=2.0,
+        per_connection=2048,
+        rss=64 * 2**20,
+        redis_max_connections=100,
+    )
+
+    assert summary["clients"] == 3
+    assert (summary["connect_failures"], summary["disconnects"]) == (1, 2)
+    assert summary["connect_seconds"] == 1.235
+    assert summary["delivery_ratio"] == 0.5
+    assert summary["deliveries_per_second"] == 2.0
+    assert (summary["latency_p50_ms"], summary["latency_max_ms"]) == (30.0, 40.0)
+    assert (summary["rss_per_connection_kib"], summary["rss_mib"]) == (2.0, 64.0)
+    assert summary["loop_lag_max_ms"] == 5.0
+    assert summary["redis_max_connections"] == 100
+
+    empty = loadtest.summarize(
+        loadtest.parse_args([]),
+        loadtest.Stats(),
+        subscribed=0,
+        connect_seconds=0,
+        published=0,
+        elapsed=0,
+        per_connection=0,
+        rss=0,
+        redis_max_connections=100,
+    )
+    assert empty["delivery_ratio"] == empty["deliveries_per_second"] == empty["latency_p99_ms"] == 0.0
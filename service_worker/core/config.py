@@ -17,12 +17,66 @@ class Settings(BaseSettings):
     rabbitmq_exchange: str = Field("task.topic", env="RABBITMQ_EXCHANGE")
     rabbitmq_queue: str = Field("task.created", env="RABBITMQ_QUEUE")
     rabbitmq_routing_key: str = Field("task.created", env="RABBITMQ_ROUTING_KEY")
+    rabbitmq_retry_exchange: str = Field("task.retry", env="RABBITMQ_RETRY_EXCHANGE")
+    rabbitmq_dead_letter_exchange: str = Field("task.dead", env="RABBITMQ_DEAD_LETTER_EXCHANGE")
+    rabbitmq_dead_letter_queue: str = Field("task.dead", env="RABBITMQ_DEAD_LETTER_QUEUE")
     worker_prefetch: int = Field(8, env="WORKER_PREFETCH")
+    worker_concurrency: int = Field(8, env="WORKER_CONCURRENCY")
+    worker_weight_high: int = Field(6, env="WORKER_WEIGHT_HIGH")
+    worker_weight_normal: int = Field(3, env="WORKER_WEIGHT_NORMAL")
+    worker_weight_low: int = Field(1, env="WORKER_WEIGHT_LOW")
+    worker_executor: str = Field("loop", env="WORKER_EXECUTOR")
+    worker_executor_workers: int = Field(0, env="WORKER_EXECUTOR_WORKERS")
+    worker_handler_modules: str = Field("", env="WORKER_HANDLER_MODULES")
+    worker_shutdown_timeout: float = Field(25.0, env="WORKER_SHUTDOWN_TIMEOUT")
+    worker_task_timeout: float = Field(300.0, env="WORKER_TASK_TIMEOUT")
+    worker_adaptive_concurrency: bool = Field(True, env="WORKER_ADAPTIVE_CONCURRENCY")
+    worker_min_concurrency: int = Field(1, env="WORKER_MIN_CONCURRENCY")
+    worker_max_concurrency: int = Field(30, env="WORKER_MAX_CONCURRENCY")
+    worker_latency_tolerance: float = Field(2.0, env="WORKER_LATENCY_TOLERANCE")
+    worker_max_error_rate: float = Field(0.1, env="WORKER_MAX_ERROR_RATE")
+    worker_max_pool_wait: float = Field(0.05, env="WORKER_MAX_POOL_WAIT")
+    worker_control_interval: float = Field(5.0, env="WORKER_CONTROL_INTERVAL")
+    worker_max_attempts: int = Field(5, env="WORKER_MAX_ATTEMPTS")
+    worker_retry_base_delay: float = Field(1.0, env="WORKER_RETRY_BASE_DELAY")
+    worker_retry_multiplier: float = Field(4.0, env="WORKER_RETRY_MULTIPLIER")
+    worker_retry_max_delay: float = Field(300.0, env="WORKER_RETRY_MAX_DELAY")
     rabbitmq_connect_attempts: int = Field(10, env="RABBITMQ_CONNECT_ATTEMPTS")
-    rabbitmq_connect_backoff: float = Field(2.0, env="RABBITMQ_CONNECT_BACKOFF")
+    rabbitmq_connect_backoff: float = Field(0.25, env="RABBITMQ_CONNECT_BACKOFF")
     db_connect_attempts: int = Field(10, env="DB_CONNECT_ATTEMPTS")
-    db_connect_backoff: float = Field(2.0, env="DB_CONNECT_BACKOFF")
+    db_connect_backoff: float = Field(0.25, env="DB_CONNECT_BACKOFF")
     db_echo: bool = Field(False, env="DB_ECHO")
+    db_pool_size: int = Field(10, env="DB_POOL_SIZE")
+    db_max_overflow: int = Field(20, env="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, env="DB_POOL_TIMEOUT")
+    db_pool_recycle: int = Field(1800, env="DB_POOL_RECYCLE")
+    db_pool_pre_ping: bool = Field(True, env="DB_POOL_PRE_PING")
+    redis_max_connections: int = Field(100, env="REDIS_MAX_CONNECTIONS")
+    redis_acquire_timeout: float = Field(5.0, env="REDIS_ACQUIRE_TIMEOUT")
+    redis_health_check_interval: int = Field(30, env="REDIS_HEALTH_CHECK_INTERVAL")
+    amqp_heartbeat: int = Field(60, env="AMQP_HEARTBEAT")
+    task_partitions: int = Field(1, env="TASK_PARTITIONS")
+    worker_id: str = Field("", env="WORKER_ID")
+    partition_rebalance_interval: float = Field(5.0, env="PARTITION_REBALANCE_INTERVAL")
+    partition_member_ttl: float = Field(30.0, env="PARTITION_MEMBER_TTL")
+    pool_monitor_interval: float = Field(30.0, env="POOL_MONITOR_INTERVAL")
+    worker_metrics_host: str = Field("0.0.0.0", env="WORKER_METRICS_HOST")
+    worker_metrics_port: int = Field(9100, env="WORKER_METRICS_PORT")
+    autoscale_slots_per_worker: int = Field(8, env="AUTOSCALE_SLOTS_PER_WORKER")
+    autoscale_drain_seconds: float = Field(60.0, env="AUTOSCALE_DRAIN_SECONDS")
+    autoscale_min_workers: int = Field(1, env="AUTOSCALE_MIN_WORKERS")
+    autoscale_max_workers: int = Field(50, env="AUTOSCALE_MAX_WORKERS")
+    archive_enabled: bool = Field(True, env="ARCHIVE_ENABLED")
+    archive_retention_days: float = Field(30.0, env="ARCHIVE_RETENTION_DAYS")
+    archive_batch_size: int = Field(500, env="ARCHIVE_BATCH_SIZE")
+    archive_interval: float = Field(300.0, env="ARCHIVE_INTERVAL")
+    scheduler_enabled: bool = Field(True, env="SCHEDULER_ENABLED")
+    scheduler_interval: float = Field(1.0, env="SCHEDULER_INTERVAL")
+    scheduler_batch_size: int = Field(500, env="SCHEDULER_BATCH_SIZE")
+    progress_publish_interval: float = Field(0.5, env="PROGRESS_PUBLISH_INTERVAL")
+    progress_flush_interval: float = Field(5.0, env="PROGRESS_FLUSH_INTERVAL")
+    task_state_cache_ttl: int = Field(60, env="TASK_STATE_CACHE_TTL")
+    stats_reconcile_interval: float = Field(300.0, env="STATS_RECONCILE_INTERVAL")
 
     class Config:
         env_file = ".env"
@@ -32,3 +86,4 @@ class Settings(BaseSettings):
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
     return Settings()
+
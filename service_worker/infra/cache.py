@@ -5,31 +5,50 @@ from __future__ import annotations
 import json
 from typing import Optional
 
-from redis.asyncio import Redis, from_url
+from redis.asyncio import Redis
 
+from taskflow_core.redis_pool import create_redis_client
 from taskflow_core.schemas import TaskStatusMessage
 
 
 BROADCAST_CHANNEL = "task.status"
+CANCEL_CHANNEL = "task.cancel"
 
 
 class RedisPublisher:
     """Publish task status updates via Redis Pub/Sub."""
 
-    def __init__(self, redis_url: str):
+    def __init__(
+        self,
+        redis_url: str,
+        *,
+        max_connections: int = 100,
+        acquire_timeout: float = 5.0,
+        health_check_interval: int = 30,
+    ):
         self._redis_url = redis_url
+        self._max_connections = max_connections
+        self._acquire_timeout = acquire_timeout
+        self._health_check_interval = health_check_interval
         self._client: Optional[Redis] = None
 
     async def connect(self) -> Redis:
-        """Create and cache an asyncio Redis client if missing."""
+        """Create and cache an asyncio Redis client backed by a bounded pool if missing."""
         if self._client is None:
-            self._client = from_url(
+            self._client = create_redis_client(
                 self._redis_url,
-                encoding="utf-8",
-                decode_responses=True,
+                max_connections=self._max_connections,
+                acquire_timeout=self._acquire_timeout,
+                health_check_interval=self._health_check_interval,
             )
         return self._client
 
+    def pool_metrics(self) -> dict[str, float]:
+        """Return connection pool gauges and wait counters; empty when disconnected."""
+        if self._client is None:
+            return {}
+        return self._client.connection_pool.metrics()
+
     async def close(self) -> None:
         """Close the Redis connection and clear the cached client."""
         if self._client is not None:
@@ -40,7 +59,7 @@ class RedisPublisher:
         """Publish a TaskStatusMessage on the broadcast channel."""
         if self._client is None:
             raise RuntimeError("Redis client is not connected.")
-        await self._client.publish(BROADCAST_CHANNEL, message.json())
+        await self._client.publish(BROADCAST_CHANNEL, message.json(exclude_none=True))
 
     async def publish_status_update(self, task_id: str, payload: dict) -> None:
         """Publish an ad-hoc status payload on the broadcast channel."""
@@ -6,8 +6,12 @@ from taskflow_core import Database
 database: Database | None = None
 
 
-def create_database(url: str, *, echo: bool = False) -> Database:
-    """Instantiate and cache an async Database helper for the worker."""
+def create_database(url: str, *, echo: bool = False, **pool_options) -> Database:
+    """Instantiate and cache an async Database helper for the worker.
+
+    ``pool_options`` are forwarded to :class:`Database` (pool size, overflow,
+    timeout, recycle and pre-ping).
+    """
     global database
-    database = Database(url, echo=echo)
+    database = Database(url, echo=echo, **pool_options)
     return database
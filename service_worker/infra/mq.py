@@ -2,13 +2,68 @@
 
 from __future__ import annotations
 
-from typing import Awaitable, Callable, Optional
+import asyncio
+import logging
+from functools import partial
+from typing import AbstractSet, Awaitable, Callable, Optional, Sequence
 
 import aio_pika
 
+from taskflow_core import TaskPriority
+from taskflow_core.routing import (
+    partition_queue_name,
+    partition_routing_key,
+    task_routing_key,
+)
+from taskflow_core.schemas import TaskCreatedMessage
+
+logger = logging.getLogger(__name__)
+
+ATTEMPT_HEADER = "x-attempt"
+RETRY_DELAY_HEADER = "x-retry-delay-ms"
+LAST_ERROR_HEADER = "x-last-error"
+ORIGINAL_ROUTING_KEY_HEADER = "x-original-routing-key"
+_BROKER_DEATH_HEADERS = ("x-death", "x-first-death-", "x-last-death-")
+_MAX_ERROR_LENGTH = 512
+
+QueueKey = tuple[TaskPriority, int]
+
+
+def delivery_attempts(message: aio_pika.IncomingMessage) -> int:
+    """Return how many attempts were already made before this delivery."""
+    headers = message.headers or {}
+    try:
+        return int(headers.get(ATTEMPT_HEADER, 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _carry_headers(message: aio_pika.IncomingMessage, **updates) -> dict:
+    """Copy application headers, dropping the broker's own dead-letter bookkeeping."""
+    headers = {
+        key: value
+        for key, value in (message.headers or {}).items()
+        if not key.startswith(_BROKER_DEATH_HEADERS)
+    }
+    headers.update(updates)
+    return headers
+
 
 class TaskQueueConsumer:
-    """Consume task creation messages from RabbitMQ."""
+    """Consume task creation messages from one RabbitMQ queue per priority.
+
+    Failed deliveries are parked on TTL delay queues (one per backoff tier)
+    behind a headers exchange; when the TTL expires the broker dead-letters
+    them back to the task exchange with their original routing key. Messages
+    that exhaust their attempts go to a durable dead-letter queue.
+
+    With ``partitions`` > 1 every priority lane is split into that many
+    queues (``tasks.p0``, ``tasks.high.p3``...) selected by a consistent hash
+    of the task's partition key. The worker only consumes the partitions
+    handed to :meth:`assign`; partitioned queues are declared with
+    single-active-consumer so each one is drained by one worker at a time,
+    preserving per-key delivery order even while ownership moves.
+    """
 
     def __init__(
         self,
@@ -16,41 +71,331 @@ class TaskQueueConsumer:
         exchange: str,
         queue_name: str,
         routing_key: str,
+        *,
+        retry_exchange: str = "task.retry",
+        retry_delays: Sequence[float] = (),
+        dead_letter_exchange: str = "task.dead",
+        dead_letter_queue: str = "task.dead",
+        heartbeat: int = 60,
+        partitions: int = 1,
     ):
         self._amqp_url = amqp_url
+        self._heartbeat = heartbeat
         self._exchange_name = exchange
         self._queue_name = queue_name
         self._routing_key = routing_key
+        self._partitions = max(1, partitions)
+        self._assigned: set[int] = set(range(self._partitions))
+        self._retry_exchange_name = retry_exchange
+        self._retry_delays_ms = sorted({int(delay * 1000) for delay in retry_delays})
+        self._dead_letter_exchange_name = dead_letter_exchange
+        self._dead_letter_queue_name = dead_letter_queue
         self._connection: Optional[aio_pika.RobustConnection] = None
         self._channel: Optional[aio_pika.Channel] = None
-        self._queue: Optional[aio_pika.Queue] = None
+        self._inspect_channel: Optional[aio_pika.abc.AbstractChannel] = None
+        self._exchange: Optional[aio_pika.Exchange] = None
+        self._retry_exchange: Optional[aio_pika.Exchange] = None
+        self._dead_letter_exchange: Optional[aio_pika.Exchange] = None
+        self._dead_letter_queue: Optional[aio_pika.Queue] = None
+        self._queues: dict[QueueKey, aio_pika.Queue] = {}
+        self._handler: Optional[
+            Callable[[TaskPriority, aio_pika.IncomingMessage], Awaitable[None]]
+        ] = None
+        self._consumer_tags: dict[QueueKey, str] = {}
+        self._prefetch: Optional[int] = None
+        # Serialises consumer changes: the rebalancer (assign) and the
+        # concurrency controller (set_prefetch) would otherwise interleave.
+        self._consumers_lock = asyncio.Lock()
+
+    @property
+    def partitions(self) -> int:
+        """Number of partitions each priority lane is split into."""
+        return self._partitions
+
+    @property
+    def assigned_partitions(self) -> frozenset[int]:
+        """Partitions this worker currently consumes."""
+        return frozenset(self._assigned)
 
     async def connect(self, *, prefetch: int) -> None:
-        """Connect to RabbitMQ, declare bindings, and set QoS."""
+        """Connect to RabbitMQ, declare work, retry and dead-letter topology, and set QoS."""
         if self._connection:
             return
-        self._connection = await aio_pika.connect_robust(self._amqp_url)
+        self._connection = await aio_pika.connect_robust(
+            self._amqp_url,
+            heartbeat=self._heartbeat,
+        )
         self._channel = await self._connection.channel()
         await self._channel.set_qos(prefetch_count=prefetch)
-        exchange = await self._channel.declare_exchange(
+        self._prefetch = prefetch
+        self._exchange = await self._channel.declare_exchange(
             self._exchange_name,
             aio_pika.ExchangeType.TOPIC,
             durable=True,
         )
-        self._queue = await self._channel.declare_queue(
-            self._queue_name,
+        arguments = {"x-single-active-consumer": True} if self._partitions > 1 else None
+        for priority in TaskPriority:
+            for partition in range(self._partitions):
+                queue = await self._channel.declare_queue(
+                    partition_queue_name(self._queue_name, priority, partition, self._partitions),
+                    durable=True,
+                    arguments=arguments,
+                )
+                await queue.bind(
+                    self._exchange,
+                    routing_key=partition_routing_key(
+                        self._routing_key, priority, partition, self._partitions
+                    ),
+                )
+                self._queues[priority, partition] = queue
+
+        self._retry_exchange = await self._channel.declare_exchange(
+            self._retry_exchange_name,
+            aio_pika.ExchangeType.HEADERS,
             durable=True,
         )
-        await self._queue.bind(exchange, routing_key=self._routing_key)
+        for delay_ms in self._retry_delays_ms:
+            delay_queue = await self._channel.declare_queue(
+                f"{self._retry_exchange_name}.{delay_ms}ms",
+                durable=True,
+                arguments={
+                    "x-message-ttl": delay_ms,
+                    "x-dead-letter-exchange": self._exchange_name,
+                },
+            )
+            await delay_queue.bind(
+                self._retry_exchange,
+                arguments={"x-match": "all", RETRY_DELAY_HEADER: delay_ms},
+            )
+
+        self._dead_letter_exchange = await self._channel.declare_exchange(
+            self._dead_letter_exchange_name,
+            aio_pika.ExchangeType.FANOUT,
+            durable=True,
+        )
+        self._dead_letter_queue = await self._channel.declare_queue(
+            self._dead_letter_queue_name,
+            durable=True,
+        )
+        await self._dead_letter_queue.bind(self._dead_letter_exchange)
 
     async def consume(
         self,
-        handler: Callable[[aio_pika.IncomingMessage], Awaitable[None]],
+        handler: Callable[[TaskPriority, aio_pika.IncomingMessage], Awaitable[None]],
     ) -> None:
-        """Start consuming messages using the provided handler."""
-        if self._queue is None:
+        """Start consuming the assigned queues, tagging deliveries with their priority."""
+        if not self._queues:
             raise RuntimeError("Queue not initialised.")
-        await self._queue.consume(handler, no_ack=False)
+        async with self._consumers_lock:
+            self._handler = handler
+            for key in self._queues:
+                if key[1] in self._assigned:
+                    await self._start(key)
+
+    async def assign(self, partitions: AbstractSet[int]) -> None:
+        """Consume exactly ``partitions``, starting and cancelling consumers for the difference.
+
+        Deliveries already received from a released partition can still be
+        settled; unacked ones are redelivered to the partition's next owner.
+        """
+        partitions = {partition for partition in partitions if 0 <= partition < self._partitions}
+        async with self._consumers_lock:
+            added, removed = partitions - self._assigned, self._assigned - partitions
+            self._assigned = partitions
+            if self._handler is None:
+                return
+            for key in list(self._consumer_tags):
+                if key[1] in removed:
+                    await self._stop(key)
+            for key in self._queues:
+                if key[1] in added:
+                    await self._start(key)
+
+    async def cancel(self) -> None:
+        """Stop receiving new deliveries; unacked ones stay settleable on the open channel."""
+        async with self._consumers_lock:
+            handler, self._handler = self._handler, None
+            if handler is None:
+                return
+            for key in list(self._consumer_tags):
+                await self._stop(key)
+
+    async def set_prefetch(self, prefetch: int) -> None:
+        """Change the per-consumer prefetch window.
+
+        RabbitMQ applies ``basic.qos`` only to consumers started afterwards, so
+        each queue gets a fresh consumer before the old one is cancelled.
+        Deliveries already handed to the old consumer can still be acked.
+        An unchanged value is a no-op, so consumers are not churned needlessly.
+        """
+        if self._channel is None:
+            raise RuntimeError("Channel not initialised.")
+        async with self._consumers_lock:
+            if prefetch == self._prefetch:
+                return
+            await self._channel.set_qos(prefetch_count=prefetch)
+            self._prefetch = prefetch
+            if self._handler is None:
+                return
+            for key, previous_tag in list(self._consumer_tags.items()):
+                # Never revive a consumer for a partition released meanwhile.
+                if key[1] not in self._assigned or self._consumer_tags.get(key) != previous_tag:
+                    continue
+                await self._start(key)
+                await self._queues[key].cancel(previous_tag)
+
+    async def queue_depths(self) -> dict[QueueKey, int]:
+        """Return the ready-message count of every work queue, assigned to us or not.
+
+        Queues are re-declared passively on a separate channel, so a broker
+        error (e.g. a queue deleted underneath us) closes that channel only
+        and never the one carrying deliveries.
+        """
+        if self._connection is None:
+            raise RuntimeError("Connection not initialised.")
+        if self._inspect_channel is None or self._inspect_channel.is_closed:
+            self._inspect_channel = await self._connection.channel()
+        depths: dict[QueueKey, int] = {}
+        for key, queue in self._queues.items():
+            declared = await self._inspect_channel.declare_queue(queue.name, passive=True)
+            depths[key] = declared.declaration_result.message_count or 0
+        return depths
+
+    async def publish_task_created(self, message: TaskCreatedMessage) -> None:
+        """Publish a `task.created` message on the routing key for its priority and partition."""
+        if self._exchange is None:
+            raise RuntimeError("Task exchange not initialised.")
+        await self._exchange.publish(
+            aio_pika.Message(
+                body=message.json().encode("utf-8"),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=task_routing_key(
+                self._routing_key,
+                message.priority,
+                message.routing_partition_key,
+                self._partitions,
+            ),
+        )
+
+    async def _start(self, key: QueueKey) -> None:
+        assert self._handler is not None
+        priority = key[0]
+        self._consumer_tags[key] = await self._queues[key].consume(
+            partial(self._handler, priority),
+            no_ack=False,
+        )
+
+    async def _stop(self, key: QueueKey) -> None:
+        tag = self._consumer_tags.pop(key, None)
+        if tag is None:
+            return
+        try:
+            await self._queues[key].cancel(tag)
+        except Exception as exc:  # pragma: no cover - integration behaviour
+            logger.warning("Failed to cancel consumer for %s/p%d: %s", key[0].value, key[1], exc)
+
+    async def retry(
+        self,
+        message: aio_pika.IncomingMessage,
+        *,
+        attempt: int,
+        delay: float,
+        error: str,
+    ) -> None:
+        """Park a copy of the delivery on the delay queue for ``delay`` seconds."""
+        if self._retry_exchange is None:
+            raise RuntimeError("Retry exchange not initialised.")
+        delay_ms = int(delay * 1000)
+        if delay_ms not in self._retry_delays_ms:
+            raise ValueError(f"No delay queue declared for {delay_ms}ms")
+        await self._retry_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers=_carry_headers(
+                    message,
+                    **{
+                        ATTEMPT_HEADER: attempt,
+                        RETRY_DELAY_HEADER: delay_ms,
+                        LAST_ERROR_HEADER: error[:_MAX_ERROR_LENGTH],
+                    },
+                ),
+                content_type=message.content_type,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=message.routing_key or self._routing_key,
+        )
+
+    async def dead_letter(
+        self,
+        message: aio_pika.IncomingMessage,
+        *,
+        attempt: int,
+        error: str,
+    ) -> None:
+        """Move a delivery that cannot succeed onto the dead-letter queue."""
+        if self._dead_letter_exchange is None:
+            raise RuntimeError("Dead-letter exchange not initialised.")
+        routing_key = message.routing_key or self._routing_key
+        await self._dead_letter_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers=_carry_headers(
+                    message,
+                    **{
+                        ATTEMPT_HEADER: attempt,
+                        LAST_ERROR_HEADER: error[:_MAX_ERROR_LENGTH],
+                        ORIGINAL_ROUTING_KEY_HEADER: routing_key,
+                    },
+                ),
+                content_type=message.content_type,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            ),
+            routing_key=routing_key,
+        )
+
+    async def replay_dead_letters(
+        self,
+        *,
+        limit: Optional[int] = None,
+        prepare: Optional[Callable[[bytes], Awaitable[bool]]] = None,
+    ) -> int:
+        """Republish dead-lettered messages to the task exchange with a fresh attempt budget.
+
+        ``prepare`` is awaited with each body before it is republished (the
+        worker resets the task to PENDING there); when it returns False the
+        message is acknowledged and dropped. A message is only acknowledged
+        after ``prepare`` and the publish succeeded, so a failure leaves it
+        on the dead-letter queue. Returns how many messages were republished.
+        """
+        if self._dead_letter_queue is None or self._exchange is None:
+            raise RuntimeError("Dead-letter queue not initialised.")
+        replayed = handled = 0
+        while limit is None or handled < limit:
+            message = await self._dead_letter_queue.get(no_ack=False, fail=False)
+            if message is None:
+                break
+            handled += 1
+            if prepare is not None and not await prepare(message.body):
+                await message.ack()
+                continue
+            headers = _carry_headers(message)
+            routing_key = str(headers.pop(ORIGINAL_ROUTING_KEY_HEADER, message.routing_key))
+            headers.pop(ATTEMPT_HEADER, None)
+            headers.pop(LAST_ERROR_HEADER, None)
+            headers.pop(RETRY_DELAY_HEADER, None)
+            await self._exchange.publish(
+                aio_pika.Message(
+                    body=message.body,
+                    headers=headers,
+                    content_type=message.content_type,
+                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                ),
+                routing_key=routing_key,
+            )
+            await message.ack()
+            replayed += 1
+        return replayed
 
     async def close(self) -> None:
         """Close the AMQP resources opened by connect()."""
@@ -58,4 +403,11 @@ class TaskQueueConsumer:
             await self._connection.close()
         self._connection = None
         self._channel = None
-        self._queue = None
+        self._inspect_channel = None
+        self._exchange = None
+        self._retry_exchange = None
+        self._dead_letter_exchange = None
+        self._dead_letter_queue = None
+        self._queues = {}
+        self._handler = None
+        self._consumer_tags = {}
@@ -0,0 +1,69 @@
+"""Command-line tool that moves dead-lettered task messages back onto the work queues.
+
+Each task is reset from FAILED to PENDING before its message is republished,
+so the replayed delivery actually runs.
+
+Usage::
+
+    python -m service_worker.replay --limit 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from taskflow_core import Database
+from taskflow_core.stats import TaskStatsRecorder
+
+from .core.config import get_settings
+from .infra.cache import RedisPublisher
+from .infra.mq import TaskQueueConsumer
+from .services.deadletters import FailedTaskReset
+
+
+logger = logging.getLogger(__name__)
+
+
+async def replay(limit: int | None) -> int:
+    """Republish up to ``limit`` dead-lettered messages and return how many were moved."""
+    settings = get_settings()
+    consumer = TaskQueueConsumer(
+        settings.rabbitmq_url,
+        exchange=settings.rabbitmq_exchange,
+        queue_name=settings.rabbitmq_queue,
+        routing_key=settings.rabbitmq_routing_key,
+        dead_letter_exchange=settings.rabbitmq_dead_letter_exchange,
+        dead_letter_queue=settings.rabbitmq_dead_letter_queue,
+    )
+    database = Database(settings.db_url, pool_size=1, max_overflow=0)
+    redis = RedisPublisher(settings.redis_url, max_connections=2)
+    await consumer.connect(prefetch=1)
+    try:
+        reset = FailedTaskReset(database, stats=TaskStatsRecorder(await redis.connect()))
+        return await consumer.replay_dead_letters(limit=limit, prepare=reset)
+    finally:
+        await consumer.close()
+        await redis.close()
+        await database.dispose()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Parse CLI arguments and replay dead-lettered task messages."""
+    parser = argparse.ArgumentParser(description="Replay dead-lettered TaskFlow messages.")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=None,
+        help="Maximum number of messages to replay (default: drain the queue).",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    replayed = asyncio.run(replay(args.limit))
+    logger.info("Replayed %s dead-lettered message(s)", replayed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Archival of finished tasks from the hot ``tasks`` table into ``tasks_archive``."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, insert, or_, select
+
+from taskflow_core import (
+    TERMINAL_STATUSES,
+    Database,
+    Task,
+    TaskArchive,
+    TaskDependency,
+    TaskResult,
+    TaskResultChunk,
+)
+
+logger = logging.getLogger(__name__)
+
+
+ARCHIVED_COLUMNS = tuple(
+    column.name for column in TaskArchive.__table__.columns if column.name != "archived_at"
+)
+
+
+class TaskArchiver:
+    """Move terminal tasks older than the retention window in bounded batches.
+
+    Each batch locks its rows with ``FOR UPDATE SKIP LOCKED`` so several
+    workers can archive concurrently without blocking each other or the
+    rows the API and worker are actively touching, then copies and deletes
+    them in one transaction. Dependency edges touching an archived task are
+    dropped with it: a finished task has already released its dependents.
+    So is its result (inline row and chunks), which would otherwise sit in
+    the hot result tables forever; ``ARCHIVE_RETENTION_DAYS`` is therefore
+    also how long results stay downloadable.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        retention: timedelta,
+        batch_size: int = 500,
+        max_batches: int = 20,
+        batch_pause: float = 0.5,
+        clock=None,
+    ):
+        self._database = database
+        self._retention = retention
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._batch_pause = batch_pause
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+    async def archive_batch(self) -> int:
+        """Archive one batch of eligible tasks and return how many rows moved."""
+        cutoff = self._clock() - self._retention
+        async with self._database.session() as session:
+            async with session.begin():
+                result = await session.execute(
+                    select(Task.id)
+                    .where(Task.finished_at < cutoff, Task.status.in_(TERMINAL_STATUSES))
+                    .order_by(Task.finished_at)
+                    .limit(self._batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                task_ids = result.scalars().all()
+                if not task_ids:
+                    return 0
+
+                columns = [getattr(Task, name) for name in ARCHIVED_COLUMNS]
+                await session.execute(
+                    insert(TaskArchive).from_select(
+                        list(ARCHIVED_COLUMNS),
+                        select(*columns).where(Task.id.in_(task_ids)),
+                    )
+                )
+                await session.execute(
+                    delete(TaskDependency).where(
+                        or_(
+                            TaskDependency.task_id.in_(task_ids),
+                            TaskDependency.depends_on_id.in_(task_ids),
+                        )
+                    )
+                )
+                await session.execute(
+                    delete(TaskResultChunk).where(TaskResultChunk.task_id.in_(task_ids))
+                )
+                await session.execute(delete(TaskResult).where(TaskResult.task_id.in_(task_ids)))
+                await session.execute(delete(Task).where(Task.id.in_(task_ids)))
+        return len(task_ids)
+
+    async def run_once(self) -> int:
+        """Archive up to ``max_batches`` batches, pausing between them to bound DB load."""
+        archived = 0
+        for _ in range(self._max_batches):
+            moved = await self.archive_batch()
+            archived += moved
+            if moved < self._batch_size:
+                break
+            await asyncio.sleep(self._batch_pause)
+        if archived:
+            logger.info("Archived %s finished task(s)", archived)
+        return archived
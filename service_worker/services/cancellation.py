@@ -0,0 +1,127 @@
+"""Propagation of task cancellations from the API to running handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from redis.asyncio import Redis
+
+from ..infra.cache import CANCEL_CHANNEL
+
+logger = logging.getLogger(__name__)
+
+
+class CancellationRegistry:
+    """Remember cancelled task ids and abort the handlers running them.
+
+    The API publishes the id of every cancelled task on ``CANCEL_CHANNEL``.
+    Deliveries for a remembered id are skipped without touching the
+    database, and a handler that is already running is cancelled so its
+    concurrency slot frees up at once. Only the most recent ``max_ids`` ids
+    are kept; older ones still lose to the CANCELLED row when the processor
+    locks it, just less cheaply.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        *,
+        max_ids: int = 10_000,
+        reconnect_delay: float = 1.0,
+    ):
+        self._redis = redis
+        self._max_ids = max_ids
+        self._reconnect_delay = reconnect_delay
+        self._cancelled: OrderedDict[str, None] = OrderedDict()
+        self._running: dict[str, asyncio.Task] = {}
+        self._aborted: set[str] = set()
+        self._listener: Optional[asyncio.Task] = None
+
+    def is_cancelled(self, task_id: str) -> bool:
+        """True when a cancellation for ``task_id`` has been received."""
+        return task_id in self._cancelled
+
+    def cancel(self, task_id: str) -> bool:
+        """Record a cancellation and abort its running handler; True if one was aborted."""
+        self._cancelled[task_id] = None
+        self._cancelled.move_to_end(task_id)
+        while len(self._cancelled) > self._max_ids:
+            self._cancelled.popitem(last=False)
+
+        running = self._running.get(task_id)
+        if running is None or running.done():
+            return False
+        logger.info("Aborting running handler for cancelled task %s", task_id)
+        self._aborted.add(task_id)
+        running.cancel()
+        return True
+
+    @contextmanager
+    def track(self, task_id: str) -> Iterator[None]:
+        """Make the current asyncio task abortable by a cancellation of ``task_id``.
+
+        An abort issued just as the handler completes can be swallowed on the
+        way (``asyncio.wait_for`` returns a finished result instead of raising)
+        and leave the task cancelling. When the body exits normally with our
+        abort still outstanding, it is withdrawn so it cannot surface in the
+        caller's final state write and requeue a delivery that already ran.
+        """
+        current = asyncio.current_task()
+        self._running[task_id] = current
+        try:
+            yield
+        finally:
+            self._running.pop(task_id, None)
+        if task_id in self._aborted:
+            self._aborted.discard(task_id)
+            current.uncancel()
+
+    def consume_abort(self, task_id: str) -> bool:
+        """Absorb our own abort of the current task; False if it was cancelled for another reason.
+
+        Call from an ``except CancelledError`` block. When this returns True
+        the handler should return normally so its delivery is acknowledged;
+        a shutdown cancellation arriving at the same time still propagates.
+        """
+        if task_id not in self._aborted:
+            return False
+        self._aborted.discard(task_id)
+        return asyncio.current_task().uncancel() == 0
+
+    def start(self) -> None:
+        """Begin listening for cancellations in the background."""
+        if self._listener is None and self._redis is not None:
+            self._listener = asyncio.create_task(self._listen(), name="task-cancellations")
+
+    async def close(self) -> None:
+        """Stop listening for cancellations."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self) -> None:
+        """Subscribe to ``CANCEL_CHANNEL``, resubscribing after Redis errors."""
+        while True:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(CANCEL_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message" and message.get("data"):
+                        self.cancel(message["data"])
+            except Exception as exc:
+                logger.warning(
+                    "Cancellation listener failed: %s. Resubscribing in %.1fs",
+                    exc,
+                    self._reconnect_delay,
+                )
+            finally:
+                await pubsub.close()
+            await asyncio.sleep(self._reconnect_delay)
@@ -0,0 +1,191 @@
+"""Adaptive (AIMD) control of worker concurrency and AMQP prefetch."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Dict, Optional
+
+from taskflow_core.db import PoolStats
+
+logger = logging.getLogger(__name__)
+
+
+def prefetch_for(limit: int, ratio: float) -> int:
+    """Return the AMQP prefetch for ``limit`` slots, rounded up to a power of two.
+
+    Changing prefetch restarts every consumer, so the window only moves when
+    the limit crosses a power-of-two step rather than on each +1/-30% move.
+    """
+    wanted = max(1.0, limit * ratio)
+    return 1 << math.ceil(math.log2(wanted) - 1e-9)
+
+
+@dataclass
+class _Window:
+    completed: int = 0
+    failed: int = 0
+    peak_in_flight: int = 0
+    latency_by_type: Dict[str, list] = field(default_factory=dict)
+
+
+class AdaptiveConcurrencyController:
+    """Additive-increase / multiplicative-decrease tuning of the concurrency limit.
+
+    Every ``interval`` seconds the handlers completed in the window are
+    inspected. Slow handlers, a high error rate or connections queueing on the
+    DB pool shrink the limit by ``decrease_factor``; a window in which every
+    slot was busy and the backends looked healthy adds one slot. The new limit
+    is pushed through ``apply`` (dispatcher slots and AMQP prefetch).
+
+    Latency is judged per task type against that type's own baseline (a moving
+    average of its healthy windows), so a type that always takes minutes does
+    not read as "slow". A window is slow when its completions, weighted by
+    count, ran more than ``latency_tolerance`` times their baselines.
+    """
+
+    def __init__(
+        self,
+        apply: Callable[[int], Awaitable[None]],
+        *,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        latency_tolerance: float,
+        max_error_rate: float,
+        max_pool_wait: float,
+        pool_stats: Optional[Callable[[], PoolStats]] = None,
+        decrease_factor: float = 0.7,
+        interval: float = 5.0,
+        baseline_weight: float = 0.2,
+    ):
+        self._apply = apply
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = min(max(initial, self._minimum), self._maximum)
+        self._latency_tolerance = latency_tolerance
+        self._baseline_weight = baseline_weight
+        self._baselines: Dict[str, float] = {}
+        self._max_error_rate = max_error_rate
+        self._max_pool_wait = max_pool_wait
+        self._pool_stats = pool_stats
+        self._decrease_factor = decrease_factor
+        self._interval = interval
+        self._window = _Window()
+        self._pool_checkouts = 0
+        self._pool_wait_total = 0.0
+        self._runner: Optional[asyncio.Task] = None
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        return self._limit
+
+    def record(self, latency: float, failed: bool, in_flight: int, task_type: str = "default") -> None:
+        """Account for one finished handler run; matches the dispatcher's ``on_complete``."""
+        window = self._window
+        window.completed += 1
+        window.failed += int(failed)
+        window.peak_in_flight = max(window.peak_in_flight, in_flight)
+        totals = window.latency_by_type.setdefault(task_type, [0, 0.0])
+        totals[0] += 1
+        totals[1] += latency
+
+    def evaluate(self) -> int:
+        """Close the current window and return the limit for the next one."""
+        window, self._window = self._window, _Window()
+        pool_wait = self._pool_wait_since_last()
+        if window.completed == 0:
+            return self._limit
+
+        latency = self._latency_ratio(window)
+        error_rate = window.failed / window.completed
+        if (
+            latency > self._latency_tolerance
+            or error_rate > self._max_error_rate
+            or pool_wait > self._max_pool_wait
+        ):
+            limit = max(self._minimum, math.floor(self._limit * self._decrease_factor))
+            reason = "backing off"
+        else:
+            self._update_baselines(window)
+            if window.peak_in_flight < self._limit:
+                return self._limit
+            limit = min(self._maximum, self._limit + 1)
+            reason = "ramping up"
+
+        if limit != self._limit:
+            logger.info(
+                "Concurrency %s -> %s (%s: latency=%.2fx baseline errors=%.0f%% pool_wait=%.3fs)",
+                self._limit,
+                limit,
+                reason,
+                latency,
+                error_rate * 100,
+                pool_wait,
+            )
+        self._limit = limit
+        return limit
+
+    def _latency_ratio(self, window: _Window) -> float:
+        """Count-weighted ratio of this window's latency to each type's baseline."""
+        weighted = 0.0
+        counted = 0
+        for task_type, (count, total) in window.latency_by_type.items():
+            baseline = self._baselines.get(task_type)
+            if not baseline:
+                continue
+            weighted += total / baseline
+            counted += count
+        return weighted / counted if counted else 1.0
+
+    def _update_baselines(self, window: _Window) -> None:
+        """Fold a healthy window's average latency into each type's baseline."""
+        for task_type, (count, total) in window.latency_by_type.items():
+            average = total / count
+            baseline = self._baselines.get(task_type)
+            if baseline is None:
+                self._baselines[task_type] = average
+            else:
+                self._baselines[task_type] = baseline + self._baseline_weight * (average - baseline)
+
+    def start(self) -> None:
+        """Begin periodic evaluation in the background."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop periodic evaluation."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval)
+            previous = self._limit
+            limit = self.evaluate()
+            if limit != previous:
+                try:
+                    await self._apply(limit)
+                except Exception as exc:
+                    logger.warning("Failed to apply concurrency limit %s: %s", limit, exc)
+
+    def _pool_wait_since_last(self) -> float:
+        """Average DB pool checkout wait since the previous evaluation."""
+        if self._pool_stats is None:
+            return 0.0
+        stats = self._pool_stats()
+        checkouts = stats.checkouts - self._pool_checkouts
+        wait_total = stats.wait_seconds_total - self._pool_wait_total
+        self._pool_checkouts = stats.checkouts
+        self._pool_wait_total = stats.wait_seconds_total
+        if checkouts <= 0:
+            return 0.0
+        return wait_total / checkouts
@@ -0,0 +1,94 @@
+"""Preparation of dead-lettered tasks for replay."""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Optional
+
+from sqlalchemy import delete, select, update
+
+from taskflow_core import (
+    TERMINAL_STATUSES,
+    Database,
+    Task,
+    TaskResult,
+    TaskResultChunk,
+    TaskStatus,
+)
+from taskflow_core.schemas import TaskCreatedMessage
+from taskflow_core.stats import TaskStatsRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class FailedTaskReset:
+    """Return a dead-lettered task to PENDING so its replayed delivery runs again.
+
+    Dead-lettering marks the task FAILED, and the processor skips finished
+    tasks, so replaying the message alone would be acknowledged as already
+    done. The reset is one conditional ``UPDATE ... WHERE status = 'FAILED'``,
+    so it cannot race a concurrent transition; any partial result of the
+    failed run is removed in the same transaction.
+
+    Called with a message body, it answers whether the message should be
+    republished: yes when the task was reset or is still unfinished (e.g. a
+    previous replay reset it but failed to publish), no when it is missing or
+    finished some other way (DONE, CANCELLED). Dependents cancelled by the
+    failure stay cancelled.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        *,
+        stats: Optional[TaskStatsRecorder] = None,
+        clock=None,
+    ):
+        self._database = database
+        self._stats = stats
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+    async def __call__(self, body: bytes) -> bool:
+        try:
+            task_id = TaskCreatedMessage.parse_raw(body).task_id
+        except ValueError:
+            # The processor logs and drops malformed payloads itself.
+            return True
+
+        now = self._clock()
+        async with self._database.session() as session:
+            async with session.begin():
+                reset = await session.execute(
+                    update(Task)
+                    .where(Task.id == task_id, Task.status == TaskStatus.FAILED)
+                    .values(
+                        status=TaskStatus.PENDING,
+                        finished_at=None,
+                        progress=0.0,
+                        checkpoint=None,
+                        updated_at=now,
+                    )
+                )
+                if reset.rowcount:
+                    await session.execute(delete(TaskResultChunk).where(TaskResultChunk.task_id == task_id))
+                    await session.execute(delete(TaskResult).where(TaskResult.task_id == task_id))
+                    status = TaskStatus.PENDING
+                else:
+                    status = await session.scalar(select(Task.status).where(Task.id == task_id))
+
+        if reset.rowcount:
+            await self._record_reset(now)
+            return True
+        if status is None or TaskStatus(status) in TERMINAL_STATUSES:
+            logger.info("Dropping dead letter for task %s (%s)", task_id, status or "missing")
+            return False
+        return True
+
+    async def _record_reset(self, now: datetime) -> None:
+        if self._stats is None:
+            return
+        try:
+            await self._stats.record_transition(TaskStatus.FAILED, TaskStatus.PENDING, at=now)
+        except Exception as exc:  # pragma: no cover - relies on external redis
+            logger.warning("Failed to update task statistics: %s", exc)
@@ -0,0 +1,225 @@
+"""Weighted fair dispatching of task deliveries across priority lanes."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import Counter, defaultdict, deque
+from typing import Any, Awaitable, Callable, Mapping, Optional
+
+from aio_pika import IncomingMessage
+
+from taskflow_core import TaskPriority
+
+logger = logging.getLogger(__name__)
+
+
+class PriorityDispatcher:
+    """Buffer deliveries per priority and hand them to the handler by weight.
+
+    Lanes are served with smooth weighted round-robin, so HIGH work is picked
+    most often without starving NORMAL or LOW. The pick happens only when one
+    of the ``concurrency`` handler slots frees up, which keeps a deep bulk lane
+    from occupying every slot ahead of newly arrived interactive work.
+
+    ``type_limits`` caps how many handlers of one task type (as told by
+    ``classify``) run at once. A delivery whose type is at its cap is parked
+    and started ahead of the lanes once a slot of that type frees up, so a
+    slow type never holds the slots other types need. When more deliveries
+    of a type are parked than its cap, the extra ones are handed to
+    ``defer`` (if given) so they stop holding prefetch slots.
+
+    A handler returning ``False`` (or raising) counts as a failed run when
+    reported to ``on_complete`` along with its duration, the number of
+    handlers in flight and its task type.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[IncomingMessage], Awaitable[Any]],
+        weights: Mapping[TaskPriority, int],
+        *,
+        concurrency: int,
+        on_complete: Optional[Callable[[float, bool, int, str], None]] = None,
+        classify: Optional[Callable[[IncomingMessage], str]] = None,
+        type_limits: Optional[Mapping[str, int]] = None,
+        defer: Optional[Callable[[IncomingMessage], Awaitable[None]]] = None,
+    ):
+        self._handler = handler
+        self._on_complete = on_complete
+        self._weights = {priority: max(1, int(weight)) for priority, weight in weights.items()}
+        self._lanes: dict[TaskPriority, deque[IncomingMessage]] = {
+            priority: deque() for priority in self._weights
+        }
+        self._credit = {priority: 0 for priority in self._weights}
+        self._classify = classify
+        self._type_limits = {name: max(1, int(limit)) for name, limit in (type_limits or {}).items()}
+        self._defer = defer
+        self._running_types: Counter[str] = Counter()
+        self._parked: defaultdict[str, deque[IncomingMessage]] = defaultdict(deque)
+        self._limit = max(1, concurrency)
+        self._in_flight = 0
+        self._slot_freed = asyncio.Event()
+        self._ready = asyncio.Event()
+        self._tasks: set[asyncio.Task] = set()
+        self._runner: Optional[asyncio.Task] = None
+        self._draining = False
+
+    async def submit(self, priority: TaskPriority, message: IncomingMessage) -> None:
+        """Queue a delivery on its priority lane; used as the AMQP consume callback."""
+        if self._draining:
+            await self._requeue(message)
+            return
+        self._lanes[TaskPriority(priority)].append(message)
+        self._ready.set()
+
+    def start(self) -> None:
+        """Begin dispatching buffered deliveries in the background."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop dispatching and wait for in-flight handlers to finish."""
+        await self._stop_runner()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def drain(self, timeout: float) -> int:
+        """Shut down without losing deliveries and return how many handlers were cut short.
+
+        Buffered deliveries that never started are requeued at once so other
+        workers can take them. In-flight handlers get ``timeout`` seconds to
+        finish; any still running are cancelled, which rejects their delivery
+        with requeue so it is redelivered rather than lost.
+        """
+        self._draining = True
+        await self._stop_runner()
+        for lane in [*self._lanes.values(), *self._parked.values()]:
+            while lane:
+                await self._requeue(lane.popleft())
+
+        if not self._tasks:
+            return 0
+        _, pending = await asyncio.wait(set(self._tasks), timeout=max(0.0, timeout))
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning("Cancelled %s handler(s) still running at the drain deadline", len(pending))
+            await asyncio.gather(*pending, return_exceptions=True)
+        return len(pending)
+
+    def pending(self) -> dict[TaskPriority, int]:
+        """Return the number of buffered deliveries per priority."""
+        return {priority: len(lane) for priority, lane in self._lanes.items()}
+
+    def parked(self) -> dict[str, int]:
+        """Return the number of deliveries waiting for a slot of their task type."""
+        return {name: len(queue) for name, queue in self._parked.items() if queue}
+
+    @property
+    def limit(self) -> int:
+        """Maximum number of handlers allowed to run concurrently."""
+        return self._limit
+
+    @property
+    def in_flight(self) -> int:
+        """Number of handlers currently running."""
+        return self._in_flight
+
+    def set_limit(self, limit: int) -> None:
+        """Change the concurrency limit; running handlers are never interrupted."""
+        self._limit = max(1, limit)
+        self._slot_freed.set()
+
+    async def _stop_runner(self) -> None:
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _requeue(self, message: IncomingMessage) -> None:
+        try:
+            await message.nack(requeue=True)
+        except Exception as exc:
+            # The broker requeues unacked deliveries anyway once the channel closes.
+            logger.warning("Could not requeue buffered delivery: %s", exc)
+
+    async def _run(self) -> None:
+        while True:
+            while self._in_flight >= self._limit:
+                self._slot_freed.clear()
+                await self._slot_freed.wait()
+            message, kind = await self._next()
+            self._in_flight += 1
+            self._running_types[kind] += 1
+            task = asyncio.create_task(self._execute(message, kind))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _next(self) -> tuple[IncomingMessage, str]:
+        while True:
+            for kind, parked in self._parked.items():
+                if parked and self._has_room(kind):
+                    return parked.popleft(), kind
+            priority = self._select()
+            if priority is None:
+                self._ready.clear()
+                await self._ready.wait()
+                continue
+            message = self._lanes[priority].popleft()
+            kind = self._classify(message) if self._classify is not None else ""
+            if self._has_room(kind):
+                return message, kind
+            await self._park(kind, message)
+
+    def _has_room(self, kind: str) -> bool:
+        limit = self._type_limits.get(kind)
+        return limit is None or self._running_types[kind] < limit
+
+    async def _park(self, kind: str, message: IncomingMessage) -> None:
+        parked = self._parked[kind]
+        if self._defer is None or len(parked) < self._type_limits[kind]:
+            parked.append(message)
+            return
+        try:
+            await self._defer(message)
+        except Exception as exc:
+            logger.warning("Could not defer delivery of task type %s: %s", kind, exc)
+            parked.append(message)
+
+    def _select(self) -> Optional[TaskPriority]:
+        """Pick the next lane using smooth weighted round-robin over non-empty lanes."""
+        total = 0
+        chosen: Optional[TaskPriority] = None
+        for priority, lane in self._lanes.items():
+            if not lane:
+                self._credit[priority] = 0
+                continue
+            weight = self._weights[priority]
+            self._credit[priority] += weight
+            total += weight
+            if chosen is None or self._credit[priority] > self._credit[chosen]:
+                chosen = priority
+        if chosen is not None:
+            self._credit[chosen] -= total
+        return chosen
+
+    async def _execute(self, message: IncomingMessage, kind: str) -> None:
+        started = time.perf_counter()
+        failed = True
+        try:
+            failed = await self._handler(message) is False
+        except Exception as exc:
+            logger.exception("Unhandled error while dispatching message", exc_info=exc)
+        finally:
+            if self._on_complete is not None:
+                self._on_complete(time.perf_counter() - started, failed, self._in_flight, kind)
+            self._in_flight -= 1
+            self._running_types[kind] -= 1
+            self._slot_freed.set()
+            if self._parked.get(kind):
+                self._ready.set()
@@ -0,0 +1,150 @@
+"""Execution backends that run task handlers on the loop, a thread pool or a process pool."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+from concurrent.futures import BrokenExecutor, Executor, ThreadPoolExecutor
+from enum import Enum
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ExecutionMode(str, Enum):
+    """Where a handler runs relative to the worker's event loop."""
+
+    LOOP = "loop"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class HandlerTimeoutError(Exception):
+    """Raised when a handler exceeds its time budget."""
+
+
+class HandlerExecutor:
+    """Run handlers with a per-call timeout, off the event loop when configured.
+
+    ``loop`` calls the handler inline (coroutine handlers are awaited),
+    ``thread`` suits code that releases the GIL, and ``process`` spreads CPU
+    bound work across cores. A running thread cannot be interrupted. A
+    process-pool job that times out or is cancelled keeps its child process
+    busy, so the pool is retired: new work goes to a fresh pool, and once the
+    other calls still running on the retired pool return, its remaining
+    (hung) child processes are terminated instead of being left behind.
+    """
+
+    def __init__(
+        self,
+        mode: ExecutionMode | str = ExecutionMode.LOOP,
+        *,
+        max_workers: Optional[int] = None,
+    ):
+        self._mode = ExecutionMode(mode)
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._pool: Optional[Executor] = None
+        self._in_flight: Dict[Executor, int] = {}
+        self._retired: Dict[Executor, List[Any]] = {}
+
+    @property
+    def mode(self) -> ExecutionMode:
+        """Execution mode used for every handler call."""
+        return self._mode
+
+    async def run(
+        self,
+        handler: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Execute ``handler(*args)`` and return its result."""
+        pool: Optional[Executor] = None
+        if inspect.iscoroutinefunction(handler):
+            if self._mode is not ExecutionMode.LOOP:
+                raise TypeError("Coroutine handlers can only run in 'loop' mode")
+            awaitable = handler(*args)
+        elif self._mode is ExecutionMode.LOOP:
+            return handler(*args)
+        else:
+            pool = self._executor()
+            awaitable = asyncio.get_running_loop().run_in_executor(pool, partial(handler, *args))
+            self._in_flight[pool] = self._in_flight.get(pool, 0) + 1
+
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError as exc:
+            self._abandon(pool)
+            raise HandlerTimeoutError(f"Handler exceeded its {timeout:.1f}s timeout") from exc
+        except asyncio.CancelledError:
+            self._abandon(pool)
+            raise
+        except BrokenExecutor:
+            self._recycle(pool)
+            raise
+        finally:
+            if pool is not None:
+                self._release(pool)
+
+    def close(self) -> None:
+        """Shut the pool down without waiting for abandoned work."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        for pool in list(self._retired):
+            self._terminate(pool)
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self._mode is ExecutionMode.PROCESS:
+                # Imported lazily: multiprocessing is only needed in process mode.
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="task-handler",
+                )
+        return self._pool
+
+    def _abandon(self, pool: Optional[Executor]) -> None:
+        """Stop waiting on a handler; recycle the process pool so its slot is not lost."""
+        if self._mode is ExecutionMode.PROCESS:
+            self._recycle(pool)
+
+    def _recycle(self, pool: Optional[Executor]) -> None:
+        """Send new work to a fresh pool; the old one drains its queued jobs and exits."""
+        if pool is not None and pool is self._pool:
+            logger.warning("Recycling %s handler pool", self._mode.value)
+            if self._mode is ExecutionMode.PROCESS:
+                # ProcessPoolExecutor drops its process table on shutdown, so
+                # keep the handles to terminate whatever is still hung later.
+                self._retired[pool] = list((getattr(pool, "_processes", None) or {}).values())
+            pool.shutdown(wait=False, cancel_futures=False)
+            self._pool = None
+
+    def _release(self, pool: Executor) -> None:
+        """Account for a finished call; reap a retired pool once nothing awaits it."""
+        remaining = self._in_flight.get(pool, 1) - 1
+        if remaining > 0:
+            self._in_flight[pool] = remaining
+            return
+        self._in_flight.pop(pool, None)
+        if pool in self._retired:
+            self._terminate(pool)
+
+    def _terminate(self, pool: Executor) -> None:
+        """Kill the child processes a retired pool still has running."""
+        hung = [process for process in self._retired.pop(pool, ()) if process.is_alive()]
+        for process in hung:
+            process.terminate()
+        if hung:
+            logger.warning("Terminated %s hung handler process(es)", len(hung))
@@ -0,0 +1,45 @@
+"""Built-in task payload handlers executed by the worker.
+
+Handlers are plain module-level functions so they can be shipped to a thread
+or process pool; they must not touch the database, Redis or the event loop.
+A handler that declares a ``progress`` keyword receives a reporter it can
+call with its progress and a resumable checkpoint (loop and thread modes).
+Output returned in ``HandlerResult.result`` is stored with the final status.
+
+Each task type maps to a handler in ``registry``. Modules listed in
+``WORKER_HANDLER_MODULES`` are imported at startup and register their own
+types there with ``@registry.register(...)``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from taskflow_core import DEFAULT_TASK_TYPE, TaskStatus
+
+from .registry import HandlerRegistry
+
+
+@dataclass(frozen=True)
+class HandlerResult:
+    """Terminal outcome reported by a handler.
+
+    ``result`` may be bytes, text or any JSON-serialisable value.
+    """
+
+    status: TaskStatus
+    message: Optional[str] = None
+    result: Any = None
+
+
+registry = HandlerRegistry()
+
+
+@registry.register(DEFAULT_TASK_TYPE)
+def evaluate_payload(payload: dict[str, Any]) -> HandlerResult:
+    """Default handler: succeed when the payload carries a ``message`` field."""
+    if "message" in payload:
+        message = payload.get("message")
+        return HandlerResult(TaskStatus.DONE, None if message is None else str(message))
+    return HandlerResult(TaskStatus.FAILED, "Payload missing required 'message' field")
@@ -0,0 +1,110 @@
+"""Handler throughput measurement and the worker's Prometheus scrape endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
+
+from taskflow_core.metrics import CONTENT_TYPE
+
+logger = logging.getLogger(__name__)
+
+_READ_TIMEOUT = 5.0
+
+
+class ThroughputMeter:
+    """Completions per second and mean handler time over a sliding window.
+
+    Fed from the dispatcher's ``on_complete`` hook; entries older than
+    ``window`` seconds are dropped, so memory is bounded by the completion
+    rate rather than the worker's uptime.
+    """
+
+    def __init__(self, *, window: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self._window = window
+        self._clock = clock
+        self._started = clock()
+        self._completions: deque[tuple[float, float]] = deque()
+
+    def record(self, duration: float) -> None:
+        """Count one finished handler that ran for ``duration`` seconds."""
+        self._completions.append((self._clock(), duration))
+        self._prune()
+
+    def rate(self) -> float:
+        """Completions per second over the window (or the uptime, while shorter)."""
+        self._prune()
+        span = min(self._window, max(self._clock() - self._started, 1e-9))
+        return len(self._completions) / span
+
+    def mean_duration(self) -> Optional[float]:
+        """Average handler time over the window; None before anything finished."""
+        self._prune()
+        if not self._completions:
+            return None
+        return sum(duration for _, duration in self._completions) / len(self._completions)
+
+    def _prune(self) -> None:
+        cutoff = self._clock() - self._window
+        while self._completions and self._completions[0][0] < cutoff:
+            self._completions.popleft()
+
+
+class MetricsServer:
+    """Minimal HTTP/1.1 server answering ``GET /metrics`` with ``render()``.
+
+    The worker has no web framework, and a scrape endpoint needs none: one
+    request per connection, no keep-alive, everything else is a 404.
+    """
+
+    def __init__(self, render: Callable[[], Awaitable[str]], *, host: str, port: int):
+        self._render = render
+        self._host = host
+        self._port = port
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def port(self) -> int:
+        """Bound port; differs from the configured one when that was 0."""
+        if self._server is None or not self._server.sockets:
+            return self._port
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self._handle, self._host, self._port)
+
+    async def close(self) -> None:
+        """Stop listening and wait for the server to shut down."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), _READ_TIMEOUT)
+            while (await asyncio.wait_for(reader.readline(), _READ_TIMEOUT)) not in (b"\r\n", b"\n", b""):
+                pass
+            method, path, *_ = request_line.decode("latin-1").split() or ("", "")
+            if method == "GET" and path.split("?", 1)[0] == "/metrics":
+                try:
+                    status, body = "200 OK", (await self._render()).encode()
+                except Exception as exc:
+                    logger.warning("Failed to render worker metrics: %s", exc)
+                    status, body = "500 Internal Server Error", b""
+            else:
+                status, body = "404 Not Found", b""
+            writer.write(
+                f"HTTP/1.1 {status}\r\nContent-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("latin-1")
+                + body
+            )
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
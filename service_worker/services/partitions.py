@@ -0,0 +1,105 @@
+"""Assignment of queue partitions to the workers that are currently alive."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from typing import AbstractSet, Awaitable, Callable, Iterable, Optional
+
+from redis.asyncio import Redis
+
+logger = logging.getLogger(__name__)
+
+PARTITION_MEMBERS_KEY = "taskflow:workers:partitions"
+
+
+def _weight(member: str, partition: int) -> int:
+    digest = hashlib.blake2b(f"{member}:{partition}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def rendezvous_owner(members: Iterable[str], partition: int) -> str:
+    """Return the member with the highest rendezvous hash for ``partition``."""
+    return max(members, key=lambda member: (_weight(member, partition), member))
+
+
+def assign_partitions(worker_id: str, members: Iterable[str], partitions: int) -> set[int]:
+    """Return the partitions owned by ``worker_id`` among ``members``.
+
+    Every worker computes the same answer from the same member list, and a
+    worker joining or leaving only moves the partitions it gains or loses.
+    """
+    members = set(members) | {worker_id}
+    return {
+        partition
+        for partition in range(partitions)
+        if rendezvous_owner(members, partition) == worker_id
+    }
+
+
+class PartitionRebalancer:
+    """Keep this worker's partition assignment in step with the live worker set.
+
+    Each run refreshes the worker's heartbeat in a Redis sorted set, drops
+    members whose heartbeat is older than ``member_ttl`` and hands the
+    worker's rendezvous-hash share of the partitions to ``assign`` when it
+    changed. Workers converge within one interval of a join or leave; during
+    that window a partition may be claimed twice or briefly by nobody, which
+    single-active-consumer queues turn into a short pause, not reordering.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        assign: Callable[[AbstractSet[int]], Awaitable[None]],
+        *,
+        worker_id: str,
+        partitions: int,
+        member_ttl: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self._redis = redis
+        self._assign = assign
+        self._worker_id = worker_id
+        self._partitions = partitions
+        self._member_ttl = member_ttl
+        self._clock = clock
+        self._assigned: Optional[frozenset[int]] = None
+
+    @property
+    def assigned(self) -> Optional[frozenset[int]]:
+        """Partitions handed to ``assign`` by the last run, None before the first one."""
+        return self._assigned
+
+    async def run_once(self) -> frozenset[int]:
+        """Refresh membership and reassign partitions if the owner set changed."""
+        now = self._clock()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(PARTITION_MEMBERS_KEY, {self._worker_id: now})
+            pipe.zremrangebyscore(PARTITION_MEMBERS_KEY, "-inf", now - self._member_ttl)
+            pipe.zrange(PARTITION_MEMBERS_KEY, 0, -1)
+            *_, members = await pipe.execute()
+        members = {
+            member.decode() if isinstance(member, bytes) else member for member in members
+        }
+        assigned = frozenset(assign_partitions(self._worker_id, members, self._partitions))
+        if assigned != self._assigned:
+            logger.info(
+                "Worker %s now owns %d/%d partition(s) across %d worker(s): %s",
+                self._worker_id,
+                len(assigned),
+                self._partitions,
+                len(members),
+                sorted(assigned),
+            )
+            await self._assign(assigned)
+            self._assigned = assigned
+        return assigned
+
+    async def close(self) -> None:
+        """Leave the worker set so the others pick up our partitions on their next run."""
+        try:
+            await self._redis.zrem(PARTITION_MEMBERS_KEY, self._worker_id)
+        except Exception as exc:  # pragma: no cover - relies on external redis
+            logger.warning("Failed to leave the partition member set: %s", exc)
@@ -0,0 +1,51 @@
+"""Background runner for periodic worker maintenance jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """Run an async callable every ``interval`` seconds until closed.
+
+    Failures are logged and the job keeps its schedule, so a transient DB or
+    Redis outage never stops maintenance for the life of the worker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], Awaitable[object]],
+        interval: float,
+    ):
+        self._name = name
+        self._func = func
+        self._interval = interval
+        self._runner: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Begin running the job in the background."""
+        if self._runner is None:
+            self._runner = asyncio.create_task(self._run(), name=self._name)
+
+    async def close(self) -> None:
+        """Stop the job, cancelling a run that is in progress."""
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._func()
+            except Exception as exc:
+                logger.warning("Periodic job %s failed: %s", self._name, exc)
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,53 @@
+"""Periodic detection of connection pool starvation in the worker."""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Mapping
+
+logger = logging.getLogger(__name__)
+
+
+PoolMetrics = Callable[[], Mapping[str, float]]
+
+
+class PoolMonitor:
+    """Warn when callers queue on a pool for longer than ``max_wait`` or time out.
+
+    Each run compares the pool counters with the previous run, so a single
+    slow checkout long ago does not keep raising warnings.
+    """
+
+    def __init__(self, pools: Mapping[str, PoolMetrics], *, max_wait: float):
+        self._pools = dict(pools)
+        self._max_wait = max_wait
+        self._previous: dict[str, Mapping[str, float]] = {}
+
+    async def run_once(self) -> list[str]:
+        """Check every pool and return the names of the starved ones."""
+        starved: list[str] = []
+        for name, read_metrics in self._pools.items():
+            metrics = read_metrics()
+            if not metrics:
+                continue
+            previous = self._previous.get(name, {})
+            self._previous[name] = dict(metrics)
+
+            checkouts = metrics["checkouts"] - previous.get("checkouts", 0)
+            waited = metrics["wait_seconds_total"] - previous.get("wait_seconds_total", 0.0)
+            timeouts = metrics["timeouts"] - previous.get("timeouts", 0)
+            average_wait = waited / checkouts if checkouts else 0.0
+            if timeouts or average_wait > self._max_wait:
+                starved.append(name)
+                logger.warning(
+                    "Connection pool %s starved: %s checked out of %s, %s waiting, "
+                    "avg wait %.3fs over %s checkouts, %s timeouts",
+                    name,
+                    metrics.get("checked_out"),
+                    metrics.get("size"),
+                    metrics["waiting"],
+                    average_wait,
+                    checkouts,
+                    timeouts,
+                )
+        return starved
@@ -4,47 +4,314 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import BrokenExecutor
 from datetime import datetime, timezone
-from typing import Any, Dict
+from functools import partial
+from typing import Any, Awaitable, Callable, Mapping, Optional
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from taskflow_core import Task, TaskStatus, TaskStatusMessage
+from taskflow_core import (
+    Database,
+    TERMINAL_STATUSES,
+    Task,
+    TaskRead,
+    TaskStatus,
+    TaskStatusMessage,
+)
+from taskflow_core.dependencies import resolve_dependents
+from taskflow_core.results import encode_result, result_rows
+from taskflow_core.schemas import TaskCreatedMessage
+from taskflow_core.state import TaskStateCache
+from taskflow_core.stats import TaskStatsRecorder
+
+from .cancellation import CancellationRegistry
+from .executor import ExecutionMode, HandlerExecutor
+from .handlers import HandlerResult, registry as default_registry
+from .progress import ProgressBuffer, ProgressReporter
+from .registry import HandlerRegistry, TaskType, UnknownTaskType
 
 logger = logging.getLogger(__name__)
 
 
+def _snapshot(task: Task) -> TaskRead:
+    return TaskRead(
+        task_id=task.id,
+        title=task.title,
+        payload=task.payload,
+        status=task.status,
+        priority=task.priority,
+        created_at=task.created_at,
+        updated_at=task.updated_at,
+        finished_at=task.finished_at,
+        run_at=task.run_at,
+        task_type=task.task_type,
+    )
+
+
 class TaskProcessor:
-    """Update task lifecycle state and emit status messages."""
+    """Update task lifecycle state and emit status messages.
+
+    Database and Redis I/O stays on the event loop in short-lived sessions,
+    while the payload handler runs through a :class:`HandlerExecutor` so CPU
+    heavy work does not stall heartbeats and acks. Infrastructure errors
+    propagate to the caller for retrying; handler errors fail the task.
+
+    The handler, timeout and executor come from the ``registry`` entry of
+    the task's type; types asking for another execution mode than
+    ``executor`` run on the matching entry of ``executors``. Tasks of an
+    unknown type fail without running.
+
+    With ``cancellations`` set, deliveries for cancelled tasks are dropped
+    before any database work and a running handler is abandoned as soon as
+    its task is cancelled; either way the delivery is acknowledged.
+
+    A terminal transition also releases the tasks depending on this one in
+    the same transaction; dependents that became ready are handed to
+    ``enqueue`` before the commit, as the scheduler does.
+
+    Handlers that take a ``progress`` keyword receive a
+    :class:`ProgressReporter` (except in process mode, where it cannot be
+    shipped to the child) whose writes are batched through ``progress``.
 
-    def __init__(self, redis_publisher, clock=None):
+    A handler's ``result`` is encoded before the final transaction and
+    written in it, so a task is never DONE without its output; a result that
+    cannot be encoded fails the task instead.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        redis_publisher,
+        executor: HandlerExecutor,
+        *,
+        registry: HandlerRegistry = default_registry,
+        executors: Optional[Mapping[ExecutionMode, HandlerExecutor]] = None,
+        timeout: Optional[float] = None,
+        stats: Optional[TaskStatsRecorder] = None,
+        state: Optional[TaskStateCache] = None,
+        cancellations: Optional[CancellationRegistry] = None,
+        enqueue: Optional[Callable[[TaskCreatedMessage], Awaitable[None]]] = None,
+        progress: Optional[ProgressBuffer] = None,
+        progress_publish_interval: float = 0.5,
+        clock=None,
+    ):
+        self._database = database
         self._redis = redis_publisher
+        self._executor = executor
+        self._registry = registry
+        self._executors = dict(executors or {})
+        self._timeout = timeout
+        self._stats = stats
+        self._state = state
+        self._cancellations = cancellations
+        self._enqueue = enqueue
+        self._progress = progress
+        self._progress_publish_interval = progress_publish_interval
         self._clock = clock or (lambda: datetime.now(timezone.utc))
 
+    async def process(self, event: TaskCreatedMessage) -> None:
+        """Drive the full lifecycle for a task from PROCESSING to terminal status."""
+        if self._cancellations is not None and self._cancellations.is_cancelled(event.task_id):
+            logger.info("Skipping cancelled task %s", event.task_id)
+            return
+        try:
+            task_type = self._registry.get(event.task_type)
+        except UnknownTaskType as exc:
+            logger.warning("Failing task %s: %s", event.task_id, exc)
+            await self._transition(event.task_id, TaskStatus.FAILED, progress=1.0, message=str(exc))
+            return
+        executor = self._executor_for(task_type)
+
+        task = await self._transition(event.task_id, TaskStatus.PROCESSING, progress=0.1)
+        if task is None:
+            return
+
+        reporter = self._reporter(event.task_id, task.checkpoint, task_type, executor)
+        try:
+            result = await self._run_handler(event, task_type, executor, reporter)
+        except asyncio.CancelledError:
+            if self._cancellations is None or not self._cancellations.consume_abort(event.task_id):
+                raise
+            logger.info("Task %s cancelled while processing", event.task_id)
+            return
+        except BrokenExecutor:
+            raise
+        except Exception as exc:
+            logger.exception("Task %s failed during processing", event.task_id, exc_info=exc)
+            result = HandlerResult(TaskStatus.FAILED, str(exc) or type(exc).__name__)
+
+        output = None
+        if result.result is not None:
+            try:
+                output = encode_result(result.result)
+            except (TypeError, ValueError) as exc:
+                logger.warning("Task %s returned an unstorable result: %s", event.task_id, exc)
+                result = HandlerResult(TaskStatus.FAILED, f"Unstorable result: {exc}")
+
+        if reporter is not None:
+            await reporter.close()
+        await self._transition(
+            event.task_id,
+            result.status,
+            progress=1.0,
+            message=result.message,
+            output=output,
+        )
+
+    def _executor_for(self, task_type: TaskType) -> HandlerExecutor:
+        mode = task_type.executor
+        if mode is None or mode is self._executor.mode:
+            return self._executor
+        try:
+            return self._executors[mode]
+        except KeyError:
+            raise RuntimeError(f"No {mode.value} executor configured for {task_type.name!r}") from None
+
+    def _reporter(
+        self,
+        task_id: str,
+        checkpoint: Any,
+        task_type: TaskType,
+        executor: HandlerExecutor,
+    ) -> Optional[ProgressReporter]:
+        if (
+            self._progress is None
+            or not task_type.accepts_progress
+            or executor.mode is ExecutionMode.PROCESS
+        ):
+            return None
+        return ProgressReporter(
+            task_id,
+            publish=self._redis.publish,
+            buffer=self._progress,
+            checkpoint=checkpoint,
+            publish_interval=self._progress_publish_interval,
+        )
+
+    async def _run_handler(
+        self,
+        event: TaskCreatedMessage,
+        task_type: TaskType,
+        executor: HandlerExecutor,
+        reporter: Optional[ProgressReporter] = None,
+    ) -> HandlerResult:
+        """Run the type's handler, abortable through the cancellation registry."""
+        handler = task_type.handler
+        if reporter is not None:
+            handler = partial(handler, progress=reporter)
+        timeout = task_type.timeout if task_type.timeout is not None else self._timeout
+        run = executor.run(handler, event.payload or {}, timeout=timeout)
+        if self._cancellations is None:
+            return await run
+        with self._cancellations.track(event.task_id):
+            return await run
+
+    async def mark_failed(self, task_id: str, reason: str) -> None:
+        """Best-effort FAILED transition for a task whose delivery was given up on."""
+        try:
+            await self._transition(task_id, TaskStatus.FAILED, progress=1.0, message=reason)
+        except Exception as exc:
+            logger.warning("Could not mark task %s as FAILED: %s", task_id, exc)
+
     async def _transition(
         self,
-        session: AsyncSession,
-        task: Task,
+        task_id: str,
         status: TaskStatus,
         *,
         progress: float,
         message: str | None = None,
-    ) -> None:
-        """Persist a new status for the task and broadcast the progress update."""
-        task.status = status
-        task.updated_at = self._clock()
-        if status in (TaskStatus.DONE, TaskStatus.FAILED):
-            task.finished_at = task.updated_at
-        session.add(task)
-        await session.commit()
-        await session.refresh(task)
+        output: Optional[tuple[bytes, str]] = None,
+    ) -> Optional[Task]:
+        """Persist a new status and broadcast it; None when the task is missing or finished.
+
+        The row is locked while it is read so a concurrent cancellation from
+        the API is never overwritten by the handler's final status.
+        """
+        now = self._clock()
+        async with self._database.session() as session:
+            result = await session.execute(
+                select(Task).where(Task.id == task_id).with_for_update()
+            )
+            task = result.scalar_one_or_none()
+            if task is None:
+                logger.warning("Task %s not found while moving to %s", task_id, status.value)
+                return None
+            if task.status in TERMINAL_STATUSES:
+                logger.info("Task %s already completed with status %s", task.id, task.status)
+                return None
+            if task.status in (TaskStatus.SCHEDULED, TaskStatus.WAITING):
+                # Published by a scheduler or dependency transaction that rolled back.
+                logger.info("Task %s is not ready yet; skipping", task.id)
+                return None
+
+            previous = task.status
+            started_at = task.updated_at
+            task.status = status
+            task.updated_at = now
+            task.finished_at = now if status in TERMINAL_STATUSES else None
+            session.add(task)
+            dependents = []
+            if status in TERMINAL_STATUSES:
+                task.progress = 1.0
+                task.checkpoint = None
+                if self._progress is not None:
+                    self._progress.discard(task.id)
+                if output is not None:
+                    session.add_all(result_rows(task.id, *output))
+                dependents = await resolve_dependents(session, task.id, status, now)
+                await self._enqueue_ready([dependent for dependent, _ in dependents], now)
+            await session.commit()
+            snapshot = _snapshot(task)
+            released = [(_snapshot(dependent), waited) for dependent, waited in dependents]
 
+        await self._announce(snapshot, previous, now, started_at, progress=progress, message=message)
+        for dependent, waited in released:
+            finished = TaskStatus(dependent.status) in TERMINAL_STATUSES
+            await self._announce(dependent, waited, now, None, progress=1.0 if finished else 0.0)
+        return task
+
+    async def _enqueue_ready(self, tasks: list[Task], now: datetime) -> None:
+        """Publish the dependents that became PENDING; SCHEDULED ones wait for the scheduler."""
+        ready = [task for task in tasks if task.status == TaskStatus.PENDING]
+        if not ready:
+            return
+        if self._enqueue is None:
+            raise RuntimeError("Dependent tasks are ready but no enqueue callback is configured.")
+        await asyncio.gather(
+            *(
+                self._enqueue(
+                    TaskCreatedMessage(
+                        task_id=task.id,
+                        payload=task.payload,
+                        priority=task.priority,
+                        requested_at=now,
+                        partition_key=task.partition_key,
+                        task_type=task.task_type,
+                    )
+                )
+                for task in ready
+            )
+        )
+
+    async def _announce(
+        self,
+        snapshot: TaskRead,
+        previous: TaskStatus,
+        now: datetime,
+        started_at: Optional[datetime],
+        *,
+        progress: float,
+        message: str | None = None,
+    ) -> None:
+        """Record, cache and broadcast a committed transition."""
+        await self._record_transition(previous, TaskStatus(snapshot.status), now, started_at)
+        await self._cache_state(snapshot)
         status_message = TaskStatusMessage(
-            task_id=task.id,
-            status=task.status,
+            task_id=snapshot.task_id,
+            status=snapshot.status,
             progress=progress,
-            updated_at=task.updated_at,
+            updated_at=now,
             message=message,
         )
         try:
@@ -52,30 +319,31 @@ class TaskProcessor:
         except Exception as exc:  # pragma: no cover - relies on external redis
             logger.warning("Failed to publish Redis message: %s", exc)
 
-    async def _simulate_work(self, payload: Dict[str, Any]) -> None:
-        """Placeholder work stage to mimic a long-running computation."""
-        await asyncio.sleep(1)
-
-    async def process(self, session: AsyncSession, task_id: str, payload: Dict[str, Any] | None) -> None:
-        """Drive the full lifecycle for a task from PROCESSING to terminal status."""
-        query = select(Task).where(Task.id == task_id)
-        result = await session.execute(query)
-        task = result.scalar_one_or_none()
-        if task is None:
-            logger.warning("Received task %s but it does not exist in the database", task_id)
+    async def _record_transition(
+        self,
+        previous: TaskStatus,
+        status: TaskStatus,
+        now: datetime,
+        started_at: Optional[datetime],
+    ) -> None:
+        """Update the statistics counters; processing time is measured from PROCESSING."""
+        if self._stats is None:
             return
+        duration = None
+        if previous == TaskStatus.PROCESSING and started_at is not None:
+            if started_at.tzinfo is None:
+                started_at = started_at.replace(tzinfo=timezone.utc)
+            duration = max(0.0, (now - started_at).total_seconds())
+        try:
+            await self._stats.record_transition(previous, status, at=now, duration=duration)
+        except Exception as exc:  # pragma: no cover - relies on external redis
+            logger.warning("Failed to update task statistics: %s", exc)
 
-        if task.status in (TaskStatus.DONE, TaskStatus.FAILED):
-            logger.info("Task %s already completed with status %s", task.id, task.status)
+    async def _cache_state(self, snapshot: TaskRead) -> None:
+        """Refresh the cached task state used by bulk lookups."""
+        if self._state is None:
             return
-
-        await self._transition(session, task, TaskStatus.PROCESSING, progress=0.1)
-
         try:
-            await self._simulate_work(payload or {})
-        except Exception as exc:
-            logger.exception("Task %s failed during processing", task.id, exc_info=exc)
-            await self._transition(session, task, TaskStatus.FAILED, progress=1.0, message=str(exc))
-            return
-
-        await self._transition(session, task, TaskStatus.DONE, progress=1.0)
+            await self._state.store(snapshot)
+        except Exception as exc:  # pragma: no cover - relies on external redis
+            logger.warning("Failed to cache task state: %s", exc)
@@ -0,0 +1,175 @@
+"""Throttled progress reporting and checkpoints for running handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import bindparam, update
+
+from taskflow_core import Database, Task, TaskStatus, TaskStatusMessage
+
+logger = logging.getLogger(__name__)
+
+
+_UNSET = object()
+
+
+class ProgressBuffer:
+    """Keep the latest progress and checkpoint per task and write them in batches.
+
+    Reports only replace the buffered values, so a handler reporting
+    hundreds of times between flushes still costs one row update. Each flush
+    is a single executemany in one transaction. Rows that are no longer
+    PROCESSING are left alone, and ``updated_at`` is pinned so the MySQL
+    ``ON UPDATE`` clause does not move it: ETags and processing durations
+    keep tracking status changes only.
+    """
+
+    def __init__(self, database: Database):
+        self._database = database
+        self._progress: dict[str, float] = {}
+        self._checkpoints: dict[str, Any] = {}
+
+    def update(self, task_id: str, progress: float, checkpoint: Any = _UNSET) -> None:
+        """Buffer the latest values reported for ``task_id``."""
+        self._progress[task_id] = progress
+        if checkpoint is not _UNSET:
+            self._checkpoints[task_id] = checkpoint
+
+    def discard(self, task_id: str) -> None:
+        """Drop buffered values for a task that is about to finish."""
+        self._progress.pop(task_id, None)
+        self._checkpoints.pop(task_id, None)
+
+    async def flush(self) -> int:
+        """Persist everything buffered so far and return how many tasks were written."""
+        if not self._progress:
+            return 0
+        progress, self._progress = self._progress, {}
+        checkpoints, self._checkpoints = self._checkpoints, {}
+
+        table = Task.__table__
+        guard = (table.c.id == bindparam("b_task_id"), table.c.status == TaskStatus.PROCESSING)
+        plain = [
+            {"b_task_id": task_id, "b_progress": value}
+            for task_id, value in progress.items()
+            if task_id not in checkpoints
+        ]
+        with_checkpoint = [
+            {"b_task_id": task_id, "b_progress": value, "b_checkpoint": checkpoints[task_id]}
+            for task_id, value in progress.items()
+            if task_id in checkpoints
+        ]
+        try:
+            async with self._database.session() as session:
+                if plain:
+                    await session.execute(
+                        update(table)
+                        .where(*guard)
+                        .values(progress=bindparam("b_progress"), updated_at=table.c.updated_at),
+                        plain,
+                    )
+                if with_checkpoint:
+                    await session.execute(
+                        update(table)
+                        .where(*guard)
+                        .values(
+                            progress=bindparam("b_progress"),
+                            checkpoint=bindparam("b_checkpoint"),
+                            updated_at=table.c.updated_at,
+                        ),
+                        with_checkpoint,
+                    )
+                await session.commit()
+        except Exception:
+            # Keep the values for the next flush unless newer ones arrived meanwhile.
+            for task_id, value in progress.items():
+                self._progress.setdefault(task_id, value)
+            for task_id, value in checkpoints.items():
+                self._checkpoints.setdefault(task_id, value)
+            raise
+        return len(progress)
+
+
+class ProgressReporter:
+    """Callable handed to handlers as ``progress`` to report how far they got.
+
+    ``progress(0.4, "step 2/5", checkpoint={...})`` may be called as often
+    as the handler likes, from the event loop or from a handler thread. A
+    status message is published at most once per ``publish_interval``
+    seconds; values are buffered in a :class:`ProgressBuffer` for the next
+    batched write. ``checkpoint`` holds the last checkpoint persisted for
+    the task, so a redelivered task can resume where it stopped.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        *,
+        publish: Callable[[TaskStatusMessage], Awaitable[None]],
+        buffer: ProgressBuffer,
+        checkpoint: Any = None,
+        publish_interval: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.task_id = task_id
+        self.checkpoint = checkpoint
+        self._publish = publish
+        self._buffer = buffer
+        self._publish_interval = publish_interval
+        self._clock = clock
+        self._loop = asyncio.get_running_loop()
+        self._last_publish: Optional[float] = None
+        self._publishing: set[asyncio.Task] = set()
+
+    def __call__(
+        self,
+        progress: float,
+        message: Optional[str] = None,
+        *,
+        checkpoint: Any = _UNSET,
+    ) -> None:
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._record(progress, message, checkpoint)
+        else:
+            self._loop.call_soon_threadsafe(self._record, progress, message, checkpoint)
+
+    async def close(self) -> None:
+        """Wait for status messages that are still being published."""
+        if self._publishing:
+            await asyncio.gather(*self._publishing, return_exceptions=True)
+
+    def _record(self, progress: float, message: Optional[str], checkpoint: Any) -> None:
+        progress = min(1.0, max(0.0, float(progress)))
+        self._buffer.update(self.task_id, progress, checkpoint)
+        if checkpoint is not _UNSET:
+            self.checkpoint = checkpoint
+
+        now = self._clock()
+        if self._last_publish is not None and now - self._last_publish < self._publish_interval:
+            return
+        self._last_publish = now
+        status_message = TaskStatusMessage(
+            task_id=self.task_id,
+            status=TaskStatus.PROCESSING,
+            progress=progress,
+            updated_at=datetime.now(timezone.utc),
+            message=message,
+        )
+        task = self._loop.create_task(self._send(status_message))
+        self._publishing.add(task)
+        task.add_done_callback(self._publishing.discard)
+
+    async def _send(self, message: TaskStatusMessage) -> None:
+        try:
+            await self._publish(message)
+        except Exception as exc:  # pragma: no cover - relies on external redis
+            logger.warning("Failed to publish progress for task %s: %s", self.task_id, exc)
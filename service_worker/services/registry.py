@@ -0,0 +1,102 @@
+"""Registry mapping task types to their handler and execution limits."""
+
+from __future__ import annotations
+
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Optional
+
+from .executor import ExecutionMode
+
+
+class UnknownTaskType(LookupError):
+    """Raised when a task names a type no handler was registered for."""
+
+
+@dataclass(frozen=True)
+class TaskType:
+    """How tasks of one type are run.
+
+    ``None`` limits fall back to the worker-wide settings: ``concurrency``
+    to the dispatcher limit, ``timeout`` to ``WORKER_TASK_TIMEOUT`` and
+    ``executor`` to ``WORKER_EXECUTOR``.
+    """
+
+    name: str
+    handler: Callable[..., Any]
+    concurrency: Optional[int] = None
+    timeout: Optional[float] = None
+    executor: Optional[ExecutionMode] = None
+    accepts_progress: bool = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "accepts_progress",
+            "progress" in inspect.signature(self.handler).parameters,
+        )
+
+
+class HandlerRegistry:
+    """Task types known to this worker, registered with :meth:`register`.
+
+    ``register`` works as a decorator on module-level handler functions::
+
+        @registry.register("report", concurrency=2, timeout=600, executor="process")
+        def build_report(payload): ...
+    """
+
+    def __init__(self) -> None:
+        self._types: dict[str, TaskType] = {}
+
+    def register(
+        self,
+        name: str,
+        handler: Optional[Callable[..., Any]] = None,
+        *,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None,
+        executor: Optional[ExecutionMode | str] = None,
+    ):
+        """Register ``handler`` for ``name``; without a handler, return a decorator."""
+
+        def add(func: Callable[..., Any]) -> Callable[..., Any]:
+            if name in self._types:
+                raise ValueError(f"Task type {name!r} is already registered")
+            self._types[name] = TaskType(
+                name,
+                func,
+                concurrency=max(1, concurrency) if concurrency is not None else None,
+                timeout=timeout,
+                executor=ExecutionMode(executor) if executor is not None else None,
+            )
+            return func
+
+        return add if handler is None else add(handler)
+
+    def get(self, name: str) -> TaskType:
+        """Return the registration for ``name``."""
+        try:
+            return self._types[name]
+        except KeyError:
+            raise UnknownTaskType(f"Unknown task type {name!r}") from None
+
+    def concurrency_limits(self) -> dict[str, int]:
+        """Return the concurrency caps of the types that declare one."""
+        return {
+            name: task_type.concurrency
+            for name, task_type in self._types.items()
+            if task_type.concurrency is not None
+        }
+
+    def executor_modes(self) -> set[ExecutionMode]:
+        """Return the execution modes requested explicitly by registered types."""
+        return {
+            task_type.executor for task_type in self._types.values() if task_type.executor is not None
+        }
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._types
+
+    def __iter__(self) -> Iterator[TaskType]:
+        return iter(self._types.values())
@@ -0,0 +1,60 @@
+"""Retry policy deciding when a failed delivery is retried or dead-lettered."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import BrokenExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+from redis import exceptions as redis_exceptions
+from sqlalchemy import exc as sa_exc
+
+
+TRANSIENT_ERRORS: tuple[type[BaseException], ...] = (
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+    sa_exc.TimeoutError,
+    redis_exceptions.ConnectionError,
+    redis_exceptions.TimeoutError,
+    ConnectionError,
+    asyncio.TimeoutError,
+    BrokenExecutor,
+)
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Return True when the error is worth retrying (lost connections, timeouts)."""
+    return isinstance(exc, TRANSIENT_ERRORS)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff over a fixed number of delivery attempts.
+
+    Delays are quantised into tiers (one per retry) so each tier maps onto a
+    RabbitMQ delay queue with a fixed TTL.
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    multiplier: float = 4.0
+    max_delay: float = 300.0
+
+    def delays(self) -> tuple[float, ...]:
+        """Return the distinct backoff tiers used between attempts."""
+        tiers: list[float] = []
+        for retry in range(max(0, self.max_attempts - 1)):
+            delay = min(self.base_delay * self.multiplier**retry, self.max_delay)
+            if delay not in tiers:
+                tiers.append(delay)
+        return tuple(tiers)
+
+    def next_delay(self, attempt: int) -> Optional[float]:
+        """Return the delay before the next attempt, or None once attempts are exhausted.
+
+        ``attempt`` is the 1-based number of the attempt that just failed.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        return min(self.base_delay * self.multiplier ** (attempt - 1), self.max_delay)
@@ -0,0 +1,45 @@
+"""Periodic reconciliation of the Redis task statistics against MySQL."""
+
+from __future__ import annotations
+
+import logging
+from collections import Counter
+
+from sqlalchemy import func, select
+
+from taskflow_core import Database, Task, TaskArchive, TaskStatus
+from taskflow_core.stats import TaskStatsRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class TaskStatsReconciler:
+    """Recount tasks per status and overwrite the incrementally maintained counters.
+
+    The counts come from ``GROUP BY status`` over the status indexes of
+    ``tasks`` and ``tasks_archive``, so the cost grows with the number of
+    statuses read from the index rather than the payloads stored.
+    """
+
+    def __init__(self, database: Database, recorder: TaskStatsRecorder):
+        self._database = database
+        self._recorder = recorder
+
+    async def count_by_status(self) -> Counter[TaskStatus]:
+        """Return the authoritative number of tasks in each status."""
+        counts: Counter[TaskStatus] = Counter()
+        async with self._database.session() as session:
+            for model in (Task, TaskArchive):
+                result = await session.execute(
+                    select(model.status, func.count()).group_by(model.status)
+                )
+                for status, count in result.all():
+                    counts[TaskStatus(status)] += count
+        return counts
+
+    async def run_once(self) -> Counter[TaskStatus]:
+        """Recount and publish the corrected counters."""
+        counts = await self.count_by_status()
+        await self._recorder.replace_counts(counts)
+        logger.debug("Reconciled task statistics: %s", dict(counts))
+        return counts
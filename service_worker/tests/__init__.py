@@ -0,0 +1 @@
+"""Test package for the TaskFlow worker service."""
@@ -0,0 +1,146 @@
+"""Unit tests for task archival."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import select
+
+from taskflow_core import (
+    Task,
+    TaskArchive,
+    TaskDependency,
+    TaskPriority,
+    TaskResult,
+    TaskResultChunk,
+    TaskStatus,
+)
+from taskflow_core.results import result_rows
+
+from service_api.services.tasks import TaskService
+from service_worker.services.archiver import ARCHIVED_COLUMNS, TaskArchiver
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+def test_every_archived_column_exists_on_the_live_table():
+    """INSERT ... SELECT copies by name, so archive columns must stay a subset of tasks."""
+    live_columns = {column.name for column in Task.__table__.columns}
+
+    assert "archived_at" not in ARCHIVED_COLUMNS
+    assert "idempotency_key" in ARCHIVED_COLUMNS
+    assert set(ARCHIVED_COLUMNS) <= live_columns
+
+
+def _task(task_id: str, status: TaskStatus, finished_days_ago: float | None, **fields) -> Task:
+    finished_at = NOW - timedelta(days=finished_days_ago) if finished_days_ago is not None else None
+    return Task(
+        id=task_id,
+        title=f"Task {task_id}",
+        payload={"id": task_id},
+        status=status,
+        priority=TaskPriority.NORMAL,
+        created_at=NOW - timedelta(days=30),
+        updated_at=finished_at or NOW,
+        finished_at=finished_at,
+        **fields,
+    )
+
+
+def _archiver(database, **options) -> TaskArchiver:
+    return TaskArchiver(database, retention=timedelta(days=7), batch_pause=0, clock=lambda: NOW, **options)
+
+
+async def _ids(database, model) -> set[str]:
+    async with database.session() as session:
+        return set((await session.execute(select(model.id))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_moves_old_finished_tasks_and_their_edges(sqlite_database):
+    async with sqlite_database.session() as session:
+        session.add_all(
+            [
+                _task("old-done", TaskStatus.DONE, 10, idempotency_key="key-1", task_type="report"),
+                _task("old-failed", TaskStatus.FAILED, 8),
+                _task("recent-done", TaskStatus.DONE, 1),
+                _task("running", TaskStatus.PROCESSING, None),
+                TaskDependency(task_id="recent-done", depends_on_id="old-done"),
+                TaskDependency(task_id="running", depends_on_id="recent-done"),
+            ]
+        )
+        await session.commit()
+
+    assert await _archiver(sqlite_database).archive_batch() == 2
+
+    assert await _ids(sqlite_database, Task) == {"recent-done", "running"}
+    assert await _ids(sqlite_database, TaskArchive) == {"old-done", "old-failed"}
+    async with sqlite_database.session() as session:
+        archived = await session.get(TaskArchive, "old-done")
+        edges = (await session.execute(select(TaskDependency.task_id))).scalars().all()
+    assert archived.payload == {"id": "old-done"}
+    assert archived.status == TaskStatus.DONE
+    assert archived.idempotency_key == "key-1"
+    assert archived.task_type == "report"
+    assert archived.archived_at is not None
+    assert edges == ["running"]
+
+
+@pytest.mark.asyncio
+async def test_archive_runs_in_bounded_batches_oldest_first(sqlite_database):
+    async with sqlite_database.session() as session:
+        session.add_all(_task(f"task-{index}", TaskStatus.DONE, 10 + index) for index in range(5))
+        await session.commit()
+
+    archiver = _archiver(sqlite_database, batch_size=2, max_batches=2)
+    assert await archiver.archive_batch() == 2
+    assert await _ids(sqlite_database, TaskArchive) == {"task-4", "task-3"}
+
+    assert await archiver.run_once() == 3
+    assert await _ids(sqlite_database, Task) == set()
+    assert await archiver.run_once() == 0
+
+
+@pytest.mark.asyncio
+async def test_archive_batch_purges_the_results_of_archived_tasks(sqlite_database):
+    async with sqlite_database.session() as session:
+        session.add_all(
+            [
+                _task("old-inline", TaskStatus.DONE, 10),
+                _task("old-chunked", TaskStatus.DONE, 9),
+                _task("recent-chunked", TaskStatus.DONE, 1),
+                *result_rows("old-inline", b"ok", "text/plain"),
+                *result_rows("old-chunked", b"x" * 10, "text/plain", inline_limit=4, chunk_size=4),
+                *result_rows("recent-chunked", b"y" * 10, "text/plain", inline_limit=4, chunk_size=4),
+            ]
+        )
+        await session.commit()
+
+    assert await _archiver(sqlite_database).archive_batch() == 2
+
+    async with sqlite_database.session() as session:
+        results = set((await session.execute(select(TaskResult.task_id))).scalars())
+        chunks = (await session.execute(select(TaskResultChunk.task_id))).scalars().all()
+    assert results == {"recent-chunked"}
+    assert set(chunks) == {"recent-chunked"}
+    assert len(chunks) == 3
+
+
+@pytest.mark.asyncio
+async def test_archived_tasks_stay_readable_and_keep_their_idempotency_key(sqlite_database):
+    async with sqlite_database.session() as session:
+        session.add(_task("old-done", TaskStatus.DONE, 10, idempotency_key="key-1", client_key="key:a"))
+        await session.commit()
+    await _archiver(sqlite_database).run_once()
+
+    async with sqlite_database.session() as session:
+        service = TaskService(session, None)
+        archived = await service.get_task("old-done")
+        assert archived is not None
+        assert archived.status == TaskStatus.DONE
+        assert await service.get_task("missing") is None
+
+        assert (await service._find_by_idempotency_key("key:a", "key-1")).task.task_id == "old-done"
+        assert await service._find_by_idempotency_key("key:b", "key-1") is None
+        assert await service._find_by_idempotency_key("key:a", "key-2") is None
@@ -0,0 +1,85 @@
+"""Unit tests for propagating task cancellations to running handlers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from service_worker.services.cancellation import CancellationRegistry
+
+
+async def _handler(registry: CancellationRegistry, task_id: str, started: asyncio.Event) -> str:
+    try:
+        with registry.track(task_id):
+            started.set()
+            await asyncio.sleep(10)
+    except asyncio.CancelledError:
+        if not registry.consume_abort(task_id):
+            raise
+        return "aborted"
+    return "finished"
+
+
+@pytest.mark.asyncio
+async def test_cancel_aborts_running_handler_and_remembers_id():
+    """A cancellation should end the running handler normally and mark the id as cancelled."""
+    registry = CancellationRegistry(None)
+    started = asyncio.Event()
+    running = asyncio.create_task(_handler(registry, "task-1", started))
+    await started.wait()
+
+    assert registry.cancel("task-1") is True
+    assert await asyncio.wait_for(running, timeout=1) == "aborted"
+    assert registry.is_cancelled("task-1")
+    assert registry.cancel("task-1") is False
+
+
+@pytest.mark.asyncio
+async def test_shutdown_cancellation_is_not_swallowed():
+    """A handler cancelled for another reason (e.g. draining) must still see CancelledError."""
+    registry = CancellationRegistry(None)
+    started = asyncio.Event()
+    running = asyncio.create_task(_handler(registry, "task-2", started))
+    await started.wait()
+
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+
+
+async def _finish_then_write(registry: CancellationRegistry, task_id: str, done: asyncio.Future) -> int:
+    try:
+        with registry.track(task_id):
+            await asyncio.wait_for(done, timeout=10)
+    except asyncio.CancelledError:
+        if not registry.consume_abort(task_id):
+            raise
+    await asyncio.sleep(0)  # the final state write
+    return asyncio.current_task().cancelling()
+
+
+@pytest.mark.asyncio
+async def test_cancel_racing_handler_completion_does_not_outlive_the_handler():
+    """An abort issued as the handler completes must not linger past ``track``."""
+    registry = CancellationRegistry(None)
+    done = asyncio.get_running_loop().create_future()
+    running = asyncio.create_task(_finish_then_write(registry, "task-3", done))
+    await asyncio.sleep(0)
+
+    # The handler's result is in, but its task has not resumed to unregister yet.
+    done.set_result(None)
+    assert registry.cancel("task-3") is True
+
+    assert await asyncio.wait_for(running, timeout=1) == 0
+    assert registry.cancel("task-3") is False
+
+
+def test_cancelled_ids_are_bounded():
+    """Only the most recent ``max_ids`` cancellations are remembered."""
+    registry = CancellationRegistry(None, max_ids=2)
+    for task_id in ("a", "b", "c"):
+        registry.cancel(task_id)
+
+    assert not registry.is_cancelled("a")
+    assert registry.is_cancelled("b") and registry.is_cancelled("c")
@@ -0,0 +1,94 @@
+"""Unit tests for the adaptive concurrency controller."""
+
+from __future__ import annotations
+
+from taskflow_core.db import PoolStats
+
+from service_worker.services.concurrency import AdaptiveConcurrencyController, prefetch_for
+
+
+async def _noop_apply(limit: int) -> None:
+    return None
+
+
+def _controller(pool_stats: PoolStats | None = None) -> AdaptiveConcurrencyController:
+    return AdaptiveConcurrencyController(
+        _noop_apply,
+        initial=10,
+        minimum=2,
+        maximum=12,
+        latency_tolerance=2.0,
+        max_error_rate=0.1,
+        max_pool_wait=0.05,
+        pool_stats=(lambda: pool_stats) if pool_stats is not None else None,
+    )
+
+
+def test_saturated_healthy_window_adds_one_slot_up_to_maximum():
+    controller = _controller()
+    for _ in range(3):
+        controller.record(0.2, False, 10)
+    assert controller.evaluate() == 11
+
+    for _ in range(3):
+        for _ in range(3):
+            controller.record(0.2, False, controller.limit)
+        controller.evaluate()
+    assert controller.limit == 12
+
+
+def test_unsaturated_window_keeps_limit():
+    controller = _controller()
+    controller.record(0.2, False, 3)
+    assert controller.evaluate() == 10
+
+
+def test_errors_or_slow_handlers_back_off_multiplicatively():
+    controller = _controller()
+    controller.record(0.2, False, 3)
+    controller.evaluate()
+
+    controller.record(0.2, True, 10)
+    controller.record(0.2, False, 10)
+    assert controller.evaluate() == 7
+
+    controller.record(1.0, False, 7)
+    assert controller.evaluate() == 4
+
+
+def test_latency_is_judged_against_each_task_types_baseline():
+    controller = _controller()
+    controller.record(0.1, False, 3, "thumbnail")
+    controller.record(120.0, False, 3, "report")
+    assert controller.evaluate() == 10
+
+    for _ in range(3):
+        controller.record(0.1, False, controller.limit, "thumbnail")
+        controller.record(150.0, False, controller.limit, "report")
+        controller.evaluate()
+    assert controller.limit == 12
+
+    controller.record(0.5, False, 12, "thumbnail")
+    controller.record(0.5, False, 12, "thumbnail")
+    controller.record(130.0, False, 12, "report")
+    assert controller.evaluate() == 8
+
+
+def test_db_pool_wait_triggers_back_off():
+    stats = PoolStats()
+    controller = _controller(stats)
+    stats.record_wait(0.2)
+    stats.record_wait(0.2)
+    controller.record(0.1, False, 10)
+    assert controller.evaluate() == 7
+
+    stats.record_wait(0.001)
+    controller.record(0.1, False, 7)
+    assert controller.evaluate() == 8
+
+
+def test_prefetch_moves_in_power_of_two_steps():
+    """Small limit changes keep the prefetch, so consumers are not restarted each step."""
+    assert [prefetch_for(limit, 1.0) for limit in (1, 2, 3, 4, 5, 8, 9, 16, 17)] == [1, 2, 4, 4, 8, 8, 16, 16, 32]
+    assert prefetch_for(10, 2.0) == prefetch_for(14, 2.0) == 32
+    assert prefetch_for(0, 1.0) == 1
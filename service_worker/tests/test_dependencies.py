@@ -0,0 +1,77 @@
+"""Unit tests for releasing and cancelling dependent tasks."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taskflow_core import Task, TaskStatus
+from taskflow_core.dependencies import resolve_dependents
+
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+class FakeResult:
+    def __init__(self, tasks):
+        self._tasks = tasks
+
+    def scalars(self):
+        return self
+
+    def unique(self):
+        return iter(self._tasks)
+
+
+class FakeSession:
+    """Session double answering each dependents query with the next canned level."""
+
+    def __init__(self, *levels):
+        self._levels = list(levels)
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return FakeResult(self._levels.pop(0) if self._levels else [])
+
+
+def _waiting(task_id: str, pending: int = 1, run_at=None) -> Task:
+    return Task(
+        id=task_id,
+        title=task_id,
+        status=TaskStatus.WAITING,
+        pending_dependencies=pending,
+        run_at=run_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_done_releases_only_dependents_with_nothing_left():
+    """Finishing a dependency queues ready dependents and schedules future ones."""
+    ready = _waiting("ready")
+    later = _waiting("later", run_at=(NOW + timedelta(hours=1)).replace(tzinfo=None))
+    blocked = _waiting("blocked", pending=2)
+
+    changed = await resolve_dependents(
+        FakeSession([ready, later, blocked]), "parent", TaskStatus.DONE, NOW
+    )
+
+    assert [(task.id, task.status) for task, _ in changed] == [
+        ("ready", TaskStatus.PENDING),
+        ("later", TaskStatus.SCHEDULED),
+    ]
+    assert blocked.status == TaskStatus.WAITING and blocked.pending_dependencies == 1
+
+
+@pytest.mark.asyncio
+async def test_failure_cancels_dependents_transitively():
+    """A failed dependency cancels the whole downstream chain."""
+    child, grandchild = _waiting("child"), _waiting("grandchild")
+    session = FakeSession([child], [grandchild])
+
+    changed = await resolve_dependents(session, "parent", TaskStatus.FAILED, NOW)
+
+    assert [task.id for task, _ in changed] == ["child", "grandchild"]
+    assert all(task.status == TaskStatus.CANCELLED and task.finished_at == NOW for task, _ in changed)
+    assert session.queries == 3
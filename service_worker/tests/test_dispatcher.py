@@ -0,0 +1,145 @@
+"""Unit tests for the weighted priority dispatcher."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from taskflow_core import TaskPriority
+
+from service_worker.services.dispatcher import PriorityDispatcher
+
+
+WEIGHTS = {TaskPriority.HIGH: 6, TaskPriority.NORMAL: 3, TaskPriority.LOW: 1}
+
+
+async def _dispatch_all(deliveries: list[tuple[TaskPriority, str]]) -> list[str]:
+    handled: list[str] = []
+    done = asyncio.Event()
+
+    async def handler(message: str) -> None:
+        handled.append(message)
+        if len(handled) == len(deliveries):
+            done.set()
+
+    dispatcher = PriorityDispatcher(handler, WEIGHTS, concurrency=1)
+    for priority, message in deliveries:
+        await dispatcher.submit(priority, message)
+    dispatcher.start()
+    await asyncio.wait_for(done.wait(), timeout=1)
+    await dispatcher.close()
+    return handled
+
+
+@pytest.mark.asyncio
+async def test_high_priority_overtakes_bulk_backlog():
+    """HIGH deliveries queued behind a LOW backlog should be handled first."""
+    deliveries = [(TaskPriority.LOW, f"low-{i}") for i in range(5)]
+    deliveries += [(TaskPriority.HIGH, f"high-{i}") for i in range(2)]
+
+    handled = await _dispatch_all(deliveries)
+
+    assert handled[:2] == ["high-0", "high-1"]
+
+
+@pytest.mark.asyncio
+async def test_lanes_share_slots_by_weight_without_starvation():
+    """Every lane should be served in proportion to its weight."""
+    deliveries = [(priority, f"{priority.value}-{i}") for priority in WEIGHTS for i in range(10)]
+
+    handled = await _dispatch_all(deliveries)
+
+    first_round = handled[:10]
+    assert sum(item.startswith("HIGH") for item in first_round) == 6
+    assert sum(item.startswith("NORMAL") for item in first_round) == 3
+    assert sum(item.startswith("LOW") for item in first_round) == 1
+
+
+class DrainMessage:
+    """Delivery double recording whether it was handed back to the broker."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.requeued = False
+
+    async def nack(self, requeue: bool = True) -> None:
+        self.requeued = requeue
+
+
+@pytest.mark.asyncio
+async def test_drain_requeues_buffered_and_cancels_overdue_handlers():
+    """Drain finishes quick handlers, requeues unstarted deliveries and cuts off slow ones."""
+    finished: list[str] = []
+    cancelled: list[str] = []
+    release = asyncio.Event()
+
+    async def handler(message: DrainMessage) -> None:
+        try:
+            if message.name == "slow":
+                await asyncio.sleep(10)
+            else:
+                await release.wait()
+            finished.append(message.name)
+        except asyncio.CancelledError:
+            cancelled.append(message.name)
+            raise
+
+    dispatcher = PriorityDispatcher(handler, WEIGHTS, concurrency=2)
+    buffered = DrainMessage("buffered")
+    await dispatcher.submit(TaskPriority.HIGH, DrainMessage("quick"))
+    await dispatcher.submit(TaskPriority.HIGH, DrainMessage("slow"))
+    await dispatcher.submit(TaskPriority.LOW, buffered)
+    dispatcher.start()
+    await asyncio.sleep(0)
+    assert dispatcher.in_flight == 2
+
+    asyncio.get_running_loop().call_later(0.01, release.set)
+    cut_short = await dispatcher.drain(timeout=0.1)
+
+    assert cut_short == 1
+    assert finished == ["quick"]
+    assert cancelled == ["slow"]
+    assert buffered.requeued
+
+    late = DrainMessage("late")
+    await dispatcher.submit(TaskPriority.NORMAL, late)
+    assert late.requeued
+
+
+@pytest.mark.asyncio
+async def test_type_limit_parks_slow_type_and_defers_overflow():
+    """A capped type never holds more slots than its limit; other types keep flowing."""
+    running: list[str] = []
+    release = asyncio.Event()
+    deferred: list[str] = []
+
+    async def handler(message: str) -> None:
+        running.append(message)
+        if message.startswith("slow"):
+            await release.wait()
+
+    async def defer(message: str) -> None:
+        deferred.append(message)
+
+    dispatcher = PriorityDispatcher(
+        handler,
+        WEIGHTS,
+        concurrency=4,
+        classify=lambda message: message.split("-")[0],
+        type_limits={"slow": 1},
+        defer=defer,
+    )
+    for name in ("slow-0", "slow-1", "slow-2", "fast-0", "fast-1"):
+        await dispatcher.submit(TaskPriority.NORMAL, name)
+    dispatcher.start()
+    await asyncio.sleep(0.01)
+
+    assert running == ["slow-0", "fast-0", "fast-1"]
+    assert dispatcher.parked() == {"slow": 1}
+    assert deferred == ["slow-2"]
+
+    release.set()
+    await asyncio.sleep(0.01)
+    assert running[-1] == "slow-1"
+    await dispatcher.close()
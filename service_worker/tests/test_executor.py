@@ -0,0 +1,53 @@
+"""Unit tests for handler execution backends."""
+
+from __future__ import annotations
+
+import multiprocessing
+import time
+
+import pytest
+
+from taskflow_core import TaskStatus
+
+from service_worker.services.executor import HandlerExecutor, HandlerTimeoutError
+from service_worker.services.handlers import HandlerResult, evaluate_payload
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["loop", "thread", "process"])
+async def test_executor_returns_handler_result_in_every_mode(mode):
+    executor = HandlerExecutor(mode, max_workers=1)
+    try:
+        result = await executor.run(evaluate_payload, {"message": "done"}, timeout=30)
+    finally:
+        executor.close()
+
+    assert result == HandlerResult(TaskStatus.DONE, "done")
+
+
+@pytest.mark.asyncio
+async def test_executor_times_out_slow_handlers():
+    executor = HandlerExecutor("thread", max_workers=1)
+    try:
+        with pytest.raises(HandlerTimeoutError):
+            await executor.run(time.sleep, 0.5, timeout=0.05)
+    finally:
+        executor.close()
+
+
+@pytest.mark.asyncio
+async def test_timed_out_process_handlers_do_not_leave_children_behind():
+    existing = {child.pid for child in multiprocessing.active_children()}
+    executor = HandlerExecutor("process", max_workers=1)
+    try:
+        with pytest.raises(HandlerTimeoutError):
+            await executor.run(time.sleep, 60, timeout=2)
+        result = await executor.run(evaluate_payload, {"message": "done"}, timeout=30)
+    finally:
+        executor.close()
+
+    assert result == HandlerResult(TaskStatus.DONE, "done")
+    orphans = [child for child in multiprocessing.active_children() if child.pid not in existing]
+    for child in orphans:
+        child.join(5)
+    assert not [child for child in orphans if child.is_alive()]
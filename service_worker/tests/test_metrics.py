@@ -0,0 +1,120 @@
+"""Unit tests for backlog-based worker estimates and the worker scrape endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taskflow_core import Task, TaskStatus
+from taskflow_core.backlog import BacklogSnapshot, desired_workers, oldest_pending_age
+
+from service_worker.services.metrics import MetricsServer, ThroughputMeter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_desired_workers_follows_arrivals_and_backlog():
+    """Workers cover the arrival rate plus draining the backlog within the target."""
+    steady = BacklogSnapshot(pending=0, oldest_pending_seconds=0, arrival_rate=10, handler_seconds=2)
+    assert desired_workers(steady, slots_per_worker=8, drain_seconds=60) == 3
+
+    behind = BacklogSnapshot(
+        pending=0, oldest_pending_seconds=90, arrival_rate=10, handler_seconds=2, queue_depth=1200
+    )
+    assert desired_workers(behind, slots_per_worker=8, drain_seconds=60) == 8
+    assert desired_workers(behind, slots_per_worker=8, drain_seconds=60, maximum=5) == 5
+
+    idle = BacklogSnapshot(pending=0, oldest_pending_seconds=0, arrival_rate=0, handler_seconds=None)
+    assert desired_workers(idle, slots_per_worker=8, drain_seconds=60, minimum=0) == 0
+    waiting = BacklogSnapshot(pending=3, oldest_pending_seconds=5, arrival_rate=0, handler_seconds=None)
+    assert desired_workers(waiting, slots_per_worker=8, drain_seconds=60, minimum=0) == 1
+
+
+@pytest.mark.asyncio
+async def test_oldest_pending_age_counts_from_creation_or_due_time(sqlite_database):
+    """Waiting time starts when a task became due, not at its last update."""
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+    async with sqlite_database.session() as session:
+        assert await oldest_pending_age(session, now) == 0.0
+        session.add_all(
+            [
+                Task(
+                    id="retried",
+                    title="retried",
+                    status=TaskStatus.PENDING,
+                    created_at=now - timedelta(minutes=10),
+                    updated_at=now - timedelta(seconds=5),
+                ),
+                Task(
+                    id="scheduled",
+                    title="scheduled",
+                    status=TaskStatus.PENDING,
+                    created_at=now - timedelta(hours=2),
+                    updated_at=now - timedelta(minutes=1),
+                    run_at=now - timedelta(minutes=3),
+                ),
+                Task(
+                    id="running",
+                    title="running",
+                    status=TaskStatus.PROCESSING,
+                    created_at=now - timedelta(hours=1),
+                    updated_at=now,
+                ),
+            ]
+        )
+        await session.commit()
+
+        assert await oldest_pending_age(session, now) == 600.0
+
+
+def test_throughput_meter_uses_a_sliding_window():
+    """Rate and mean handler time only reflect completions inside the window."""
+    clock = FakeClock()
+    meter = ThroughputMeter(window=10, clock=clock)
+    assert meter.mean_duration() is None
+
+    clock.now = 5
+    meter.record(1.0)
+    meter.record(3.0)
+    assert meter.rate() == 2 / 5
+    assert meter.mean_duration() == 2.0
+
+    clock.now = 20
+    meter.record(0.5)
+    assert meter.rate() == 1 / 10
+    assert meter.mean_duration() == 0.5
+
+
+def test_metrics_server_serves_rendered_text():
+    """GET /metrics returns the rendered body; other paths are 404."""
+
+    async def scenario() -> tuple[bytes, bytes]:
+        async def render() -> str:
+            return "taskflow_backlog_desired_workers 3.0\n"
+
+        server = MetricsServer(render, host="127.0.0.1", port=0)
+        await server.start()
+        try:
+            responses = []
+            for path in ("/metrics", "/other"):
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                writer.write(f"GET {path} HTTP/1.1\r\nHost: worker\r\n\r\n".encode())
+                await writer.drain()
+                responses.append(await reader.read())
+                writer.close()
+            return responses[0], responses[1]
+        finally:
+            await server.close()
+
+    metrics, missing = asyncio.run(scenario())
+    assert metrics.startswith(b"HTTP/1.1 200 OK")
+    assert metrics.endswith(b"\r\n\r\ntaskflow_backlog_desired_workers 3.0\n")
+    assert missing.startswith(b"HTTP/1.1 404")
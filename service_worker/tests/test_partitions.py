@@ -0,0 +1,108 @@
+"""Unit tests for partition routing and worker assignment."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+from collections import Counter
+
+import pytest
+
+from taskflow_core import TaskPriority
+from taskflow_core.routing import partition_for, task_routing_key
+from service_worker.infra.mq import TaskQueueConsumer
+from service_worker.services.partitions import assign_partitions
+
+
+class SlowQueue:
+    """Queue whose consume/cancel yield to the loop, like a broker round-trip."""
+
+    tags = itertools.count()
+
+    def __init__(self):
+        self.active: set[str] = set()
+
+    async def consume(self, callback, no_ack):
+        await asyncio.sleep(0)
+        tag = f"ctag-{next(self.tags)}"
+        self.active.add(tag)
+        return tag
+
+    async def cancel(self, tag):
+        await asyncio.sleep(0)
+        self.active.discard(tag)
+
+
+class FakeChannel:
+    async def set_qos(self, prefetch_count):
+        await asyncio.sleep(0)
+
+
+def test_partition_for_is_stable_and_moves_few_keys_when_growing():
+    """Keys keep their partition and only about 1/(N+1) move when a partition is added."""
+    keys = [f"customer-{index}" for index in range(5000)]
+    before = [partition_for(key, 8) for key in keys]
+    after = [partition_for(key, 9) for key in keys]
+
+    assert before == [partition_for(key, 8) for key in keys]
+    assert max(Counter(before).values()) < 1.3 * len(keys) / 8
+    moved = sum(old != new for old, new in zip(before, after))
+    assert moved < 1.5 * len(keys) / 9
+    assert all(new == 8 for old, new in zip(before, after) if old != new)
+
+    assert partition_for("anything", 1) == 0
+    assert task_routing_key("task.created", "HIGH", "customer-1", 1) == "task.created.high"
+    assert task_routing_key("task.created", "NORMAL", "customer-1", 8) == (
+        f"task.created.p{partition_for('customer-1', 8)}"
+    )
+
+
+def test_every_partition_has_exactly_one_owner_and_leavers_only_release_theirs():
+    """Workers agree on a disjoint cover of the partitions; a leave only moves its share."""
+    workers = ["worker-a", "worker-b", "worker-c"]
+    owned = {worker: assign_partitions(worker, workers, 12) for worker in workers}
+
+    assert sorted(p for share in owned.values() for p in share) == list(range(12))
+
+    remaining = workers[:2]
+    after = {worker: assign_partitions(worker, remaining, 12) for worker in remaining}
+    for worker in remaining:
+        assert owned[worker] <= after[worker]
+    assert after["worker-a"] | after["worker-b"] == set(range(12))
+
+
+@pytest.mark.asyncio
+async def test_prefetch_change_racing_a_rebalance_never_revives_released_partitions():
+    """set_prefetch and assign interleave at every await; released queues end up unconsumed."""
+    consumer = TaskQueueConsumer("amqp://", "tasks", "tasks", "task.created", partitions=2)
+    consumer._channel = FakeChannel()
+    consumer._queues = {(priority, partition): SlowQueue() for priority in TaskPriority for partition in (0, 1)}
+
+    async def handler(priority, message):
+        return None
+
+    await consumer.consume(handler)
+    await asyncio.gather(consumer.set_prefetch(5), consumer.assign({0}), consumer.set_prefetch(7))
+
+    for (priority, partition), queue in consumer._queues.items():
+        assert len(queue.active) == (1 if partition == 0 else 0), (priority, partition)
+    assert set(consumer._consumer_tags) == {(priority, 0) for priority in TaskPriority}
+
+
+@pytest.mark.asyncio
+async def test_unchanged_prefetch_keeps_the_running_consumers():
+    consumer = TaskQueueConsumer("amqp://", "tasks", "tasks", "task.created")
+    consumer._channel = FakeChannel()
+    consumer._queues = {(priority, 0): SlowQueue() for priority in TaskPriority}
+
+    async def handler(priority, message):
+        return None
+
+    await consumer.consume(handler)
+    await consumer.set_prefetch(8)
+    tags = dict(consumer._consumer_tags)
+
+    await consumer.set_prefetch(8)
+    assert consumer._consumer_tags == tags
+    await consumer.set_prefetch(16)
+    assert set(consumer._consumer_tags.values()).isdisjoint(tags.values())
@@ -0,0 +1,28 @@
+"""Unit tests for connection pool starvation detection."""
+
+from __future__ import annotations
+
+import pytest
+
+from taskflow_core.db import PoolStats
+
+from service_worker.services.pools import PoolMonitor
+
+
+@pytest.mark.asyncio
+async def test_pool_monitor_flags_slow_checkouts_since_last_run():
+    """Only waits accumulated since the previous run count towards starvation."""
+    stats = PoolStats()
+    monitor = PoolMonitor({"db": lambda: stats.snapshot(size=5, checked_out=5)}, max_wait=0.05)
+
+    stats.record_wait(0.01)
+    assert await monitor.run_once() == []
+
+    stats.record_wait(0.5)
+    assert await monitor.run_once() == ["db"]
+
+    stats.record_wait(0.01)
+    assert await monitor.run_once() == []
+
+    stats.timeouts += 1
+    assert await monitor.run_once() == ["db"]
@@ -0,0 +1,71 @@
+"""Unit tests for throttled progress reporting."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from service_worker.services.progress import ProgressBuffer, ProgressReporter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_reports_are_throttled_for_redis_and_coalesced_for_mysql():
+    """Only one status message per interval is published; the buffer keeps the latest values."""
+    published = []
+
+    async def publish(message):
+        published.append(message.progress)
+
+    clock = FakeClock()
+    buffer = ProgressBuffer(database=None)
+    reporter = ProgressReporter(
+        "task-1",
+        publish=publish,
+        buffer=buffer,
+        checkpoint={"offset": 10},
+        publish_interval=1.0,
+        clock=clock,
+    )
+    assert reporter.checkpoint == {"offset": 10}
+
+    for step in range(1, 6):
+        reporter(step / 10, checkpoint={"offset": step * 100})
+    clock.now = 1.5
+    reporter(0.9)
+    await reporter.close()
+
+    assert published == [0.1, 0.9]
+    assert buffer._progress == {"task-1": 0.9}
+    assert buffer._checkpoints == {"task-1": {"offset": 500}}
+    assert reporter.checkpoint == {"offset": 500}
+
+    buffer.discard("task-1")
+    assert await buffer.flush() == 0
+
+
+@pytest.mark.asyncio
+async def test_reports_from_handler_threads_hop_onto_the_loop():
+    """Thread-mode handlers may call the reporter directly."""
+    published = []
+
+    async def publish(message):
+        published.append(message.progress)
+
+    buffer = ProgressBuffer(database=None)
+    reporter = ProgressReporter("task-2", publish=publish, buffer=buffer)
+
+    await asyncio.to_thread(reporter, 2.0, "almost")
+    await asyncio.sleep(0)
+    await reporter.close()
+
+    assert published == [1.0]
+    assert buffer._progress == {"task-2": 1.0}
@@ -0,0 +1,39 @@
+"""Unit tests for the task-type handler registry."""
+
+from __future__ import annotations
+
+import pytest
+
+from taskflow_core import DEFAULT_TASK_TYPE
+
+from service_worker.services.executor import ExecutionMode
+from service_worker.services.handlers import evaluate_payload, registry
+from service_worker.services.registry import HandlerRegistry, UnknownTaskType
+
+
+def test_registry_records_per_type_limits():
+    """Types declare handler, cap, timeout and executor; unknown names are rejected."""
+    types = HandlerRegistry()
+
+    @types.register("report", concurrency=2, timeout=600, executor="process")
+    def build_report(payload):
+        return None
+
+    def resize(payload, *, progress):
+        return None
+
+    types.register("resize", resize, executor="thread")
+
+    report = types.get("report")
+    assert report.handler is build_report
+    assert (report.concurrency, report.timeout, report.executor) == (2, 600, ExecutionMode.PROCESS)
+    assert not report.accepts_progress and types.get("resize").accepts_progress
+    assert types.concurrency_limits() == {"report": 2}
+    assert types.executor_modes() == {ExecutionMode.PROCESS, ExecutionMode.THREAD}
+
+    with pytest.raises(ValueError):
+        types.register("report", build_report)
+    with pytest.raises(UnknownTaskType):
+        types.get("missing")
+
+    assert registry.get(DEFAULT_TASK_TYPE).handler is evaluate_payload
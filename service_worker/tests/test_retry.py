@@ -0,0 +1,217 @@
+"""Unit tests for delivery retries and dead-lettering."""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from taskflow_core import Task, TaskStatus
+
+from service_worker import worker
+from service_worker.infra.mq import ATTEMPT_HEADER, TaskQueueConsumer
+from service_worker.services.deadletters import FailedTaskReset
+from service_worker.services.executor import ExecutionMode, HandlerExecutor
+from service_worker.services.handlers import HandlerResult
+from service_worker.services.processor import TaskProcessor
+from service_worker.services.registry import HandlerRegistry
+from service_worker.services.retry import RetryPolicy, is_transient
+
+
+class FakeMessage:
+    """Minimal stand-in for an aio_pika IncomingMessage."""
+
+    def __init__(self, attempt: int = 0):
+        self.body = json.dumps(
+            {"task_id": "task-1", "requested_at": datetime.now(timezone.utc).isoformat()}
+        ).encode()
+        self.headers = {ATTEMPT_HEADER: attempt} if attempt else {}
+
+    @asynccontextmanager
+    async def process(self, **_kwargs):
+        yield
+
+
+class BrokerMessage(FakeMessage):
+    """A message as published to an exchange and received back from a queue."""
+
+    def __init__(self, published, routing_key: str = "task.created"):
+        self.body = published.body
+        self.headers = dict(published.headers or {})
+        self.content_type = published.content_type
+        self.routing_key = routing_key
+        self.acked = False
+
+    async def ack(self):
+        self.acked = True
+
+
+class FakeExchange:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, message, routing_key):
+        self.published.append((message, routing_key))
+
+
+class FakeQueue:
+    def __init__(self, messages):
+        self._messages = list(messages)
+
+    async def get(self, **_kwargs):
+        return self._messages.pop(0) if self._messages else None
+
+
+class NullPublisher:
+    async def publish(self, message):
+        pass
+
+
+class FailingProcessor:
+    def __init__(self, error: Exception):
+        self._error = error
+        self.failed: list[str] = []
+
+    async def process(self, event):
+        raise self._error
+
+    async def mark_failed(self, task_id, reason):
+        self.failed.append(task_id)
+
+
+class RecordingConsumer:
+    def __init__(self):
+        self.retried: list[tuple[int, float]] = []
+        self.dead_lettered: list[int] = []
+
+    async def retry(self, message, *, attempt, delay, error):
+        self.retried.append((attempt, delay))
+
+    async def dead_letter(self, message, *, attempt, error):
+        self.dead_lettered.append(attempt)
+
+
+def test_policy_backs_off_exponentially_and_caps_delay():
+    policy = RetryPolicy(max_attempts=5, base_delay=1.0, multiplier=4.0, max_delay=30.0)
+
+    assert policy.delays() == (1.0, 4.0, 16.0, 30.0)
+    assert policy.next_delay(1) == 1.0
+    assert policy.next_delay(4) == 30.0
+    assert policy.next_delay(5) is None
+
+
+def test_only_connection_level_errors_are_transient():
+    assert is_transient(OperationalError("SELECT 1", {}, Exception("gone away")))
+    assert is_transient(ConnectionResetError())
+    assert not is_transient(ValueError("bad payload"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("attempt", "error", "retried", "dead_lettered"),
+    [
+        (0, ConnectionResetError("redis down"), [(1, 1.0)], []),
+        (4, ConnectionResetError("redis down"), [], [5]),
+        (0, ValueError("bug"), [], [1]),
+    ],
+)
+async def test_handle_message_retries_transient_errors_until_exhausted(
+    attempt, error, retried, dead_lettered
+):
+    processor = FailingProcessor(error)
+    consumer = RecordingConsumer()
+
+    succeeded = await worker.handle_message(
+        processor,
+        FakeMessage(attempt),
+        consumer=consumer,
+        retry_policy=RetryPolicy(max_attempts=5),
+    )
+
+    assert succeeded is False
+    assert consumer.retried == retried
+    assert consumer.dead_lettered == dead_lettered
+    assert processor.failed == (["task-1"] if dead_lettered else [])
+
+
+def _succeed(payload):
+    return HandlerResult(TaskStatus.DONE, "ok")
+
+
+@pytest.mark.asyncio
+async def test_replayed_dead_letter_runs_the_task_again(sqlite_database):
+    """A dead-lettered FAILED task is reset to PENDING on replay and then completes."""
+    async with sqlite_database.session() as session:
+        session.add(Task(id="task-1", title="t", payload={}, task_type="report"))
+        await session.commit()
+
+    registry = HandlerRegistry()
+    registry.register("report", _succeed, executor="thread")
+    loop_executor = HandlerExecutor(ExecutionMode.LOOP)
+    thread_executor = HandlerExecutor(ExecutionMode.THREAD, max_workers=1)
+    consumer = TaskQueueConsumer("amqp://unused", "task.topic", "tasks", "task.created")
+    consumer._dead_letter_exchange = dead_letters = FakeExchange()
+    consumer._exchange = task_exchange = FakeExchange()
+
+    # No thread executor configured: a permanent error, so the delivery is dead-lettered.
+    misconfigured = TaskProcessor(sqlite_database, NullPublisher(), loop_executor, registry=registry)
+    message = FakeMessage()
+    message.body = json.dumps(
+        {
+            "task_id": "task-1",
+            "task_type": "report",
+            "requested_at": datetime.now(timezone.utc).isoformat(),
+        }
+    ).encode()
+    message.content_type = "application/json"
+    message.routing_key = "task.created"
+    assert not await worker.handle_message(
+        misconfigured, message, consumer=consumer, retry_policy=RetryPolicy(max_attempts=3)
+    )
+    async with sqlite_database.session() as session:
+        assert (await session.get(Task, "task-1")).status == TaskStatus.FAILED
+
+    (dead_letter, _), = dead_letters.published
+    queued = BrokerMessage(dead_letter)
+    consumer._dead_letter_queue = FakeQueue([queued])
+    assert await consumer.replay_dead_letters(prepare=FailedTaskReset(sqlite_database)) == 1
+    assert queued.acked
+    async with sqlite_database.session() as session:
+        task = await session.get(Task, "task-1")
+        assert (task.status, task.finished_at) == (TaskStatus.PENDING, None)
+
+    (replayed, routing_key), = task_exchange.published
+    assert ATTEMPT_HEADER not in (replayed.headers or {})
+    fixed = TaskProcessor(
+        sqlite_database,
+        NullPublisher(),
+        loop_executor,
+        registry=registry,
+        executors={ExecutionMode.THREAD: thread_executor},
+    )
+    try:
+        assert await worker.handle_message(
+            fixed, BrokerMessage(replayed, routing_key), consumer=consumer, retry_policy=RetryPolicy()
+        )
+    finally:
+        thread_executor.close()
+    async with sqlite_database.session() as session:
+        assert (await session.get(Task, "task-1")).status == TaskStatus.DONE
+
+
+@pytest.mark.asyncio
+async def test_replay_drops_dead_letters_of_tasks_finished_otherwise(sqlite_database):
+    """A dead letter whose task was cancelled meanwhile is acknowledged, not republished."""
+    async with sqlite_database.session() as session:
+        session.add(Task(id="task-1", title="t", status=TaskStatus.CANCELLED))
+        await session.commit()
+
+    body = json.dumps(
+        {"task_id": "task-1", "requested_at": datetime.now(timezone.utc).isoformat()}
+    ).encode()
+    assert await FailedTaskReset(sqlite_database)(body) is False
+    async with sqlite_database.session() as session:
+        assert (await session.get(Task, "task-1")).status == TaskStatus.CANCELLED
@@ -0,0 +1,61 @@
+"""Unit tests for the start-up helpers."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from taskflow_core import startup
+from taskflow_core.startup import StartupTimer, connect_with_retry, start_concurrently
+
+
+@pytest.mark.asyncio
+async def test_connect_with_retry_backs_off_exponentially(monkeypatch):
+    """Delays double per attempt and are capped at max_backoff."""
+    delays: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        delays.append(seconds)
+
+    monkeypatch.setattr(startup.asyncio, "sleep", fake_sleep)
+    calls = 0
+
+    async def flaky() -> str:
+        nonlocal calls
+        calls += 1
+        if calls < 5:
+            raise ConnectionError("not yet")
+        return "ready"
+
+    result = await connect_with_retry("dep", flaky, attempts=5, backoff=0.25, max_backoff=1.0)
+
+    assert result == "ready"
+    assert delays == [0.25, 0.5, 1.0, 1.0]
+
+
+@pytest.mark.asyncio
+async def test_start_concurrently_runs_steps_in_parallel_and_cancels_on_failure():
+    """Steps overlap in time, and a failing step cancels the ones still running."""
+    timer = StartupTimer("test")
+    started = asyncio.Event()
+    cancelled = False
+
+    async def slow() -> None:
+        nonlocal cancelled
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+    async def failing() -> None:
+        await started.wait()
+        raise ConnectionError("down")
+
+    with pytest.raises(ConnectionError):
+        await start_concurrently(timer, {"slow": slow, "failing": failing})
+
+    assert cancelled
+    assert set(timer.durations) == {"slow", "failing"}
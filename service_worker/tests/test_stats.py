@@ -0,0 +1,51 @@
+"""Unit tests for the task statistics helpers."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from taskflow_core import TaskStatus
+from taskflow_core.stats import DURATION_BUCKETS, TaskStatsRecorder, histogram_percentile
+
+
+def test_histogram_percentile_reports_bucket_upper_bound():
+    """Percentiles resolve to the upper bound of the bucket holding the quantile."""
+    histogram = {"0.5": 50, "1": 40, "10": 9, "60": 1}
+
+    assert histogram_percentile(histogram, 0.5) == 0.5
+    assert histogram_percentile(histogram, 0.9) == 1.0
+    assert histogram_percentile(histogram, 0.99) == 10.0
+
+
+def test_histogram_percentile_handles_empty_and_open_ended_buckets():
+    """No samples yields None and the +Inf bucket reports the largest finite bound."""
+    assert histogram_percentile({}, 0.5) is None
+    assert histogram_percentile({"inf": 3}, 0.5) == DURATION_BUCKETS[-2]
+
+
+@pytest.mark.asyncio
+async def test_snapshot_percentiles_cover_only_the_requested_window():
+    """Durations are bucketed per minute, so old slow runs age out of the percentiles."""
+    fakeredis = pytest.importorskip("fakeredis")
+    stats = TaskStatsRecorder(fakeredis.FakeAsyncRedis(decode_responses=True))
+    now = datetime(2026, 10, 19, 12, 0, 30, tzinfo=timezone.utc)
+
+    for _ in range(10):
+        await stats.record_transition(
+            TaskStatus.PROCESSING, TaskStatus.DONE, at=now - timedelta(minutes=30), duration=600
+        )
+    await stats.record_transition(
+        TaskStatus.PROCESSING, TaskStatus.DONE, at=now - timedelta(minutes=1), duration=0.2
+    )
+    await stats.record_transition(TaskStatus.PROCESSING, TaskStatus.DONE, at=now, duration=2)
+
+    recent = await stats.snapshot(minutes=5, now=now)
+    assert recent.duration_p50 == 0.25
+    assert recent.duration_p99 == 2.5
+
+    hour = await stats.snapshot(minutes=60, now=now)
+    assert hour.duration_p50 == 600
+
+    assert (await stats.snapshot(minutes=5, now=now + timedelta(minutes=10))).duration_p50 is None
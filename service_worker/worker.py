@@ -3,84 +3,113 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import json
 import logging
+import os
+import signal
+import socket
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from datetime import timedelta
+from typing import Awaitable, Callable, Sequence
 
 from aio_pika import IncomingMessage
-from sqlalchemy import select
 
-from taskflow_core import Database, Task, TaskStatus
+from taskflow_core import DEFAULT_TASK_TYPE, Database, TaskPriority
+from taskflow_core.backlog import backlog_samples, desired_workers, oldest_pending_age, read_backlog
+from taskflow_core.metrics import pool_samples, render_prometheus
 from taskflow_core.schemas import TaskCreatedMessage
+from taskflow_core.state import TaskStateCache
+from taskflow_core.startup import StartupTimer, connect_with_retry, start_concurrently
+from taskflow_core.stats import TaskStatsRecorder
 
-from .core.config import get_settings
+from .core.config import Settings, get_settings
 from .infra.cache import RedisPublisher
 from .infra.db import create_database
-from .infra.mq import TaskQueueConsumer
+from .infra.mq import TaskQueueConsumer, delivery_attempts
+from .services.archiver import TaskArchiver
+from .services.cancellation import CancellationRegistry
+from .services.concurrency import AdaptiveConcurrencyController, prefetch_for
+from .services.dispatcher import PriorityDispatcher
+from .services.executor import HandlerExecutor
+from .services.handlers import registry
+from .services.metrics import MetricsServer, ThroughputMeter
+from .services.partitions import PartitionRebalancer
+from .services.periodic import PeriodicJob
+from .services.pools import PoolMonitor
+from .services.processor import TaskProcessor
+from .services.progress import ProgressBuffer
+from .services.retry import RetryPolicy, is_transient
+from .services.scheduler import DueTaskScheduler
+from .services.stats import TaskStatsReconciler
 
 
 logger = logging.getLogger(__name__)
 
+SHUTDOWN_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
 
 @asynccontextmanager
 async def app_lifespan():
-    """Initialise shared infrastructure and ensure dependent services are ready."""
+    """Initialise shared infrastructure, connecting to MySQL, Redis and RabbitMQ concurrently."""
     settings = get_settings()
+    timer = StartupTimer("worker")
 
-    database = create_database(settings.db_url, echo=settings.db_echo)
-    redis = RedisPublisher(settings.redis_url)
+    database = create_database(
+        settings.db_url,
+        echo=settings.db_echo,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+    )
+    redis = RedisPublisher(
+        settings.redis_url,
+        max_connections=settings.redis_max_connections,
+        acquire_timeout=settings.redis_acquire_timeout,
+        health_check_interval=settings.redis_health_check_interval,
+    )
     consumer = TaskQueueConsumer(
         settings.rabbitmq_url,
         exchange=settings.rabbitmq_exchange,
         queue_name=settings.rabbitmq_queue,
         routing_key=settings.rabbitmq_routing_key,
+        retry_exchange=settings.rabbitmq_retry_exchange,
+        retry_delays=_retry_policy(settings).delays(),
+        dead_letter_exchange=settings.rabbitmq_dead_letter_exchange,
+        dead_letter_queue=settings.rabbitmq_dead_letter_queue,
+        heartbeat=settings.amqp_heartbeat,
+        partitions=settings.task_partitions,
     )
 
-    db_attempts = settings.db_connect_attempts
-    db_backoff = settings.db_connect_backoff
-    for attempt in range(1, db_attempts + 1):
-        try:
-            await database.create_all()
-            break
-        except Exception as exc:
-            if attempt == db_attempts:
-                logger.error("Failed to connect to MySQL after %s attempts", db_attempts)
-                raise
-            wait_time = db_backoff * attempt
-            logger.warning(
-                "MySQL unavailable (attempt %s/%s): %s. Retrying in %.1fs",
-                attempt,
-                db_attempts,
-                exc,
-                wait_time,
-            )
-            await asyncio.sleep(wait_time)
-
-    await redis.connect()
-
-    attempts = settings.rabbitmq_connect_attempts
-    backoff = settings.rabbitmq_connect_backoff
-    for attempt in range(1, attempts + 1):
-        try:
-            await consumer.connect(prefetch=settings.worker_prefetch)
-            break
-        except Exception as exc:  # pragma: no cover - integration behaviour
-            if attempt == attempts:
-                logger.error("Failed to connect to RabbitMQ after %s attempts", attempts)
-                raise
-            wait_time = backoff * attempt
-            logger.warning(
-                "RabbitMQ unavailable (attempt %s/%s): %s. Retrying in %.1fs",
-                attempt,
-                attempts,
-                exc,
-                wait_time,
-            )
-            await asyncio.sleep(wait_time)
+    try:
+        await start_concurrently(
+            timer,
+            {
+                "mysql": lambda: connect_with_retry(
+                    "MySQL",
+                    database.check_schema,
+                    attempts=settings.db_connect_attempts,
+                    backoff=settings.db_connect_backoff,
+                ),
+                "redis": redis.connect,
+                "rabbitmq": lambda: connect_with_retry(
+                    "RabbitMQ",
+                    lambda: consumer.connect(prefetch=settings.worker_prefetch),
+                    attempts=settings.rabbitmq_connect_attempts,
+                    backoff=settings.rabbitmq_connect_backoff,
+                ),
+            },
+        )
+    except BaseException:
+        await consumer.close()
+        await redis.close()
+        await database.dispose()
+        raise
 
     try:
-        yield database, redis, consumer
+        yield database, redis, consumer, timer
     finally:
         await consumer.close()
         await redis.close()
@@ -88,98 +117,369 @@ async def app_lifespan():
 
 
 async def handle_message(
-    database: Database,
-    redis: RedisPublisher,
+    processor: TaskProcessor,
     message: IncomingMessage,
-) -> None:
-    """Process a task message, updating status transitions and broadcasting results."""
-    async with message.process(ignore_processed=True):
+    *,
+    consumer: TaskQueueConsumer,
+    retry_policy: RetryPolicy,
+) -> bool:
+    """Process a task message, retrying transient failures with backoff before dead-lettering.
+
+    Returns False when processing failed and the delivery was retried or dead-lettered.
+    """
+    async with message.process(requeue=True, ignore_processed=True):
         try:
             payload = json.loads(message.body)
             event = TaskCreatedMessage(**payload)
         except Exception as exc:
             logger.exception("Invalid task.created payload", exc_info=exc)
-            return
+            return True
+
+        try:
+            await processor.process(event)
+        except Exception as exc:
+            attempt = delivery_attempts(message) + 1
+            delay = retry_policy.next_delay(attempt) if is_transient(exc) else None
+            if delay is not None:
+                logger.warning(
+                    "Task %s failed (attempt %s/%s): %s. Retrying in %.1fs",
+                    event.task_id,
+                    attempt,
+                    retry_policy.max_attempts,
+                    exc,
+                    delay,
+                )
+                await consumer.retry(message, attempt=attempt, delay=delay, error=str(exc))
+                return False
+
+            logger.exception(
+                "Task %s failed after %s attempt(s); dead-lettering",
+                event.task_id,
+                attempt,
+                exc_info=exc,
+            )
+            await consumer.dead_letter(message, attempt=attempt, error=str(exc))
+            await processor.mark_failed(event.task_id, str(exc))
+            return False
+    return True
+
+
+def _task_type(message: IncomingMessage) -> str:
+    """Read the task type of a delivery; malformed bodies are left to ``handle_message``."""
+    try:
+        return str(json.loads(message.body).get("task_type") or DEFAULT_TASK_TYPE)
+    except Exception:
+        return DEFAULT_TASK_TYPE
+
+
+def _load_handler_modules(settings: Settings) -> None:
+    """Import the modules registering extra task types on the handler registry."""
+    for name in settings.worker_handler_modules.split(","):
+        if name.strip():
+            importlib.import_module(name.strip())
+
+
+def _retry_policy(settings: Settings) -> RetryPolicy:
+    """Build the delivery retry policy described by the worker settings."""
+    return RetryPolicy(
+        max_attempts=settings.worker_max_attempts,
+        base_delay=settings.worker_retry_base_delay,
+        multiplier=settings.worker_retry_multiplier,
+        max_delay=settings.worker_retry_max_delay,
+    )
+
+
+def _concurrency_controller(
+    settings: Settings,
+    database: Database,
+    apply: Callable[[int], Awaitable[None]],
+) -> AdaptiveConcurrencyController:
+    """Build the AIMD controller that tunes concurrency from handler and DB pool signals.
+
+    The ceiling is capped at the DB pool's capacity: more handlers than
+    connections only queue on checkouts.
+    """
+    return AdaptiveConcurrencyController(
+        apply,
+        initial=settings.worker_concurrency,
+        minimum=settings.worker_min_concurrency,
+        maximum=min(settings.worker_max_concurrency, settings.db_pool_size + settings.db_max_overflow),
+        latency_tolerance=settings.worker_latency_tolerance,
+        max_error_rate=settings.worker_max_error_rate,
+        max_pool_wait=settings.worker_max_pool_wait,
+        pool_stats=lambda: database.pool_stats,
+        interval=settings.worker_control_interval,
+    )
+
+
+async def _render_metrics(
+    settings: Settings,
+    database: Database,
+    redis: RedisPublisher,
+    consumer: TaskQueueConsumer,
+    dispatcher: PriorityDispatcher,
+    stats: TaskStatsRecorder,
+    meter: ThroughputMeter,
+) -> str:
+    """Render pool, dispatcher and backlog gauges, including the desired worker count.
 
-        now = datetime.now(timezone.utc)
+    Queue depth comes from the broker and covers every partition, so any
+    worker can answer for the whole pool; handler time is this worker's
+    recent average.
+    """
+    samples = pool_samples("db", database.pool_metrics())
+    samples += pool_samples("redis", {"default": redis.pool_metrics()})
+    samples += [
+        ("taskflow_worker_in_flight", {}, dispatcher.in_flight),
+        ("taskflow_worker_concurrency_limit", {}, dispatcher.limit),
+    ]
+    queue_depth = None
+    try:
+        depths = await consumer.queue_depths()
+    except Exception as exc:
+        logger.warning("Failed to read queue depths: %s", exc)
+    else:
+        queue_depth = sum(depths.values())
+        samples += [
+            (
+                "taskflow_queue_depth",
+                {"priority": priority.value, "partition": str(partition)},
+                depth,
+            )
+            for (priority, partition), depth in depths.items()
+        ]
+
+    async def oldest_age() -> float:
         async with database.session() as session:
-            result = await session.execute(select(Task).where(Task.id == event.task_id))
-            task = result.scalar_one_or_none()
-            if task is None:
-                logger.warning("Task %s not found for processing", event.task_id)
-                return
-
-            task.status = TaskStatus.PROCESSING
-            task.updated_at = now
-            task.finished_at = None
-            session.add(task)
-            await session.commit()
-
-        await redis.publish_status_update(
-            event.task_id,
-            {
-                "task_id": event.task_id,
-                "status": TaskStatus.PROCESSING.value,
-                "updated_at": now.isoformat(),
-            },
+            return await oldest_pending_age(session)
+
+    try:
+        snapshot = await read_backlog(
+            stats,
+            oldest_age,
+            queue_depth=queue_depth,
+            throughput=meter.rate(),
+            handler_seconds=meter.mean_duration(),
+        )
+    except Exception as exc:
+        logger.warning("Failed to read task backlog: %s", exc)
+    else:
+        desired = desired_workers(
+            snapshot,
+            slots_per_worker=settings.autoscale_slots_per_worker,
+            drain_seconds=settings.autoscale_drain_seconds,
+            minimum=settings.autoscale_min_workers,
+            maximum=settings.autoscale_max_workers or None,
         )
+        samples += backlog_samples(snapshot, desired)
+    return render_prometheus(samples)
 
-        payload_data = event.payload if isinstance(event.payload, dict) else None
-        if payload_data and "message" in payload_data:
-            final_status = TaskStatus.DONE
-            status_message = payload_data.get("message")
-        else:
-            final_status = TaskStatus.FAILED
-            status_message = "Payload missing required 'message' field"
 
-        final_timestamp = datetime.now(timezone.utc)
+async def _drain(
+    consumer: TaskQueueConsumer,
+    dispatcher: PriorityDispatcher,
+    executors: Sequence[HandlerExecutor],
+    background: Sequence[
+        PeriodicJob | AdaptiveConcurrencyController | CancellationRegistry | PartitionRebalancer
+    ],
+    *,
+    timeout: float,
+) -> None:
+    """Stop intake, let in-flight handlers finish up to ``timeout``, then requeue the rest.
 
-        try:
-            async with database.session() as session:
-                result = await session.execute(select(Task).where(Task.id == event.task_id))
-                task = result.scalar_one_or_none()
-                if task is None:
-                    logger.warning("Task %s missing while applying final status", event.task_id)
-                else:
-                    task.status = final_status
-                    task.updated_at = final_timestamp
-                    task.finished_at = final_timestamp
-                    session.add(task)
-                    await session.commit()
-        except Exception as exc:
-            logger.exception("Final status update failed for task %s", event.task_id, exc_info=exc)
-            final_status = TaskStatus.FAILED
-            final_timestamp = datetime.now(timezone.utc)
-            status_message = str(exc)
-
-            async with database.session() as session:
-                result = await session.execute(select(Task).where(Task.id == event.task_id))
-                task = result.scalar_one_or_none()
-                if task is not None:
-                    task.status = TaskStatus.FAILED
-                    task.updated_at = final_timestamp
-                    task.finished_at = final_timestamp
-                    session.add(task)
-                    await session.commit()
-
-        await redis.publish_status_update(
-            event.task_id,
+    Background jobs and the concurrency controller stop first so nothing
+    restarts consumers mid-drain. Status publishes are awaited inside each
+    handler, so once the drain returns every Redis update has been sent
+    before the lifespan closes the connections.
+    """
+    for component in background:
+        await component.close()
+    await consumer.cancel()
+    cancelled = await dispatcher.drain(timeout)
+    for executor in executors:
+        executor.close()
+    logger.info("Worker drained (%s handler(s) requeued at the deadline)", cancelled)
+
+
+async def run_worker() -> None:
+    """Start the worker and run until SIGTERM/SIGINT, then drain gracefully."""
+    settings = get_settings()
+    retry_policy = _retry_policy(settings)
+    prefetch_ratio = settings.worker_prefetch / max(1, settings.worker_concurrency)
+    _load_handler_modules(settings)
+    async with app_lifespan() as (database, redis, consumer, timer):
+        executor = HandlerExecutor(
+            settings.worker_executor,
+            max_workers=settings.worker_executor_workers or None,
+        )
+        executors = {
+            mode: HandlerExecutor(mode, max_workers=settings.worker_executor_workers or None)
+            for mode in registry.executor_modes() - {executor.mode}
+        }
+        stats = TaskStatsRecorder(redis.client)
+        cancellations = CancellationRegistry(redis.client)
+        progress = ProgressBuffer(database)
+        processor = TaskProcessor(
+            database,
+            redis,
+            executor,
+            timeout=settings.worker_task_timeout or None,
+            registry=registry,
+            executors=executors,
+            stats=stats,
+            state=TaskStateCache(redis.client, ttl=settings.task_state_cache_ttl),
+            cancellations=cancellations,
+            enqueue=consumer.publish_task_created,
+            progress=progress,
+            progress_publish_interval=settings.progress_publish_interval,
+        )
+
+        async def defer(message: IncomingMessage) -> None:
+            # Park on the shortest delay queue without spending an attempt.
+            await consumer.retry(
+                message,
+                attempt=delivery_attempts(message),
+                delay=retry_policy.delays()[0],
+                error="Deferred: task type at its concurrency limit",
+            )
+            await message.ack()
+
+        meter = ThroughputMeter()
+
+        def on_complete(duration: float, failed: bool, in_flight: int, task_type: str) -> None:
+            meter.record(duration)
+            if controller is not None:
+                controller.record(duration, failed, in_flight, task_type)
+
+        async def apply_limit(limit: int) -> None:
+            dispatcher.set_limit(limit)
+            await consumer.set_prefetch(prefetch_for(limit, prefetch_ratio))
+
+        controller = (
+            _concurrency_controller(settings, database, apply_limit)
+            if settings.worker_adaptive_concurrency
+            else None
+        )
+        dispatcher = PriorityDispatcher(
+            lambda message: handle_message(
+                processor,
+                message,
+                consumer=consumer,
+                retry_policy=retry_policy,
+            ),
+            {
+                TaskPriority.HIGH: settings.worker_weight_high,
+                TaskPriority.NORMAL: settings.worker_weight_normal,
+                TaskPriority.LOW: settings.worker_weight_low,
+            },
+            concurrency=settings.worker_concurrency,
+            on_complete=on_complete,
+            classify=_task_type,
+            type_limits=registry.concurrency_limits(),
+            defer=defer if retry_policy.delays() else None,
+        )
+        reconciler = TaskStatsReconciler(database, stats)
+        pool_monitor = PoolMonitor(
             {
-                "task_id": event.task_id,
-                "status": final_status.value,
-                "updated_at": final_timestamp.isoformat(),
-                **({"message": status_message} if status_message else {}),
+                "db": lambda: database.pool_metrics()["primary"],
+                "redis": redis.pool_metrics,
             },
+            max_wait=settings.worker_max_pool_wait,
         )
+        jobs: list[PeriodicJob] = [
+            PeriodicJob("reconcile-stats", reconciler.run_once, settings.stats_reconcile_interval),
+            PeriodicJob("monitor-pools", pool_monitor.run_once, settings.pool_monitor_interval),
+            PeriodicJob("flush-progress", progress.flush, settings.progress_flush_interval),
+        ]
+        if settings.scheduler_enabled:
+            scheduler = DueTaskScheduler(
+                database,
+                consumer.publish_task_created,
+                batch_size=settings.scheduler_batch_size,
+                stats=stats,
+            )
+            jobs.append(
+                PeriodicJob("dispatch-scheduled", scheduler.run_once, settings.scheduler_interval)
+            )
+        if settings.archive_enabled:
+            archiver = TaskArchiver(
+                database,
+                retention=timedelta(days=settings.archive_retention_days),
+                batch_size=settings.archive_batch_size,
+            )
+            jobs.append(PeriodicJob("archive-tasks", archiver.run_once, settings.archive_interval))
+        rebalancer = None
+        if consumer.partitions > 1:
+            rebalancer = PartitionRebalancer(
+                redis.client,
+                consumer.assign,
+                worker_id=settings.worker_id or f"{socket.gethostname()}-{os.getpid()}",
+                partitions=consumer.partitions,
+                member_ttl=settings.partition_member_ttl,
+            )
+            try:
+                await rebalancer.run_once()
+            except Exception as exc:
+                # Consume every partition until Redis answers; single-active-consumer
+                # queues keep the per-key order while ownership is being sorted out.
+                logger.warning("Initial partition assignment failed, consuming all: %s", exc)
+            jobs.append(
+                PeriodicJob(
+                    "rebalance-partitions",
+                    rebalancer.run_once,
+                    settings.partition_rebalance_interval,
+                )
+            )
 
+        metrics_server = None
+        if settings.worker_metrics_port:
+            metrics_server = MetricsServer(
+                lambda: _render_metrics(
+                    settings, database, redis, consumer, dispatcher, stats, meter
+                ),
+                host=settings.worker_metrics_host,
+                port=settings.worker_metrics_port,
+            )
+            await metrics_server.start()
 
-async def run_worker() -> None:
-    """Start the worker, registering the consumer and waiting indefinitely."""
-    async with app_lifespan() as (database, redis, consumer):
-        await consumer.consume(lambda message: handle_message(database, redis, message))
+        cancellations.start()
+        dispatcher.start()
+        if controller is not None:
+            controller.start()
+        for job in jobs:
+            job.start()
+        await consumer.consume(dispatcher.submit)
+        timer.report()
 
         stop_event = asyncio.Event()
-        await stop_event.wait()
+        loop = asyncio.get_running_loop()
+        for signum in SHUTDOWN_SIGNALS:
+            loop.add_signal_handler(signum, stop_event.set)
+        try:
+            await stop_event.wait()
+            logger.info("Shutdown requested; draining in-flight tasks")
+        finally:
+            for signum in SHUTDOWN_SIGNALS:
+                loop.remove_signal_handler(signum)
+            await _drain(
+                consumer,
+                dispatcher,
+                [executor, *executors.values()],
+                [
+                    cancellations,
+                    *jobs,
+                    *([controller] if controller is not None else []),
+                    *([rebalancer] if rebalancer is not None else []),
+                ],
+                timeout=settings.worker_shutdown_timeout,
+            )
+            if metrics_server is not None:
+                await metrics_server.close()
+            try:
+                # Keep the last checkpoints of requeued handlers for their redelivery.
+                await progress.flush()
+            except Exception as exc:
+                logger.warning("Failed to flush task progress on shutdown: %s", exc)
 
 
 def main() -> None:
@@ -2,23 +2,36 @@
 Shared building blocks for the TaskFlow services.
 """
 
-from .enums import TaskStatus
-from .models import Base, Task
+from .enums import DEFAULT_TASK_TYPE, TERMINAL_STATUSES, TaskPriority, TaskStatus
+from .models import Base, Task, TaskArchive, TaskDependency, TaskResult, TaskResultChunk
 from .schemas import (
     TaskCreate,
+    TaskLookupRequest,
+    TaskLookupResponse,
     TaskRead,
     TaskStatusMessage,
     TaskCreatedMessage,
+    TaskStats,
 )
 from .db import Database
 
 __all__ = [
     "TaskStatus",
+    "TaskPriority",
+    "TERMINAL_STATUSES",
+    "DEFAULT_TASK_TYPE",
     "Base",
     "Task",
+    "TaskArchive",
+    "TaskDependency",
+    "TaskResult",
+    "TaskResultChunk",
     "TaskCreate",
+    "TaskLookupRequest",
+    "TaskLookupResponse",
     "TaskRead",
     "TaskStatusMessage",
     "TaskCreatedMessage",
+    "TaskStats",
     "Database",
 ]
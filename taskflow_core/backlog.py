@@ -0,0 +1,145 @@
+"""Backlog signals and a worker-count estimate for lag-based autoscaling.
+
+CPU is a poor scaling signal for I/O-bound workers; what matters is how
+much work is waiting and how fast it drains. Both services expose the same
+gauges on ``/metrics`` so an external autoscaler can follow
+``taskflow_backlog_desired_workers``.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .enums import TaskStatus
+from .models import Task
+from .stats import TaskStatsRecorder
+
+ARRIVAL_WINDOW_MINUTES = 5
+
+Sample = tuple[str, dict[str, str], float]
+
+
+@dataclass(frozen=True)
+class BacklogSnapshot:
+    """Point-in-time view of waiting work and how fast it is being handled.
+
+    ``queue_depth`` is the broker's count of ready messages when known;
+    ``pending`` is the PENDING counter. ``arrival_rate`` and ``throughput``
+    are tasks per second.
+    """
+
+    pending: int
+    oldest_pending_seconds: float
+    arrival_rate: float
+    handler_seconds: Optional[float]
+    queue_depth: Optional[int] = None
+    throughput: Optional[float] = None
+
+    @property
+    def backlog(self) -> int:
+        """Waiting work, preferring the broker's own count."""
+        return self.queue_depth if self.queue_depth is not None else self.pending
+
+
+def desired_workers(
+    snapshot: BacklogSnapshot,
+    *,
+    slots_per_worker: int,
+    drain_seconds: float,
+    minimum: int = 1,
+    maximum: Optional[int] = None,
+) -> int:
+    """Estimate the workers needed to keep up with arrivals and clear the backlog.
+
+    By Little's law the busy handler slots equal the completion rate times
+    the handler time. The rate needed is the arrival rate plus the backlog
+    spread over ``drain_seconds``. Without a handler-time measurement yet,
+    one worker is asked for whenever work is waiting.
+    """
+    if snapshot.handler_seconds is None:
+        needed = 1 if snapshot.backlog else 0
+    else:
+        rate = snapshot.arrival_rate + snapshot.backlog / max(drain_seconds, 1e-9)
+        needed = math.ceil(rate * snapshot.handler_seconds / max(1, slots_per_worker))
+    needed = max(minimum, needed)
+    return needed if maximum is None else min(maximum, needed)
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+async def oldest_pending_age(session: AsyncSession, now: Optional[datetime] = None) -> float:
+    """Return how many seconds the longest-waiting PENDING task has been due.
+
+    A task is due from its ``run_at`` when it was scheduled and from its
+    ``created_at`` otherwise; ``updated_at`` would restart the clock on every
+    retry or progress write. Both minimums are single probes of
+    ``idx_tasks_status_run_at_created_at``.
+    """
+    pending = Task.status == TaskStatus.PENDING
+    created = select(func.min(Task.created_at)).where(pending, Task.run_at.is_(None))
+    scheduled = select(func.min(Task.run_at)).where(pending, Task.run_at.is_not(None))
+    row = (await session.execute(select(created.scalar_subquery(), scheduled.scalar_subquery()))).one()
+    due = [_aware(value) for value in row if value is not None]
+    if not due:
+        return 0.0
+    oldest = min(due)
+    return max(0.0, ((now or datetime.now(timezone.utc)) - oldest).total_seconds())
+
+
+async def read_backlog(
+    stats: Optional[TaskStatsRecorder],
+    oldest_age: Callable[[], Awaitable[float]],
+    *,
+    queue_depth: Optional[int] = None,
+    throughput: Optional[float] = None,
+    handler_seconds: Optional[float] = None,
+) -> BacklogSnapshot:
+    """Combine the Redis counters, the oldest PENDING age and caller measurements.
+
+    Arrivals are averaged over the last ``ARRIVAL_WINDOW_MINUTES`` complete
+    minutes. ``handler_seconds`` falls back to the median processing time over
+    the same window when the caller has no recent measurement of its own.
+    """
+    pending, arrival_rate = 0, 0.0
+    if stats is not None:
+        snapshot = await stats.snapshot(minutes=ARRIVAL_WINDOW_MINUTES + 1)
+        pending = snapshot.counts.get(TaskStatus.PENDING.value, 0)
+        complete_minutes = snapshot.throughput[:-1]
+        if complete_minutes:
+            created = sum(minute.created for minute in complete_minutes)
+            arrival_rate = created / (60.0 * len(complete_minutes))
+        if handler_seconds is None:
+            handler_seconds = snapshot.duration_p50
+    return BacklogSnapshot(
+        pending=pending,
+        oldest_pending_seconds=await oldest_age(),
+        arrival_rate=arrival_rate,
+        handler_seconds=handler_seconds,
+        queue_depth=queue_depth,
+        throughput=throughput,
+    )
+
+
+def backlog_samples(snapshot: BacklogSnapshot, desired: int) -> list[Sample]:
+    """Turn a snapshot into ``taskflow_backlog_*`` gauges."""
+    samples: list[Sample] = [
+        ("taskflow_backlog_pending", {}, snapshot.pending),
+        ("taskflow_backlog_oldest_pending_seconds", {}, snapshot.oldest_pending_seconds),
+        ("taskflow_backlog_arrival_rate", {}, snapshot.arrival_rate),
+        ("taskflow_backlog_desired_workers", {}, desired),
+    ]
+    if snapshot.queue_depth is not None:
+        samples.append(("taskflow_backlog_queue_depth", {}, snapshot.queue_depth))
+    if snapshot.throughput is not None:
+        samples.append(("taskflow_backlog_throughput", {}, snapshot.throughput))
+    if snapshot.handler_seconds is not None:
+        samples.append(("taskflow_backlog_handler_seconds", {}, snapshot.handler_seconds))
+    return samples
@@ -2,23 +2,173 @@
 
 from __future__ import annotations
 
+import itertools
+import logging
+import time
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional, Sequence
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import exc as sa_exc, text
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from .models import Base
 
+logger = logging.getLogger(__name__)
+
+# Alembic head this code expects; bump it together with every new migration.
+SCHEMA_REVISION = "c8e2a6d4f913"
+
+# Errors meaning the replica itself is unreachable, as opposed to a bad query.
+REPLICA_FAILURE_ERRORS: tuple[type[BaseException], ...] = (
+    sa_exc.OperationalError,
+    sa_exc.InterfaceError,
+    sa_exc.TimeoutError,
+    ConnectionError,
+)
+
+
+@dataclass
+class PoolStats:
+    """Running counters describing how long callers wait for pooled connections."""
+
+    waiting: int = 0
+    checkouts: int = 0
+    timeouts: int = 0
+    wait_seconds_total: float = 0.0
+    wait_seconds_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Account for one completed checkout that took ``seconds`` to obtain."""
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self, **gauges: float) -> dict[str, float]:
+        """Return the counters merged with pool-specific gauges such as ``checked_out``."""
+        return {
+            **gauges,
+            "waiting": self.waiting,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records checkout wait time and timeouts in :class:`PoolStats`."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def connect(self):
+        self.stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.waiting -= 1
+            self.stats.record_wait(time.perf_counter() - started)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def metrics(self) -> dict[str, float]:
+        """Return checkout gauges and wait counters for this pool."""
+        return self.stats.snapshot(
+            size=self.size(),
+            checked_out=self.checkedout(),
+            overflow=max(0, self.overflow()),
+        )
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database is not migrated to the revision the code expects."""
+
+
+class ReadReplica:
+    """A read-only engine that is taken out of rotation for a while after failing."""
+
+    def __init__(self, engine: AsyncEngine, *, ejection_seconds: float):
+        self.engine = engine
+        self.session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        self._ejection_seconds = ejection_seconds
+        self._ejected_until = 0.0
+
+    @property
+    def healthy(self) -> bool:
+        """Return True unless the replica was ejected and its ejection window is still open."""
+        return time.monotonic() >= self._ejected_until
+
+    def eject(self, exc: BaseException) -> None:
+        """Remove the replica from rotation for ``ejection_seconds``."""
+        self._ejected_until = time.monotonic() + self._ejection_seconds
+        logger.warning(
+            "Ejecting read replica %s for %.0fs: %s",
+            self.engine.url.render_as_string(hide_password=True),
+            self._ejection_seconds,
+            exc,
+        )
+
 
 class Database:
-    """Async database helper wrapping SQLAlchemy session lifecycle."""
+    """Async database helper wrapping SQLAlchemy session lifecycle.
 
-    def __init__(self, url: str, echo: bool = False):
-        self._engine = create_async_engine(url, echo=echo, future=True)
+    Writes go through :meth:`session` on the primary. :meth:`read_session`
+    spreads reads round-robin over the healthy replicas, ejecting a replica
+    for a while when it fails to connect, and uses the primary when no
+    replica is configured or healthy.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        echo: bool = False,
+        *,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = True,
+        replica_urls: Sequence[str] = (),
+        replica_ejection_seconds: float = 30.0,
+    ):
+        engine_options = dict(
+            echo=echo,
+            future=True,
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+        )
+        self._engine = create_async_engine(url, **engine_options)
         self._session_factory = async_sessionmaker(
             self._engine,
             expire_on_commit=False,
         )
+        self._replicas = [
+            ReadReplica(
+                create_async_engine(replica_url, **engine_options),
+                ejection_seconds=replica_ejection_seconds,
+            )
+            for replica_url in replica_urls
+        ]
+        self._replica_cycle = itertools.cycle(self._replicas)
 
     @asynccontextmanager
     async def session(self) -> AsyncIterator[AsyncSession]:
@@ -26,11 +176,67 @@ class Database:
         async with self._session_factory() as session:
             yield session
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """Provide a session for reads that may lag the primary slightly."""
+        replica = self._next_replica()
+        if replica is None:
+            async with self._session_factory() as session:
+                yield session
+            return
+
+        async with replica.session_factory() as session:
+            try:
+                yield session
+            except REPLICA_FAILURE_ERRORS as exc:
+                replica.eject(exc)
+                raise
+
+    def _next_replica(self) -> Optional[ReadReplica]:
+        for _ in range(len(self._replicas)):
+            replica = next(self._replica_cycle)
+            if replica.healthy:
+                return replica
+        return None
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Return the live checkout counters of the primary connection pool."""
+        return self._engine.pool.stats
+
+    def pool_metrics(self) -> dict[str, dict[str, float]]:
+        """Return pool gauges and wait counters keyed by ``primary`` / ``replica-<n>``."""
+        metrics = {"primary": self._engine.pool.metrics()}
+        for index, replica in enumerate(self._replicas):
+            metrics[f"replica-{index}"] = replica.engine.pool.metrics()
+        return metrics
+
+    async def check_schema(self, expected: str = SCHEMA_REVISION) -> str:
+        """Verify the Alembic revision on the primary with a single query and return it.
+
+        This replaces ``create_all`` at boot: migrations are applied by the
+        ``migrate`` job, services only confirm they match.
+        """
+        async with self._engine.connect() as conn:
+            try:
+                result = await conn.execute(text("SELECT version_num FROM alembic_version"))
+            except sa_exc.ProgrammingError as exc:
+                raise SchemaVersionError("alembic_version table missing; run migrations") from exc
+            revisions = set(result.scalars().all())
+        if revisions != {expected}:
+            found = ", ".join(sorted(revisions)) or "none"
+            raise SchemaVersionError(
+                f"database schema revision {found} does not match expected {expected}"
+            )
+        return expected
+
     async def create_all(self) -> None:
-        """Create tables if they do not exist."""
+        """Create tables if they do not exist (local development and tests only)."""
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
 
     async def dispose(self) -> None:
-        """Close the engine and release pooled connections."""
+        """Close the engines and release pooled connections."""
         await self._engine.dispose()
+        for replica in self._replicas:
+            await replica.engine.dispose()
@@ -0,0 +1,71 @@
+"""Release or cancel tasks waiting on a dependency once it finishes.
+
+Both services call :func:`resolve_dependents` inside the transaction that
+moves a task to a terminal status, so the dependency counters change
+atomically with the status of the task they depend on.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .enums import TaskStatus
+from .models import Task, TaskDependency
+
+
+def _aware(value: datetime) -> datetime:
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+async def _waiting_dependents(session: AsyncSession, task_ids: list[str]) -> list[Task]:
+    """Lock the WAITING tasks that depend on any of ``task_ids``, in id order."""
+    result = await session.execute(
+        select(Task)
+        .join(TaskDependency, TaskDependency.task_id == Task.id)
+        .where(TaskDependency.depends_on_id.in_(task_ids), Task.status == TaskStatus.WAITING)
+        .order_by(Task.id)
+        .with_for_update()
+    )
+    return list(result.scalars().unique())
+
+
+async def resolve_dependents(
+    session: AsyncSession,
+    task_id: str,
+    status: TaskStatus,
+    now: datetime,
+) -> list[tuple[Task, TaskStatus]]:
+    """Apply a terminal ``status`` of ``task_id`` to the tasks waiting on it.
+
+    On DONE each dependent's ``pending_dependencies`` drops by one and a
+    dependent with nothing left becomes PENDING (or SCHEDULED when its
+    ``run_at`` is still ahead). On FAILED or CANCELLED the dependents, and
+    transitively theirs, are CANCELLED. Returns ``(task, previous_status)``
+    for every task whose status changed; the caller commits, then enqueues
+    the PENDING ones and broadcasts the rest.
+    """
+    changed: list[tuple[Task, TaskStatus]] = []
+    if status == TaskStatus.DONE:
+        for task in await _waiting_dependents(session, [task_id]):
+            task.pending_dependencies = max(0, task.pending_dependencies - 1)
+            if task.pending_dependencies:
+                continue
+            due_later = task.run_at is not None and _aware(task.run_at) > now
+            task.status = TaskStatus.SCHEDULED if due_later else TaskStatus.PENDING
+            task.updated_at = now
+            changed.append((task, TaskStatus.WAITING))
+        return changed
+
+    frontier = [task_id]
+    while frontier:
+        dependents = await _waiting_dependents(session, frontier)
+        for task in dependents:
+            task.status = TaskStatus.CANCELLED
+            task.updated_at = now
+            task.finished_at = now
+            changed.append((task, TaskStatus.WAITING))
+        frontier = [task.id for task in dependents]
+    return changed
@@ -6,7 +6,25 @@ from enum import Enum
 class TaskStatus(str, Enum):
     """Shared task lifecycle states."""
 
+    SCHEDULED = "SCHEDULED"
+    WAITING = "WAITING"
     PENDING = "PENDING"
     PROCESSING = "PROCESSING"
     DONE = "DONE"
     FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+TERMINAL_STATUSES = frozenset({TaskStatus.DONE, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
+class TaskPriority(str, Enum):
+    """Scheduling classes used to keep interactive work ahead of bulk jobs."""
+
+    HIGH = "HIGH"
+    NORMAL = "NORMAL"
+    LOW = "LOW"
+
+
+# Handler used for tasks submitted without a ``task_type``.
+DEFAULT_TASK_TYPE = "default"
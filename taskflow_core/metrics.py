@@ -0,0 +1,42 @@
+"""Minimal Prometheus text exposition for service-level gauges."""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _labels(labels: Mapping[str, str]) -> str:
+    if not labels:
+        return ""
+    rendered = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in sorted(labels.items())
+    )
+    return "{" + rendered + "}"
+
+
+def pool_samples(
+    backend: str,
+    pools: Mapping[str, Mapping[str, float]],
+) -> list[tuple[str, dict[str, str], float]]:
+    """Turn ``{pool: {stat: value}}`` into ``taskflow_pool_<stat>`` samples."""
+    return [
+        (f"taskflow_pool_{stat}", {"backend": backend, "pool": pool}, value)
+        for pool, stats in pools.items()
+        for stat, value in stats.items()
+    ]
+
+
+def render_prometheus(samples: Iterable[tuple[str, Mapping[str, str], float]]) -> str:
+    """Render ``(name, labels, value)`` samples as Prometheus gauges, grouped by name."""
+    grouped: dict[str, list[str]] = {}
+    for name, labels, value in samples:
+        grouped.setdefault(name, []).append(f"{name}{_labels(labels)} {float(value)}")
+    lines: list[str] = []
+    for name, rendered in grouped.items():
+        lines.append(f"# TYPE {name} gauge")
+        lines.extend(rendered)
+    return "\n".join(lines) + "\n"
@@ -5,20 +5,34 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, Optional
 
-from sqlalchemy import JSON, DateTime, Enum as SqlEnum, String, func
+from sqlalchemy import (
+    JSON,
+    BigInteger,
+    DateTime,
+    Enum as SqlEnum,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    func,
+)
+from sqlalchemy.dialects.mysql import MEDIUMBLOB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
-from .enums import TaskStatus
+from .enums import DEFAULT_TASK_TYPE, TaskPriority, TaskStatus
 
 
 class Base(DeclarativeBase):
     """Base declarative class for SQLAlchemy models."""
 
 
-class Task(Base):
-    """Task row representing the current processing state."""
+# Plain BLOB caps at 64 KiB on MySQL; MEDIUMBLOB holds up to 16 MiB.
+Blob = LargeBinary().with_variant(MEDIUMBLOB(), "mysql")
 
-    __tablename__ = "tasks"
+
+class TaskColumns:
+    """Columns shared by the live ``tasks`` table and ``tasks_archive``."""
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -26,6 +40,9 @@ class Task(Base):
     status: Mapped[TaskStatus] = mapped_column(
         SqlEnum(TaskStatus), nullable=False, default=TaskStatus.PENDING
     )
+    priority: Mapped[TaskPriority] = mapped_column(
+        SqlEnum(TaskPriority), nullable=False, default=TaskPriority.NORMAL
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
@@ -38,3 +55,99 @@ class Task(Base):
         nullable=False,
     )
     finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    run_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True))
+    task_type: Mapped[str] = mapped_column(
+        String(64), nullable=False, default=DEFAULT_TASK_TYPE, server_default=DEFAULT_TASK_TYPE
+    )
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Idempotency keys are unique per client (see service_api admission.client_key),
+    # and a replay must carry the same body, identified by its SHA-256.
+    client_key: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    payload_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+
+
+class Task(TaskColumns, Base):
+    """Task row representing the current processing state."""
+
+    __tablename__ = "tasks"
+    __table_args__ = (
+        Index("uq_tasks_client_key_idempotency_key", "client_key", "idempotency_key", unique=True),
+        Index("idx_tasks_finished_at", "finished_at"),
+        Index("idx_tasks_updated_at", "updated_at"),
+        Index("idx_tasks_status_run_at_created_at", "status", "run_at", "created_at"),
+    )
+
+    pending_dependencies: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    checkpoint: Mapped[Optional[Any]] = mapped_column(JSON, nullable=True)
+    partition_key: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+
+
+class TaskDependency(Base):
+    """Edge stating that ``task_id`` may only run once ``depends_on_id`` is DONE.
+
+    There is no foreign key: finished tasks move to ``tasks_archive`` and the
+    archival job removes their edges.
+    """
+
+    __tablename__ = "task_dependencies"
+    __table_args__ = (Index("idx_task_dependencies_depends_on_id", "depends_on_id"),)
+
+    task_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    depends_on_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+
+
+class TaskResult(Base):
+    """Output of a finished task, kept out of ``tasks`` so task reads never load it.
+
+    Small results are stored inline in ``data``; larger ones are split into
+    ``task_result_chunks`` of ``chunk_size`` bytes so a range read only
+    fetches the chunks it covers. Results are deleted when their task is archived.
+    """
+
+    __tablename__ = "task_results"
+
+    task_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    content_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    chunk_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    data: Mapped[Optional[bytes]] = mapped_column(Blob, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+
+class TaskResultChunk(Base):
+    """One ``chunk_size`` slice of a result too large to store inline."""
+
+    __tablename__ = "task_result_chunks"
+
+    task_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True)
+    data: Mapped[bytes] = mapped_column(Blob, nullable=False)
+
+
+class TaskArchive(TaskColumns, Base):
+    """Finished task moved out of the hot ``tasks`` table after the retention window."""
+
+    __tablename__ = "tasks_archive"
+    __table_args__ = (
+        Index(
+            "uq_tasks_archive_client_key_idempotency_key",
+            "client_key",
+            "idempotency_key",
+            unique=True,
+        ),
+        Index("idx_tasks_archive_status", "status"),
+        Index("idx_tasks_archive_finished_at", "finished_at"),
+    )
+
+    archived_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
@@ -0,0 +1,74 @@
+"""Bounded, instrumented Redis connection pooling shared by the services."""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+from redis import exceptions as redis_exceptions
+from redis.asyncio import BlockingConnectionPool, Redis
+
+from .db import PoolStats
+
+
+class InstrumentedBlockingPool(BlockingConnectionPool):
+    """Blocking Redis pool that records checkouts, waiters, wait time and timeouts.
+
+    Unlike the default pool it never opens more than ``max_connections``;
+    callers wait up to ``timeout`` seconds for a free connection instead.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+        self.checked_out = 0
+
+    async def get_connection(self, *args, **kwargs):
+        self.stats.waiting += 1
+        started = time.perf_counter()
+        try:
+            connection = await super().get_connection(*args, **kwargs)
+        except redis_exceptions.ConnectionError as exc:
+            if isinstance(exc.__cause__, TimeoutError):
+                self.stats.timeouts += 1
+            raise
+        finally:
+            self.stats.waiting -= 1
+            self.stats.record_wait(time.perf_counter() - started)
+        self.checked_out += 1
+        return connection
+
+    async def release(self, connection) -> None:
+        self.checked_out = max(0, self.checked_out - 1)
+        await super().release(connection)
+
+    def metrics(self) -> dict[str, float]:
+        """Return checkout gauges and wait counters for this pool."""
+        return self.stats.snapshot(size=self.max_connections, checked_out=self.checked_out)
+
+
+def create_redis_client(
+    redis_url: str,
+    *,
+    max_connections: int = 100,
+    acquire_timeout: float = 5.0,
+    connect_timeout: float = 5.0,
+    socket_timeout: Optional[float] = None,
+    health_check_interval: int = 30,
+) -> Redis:
+    """Return a text-mode Redis client backed by an :class:`InstrumentedBlockingPool`.
+
+    ``socket_timeout`` defaults to None because older redis-py releases
+    apply it to blocking Pub/Sub reads, which would drop idle subscribers.
+    """
+    pool = InstrumentedBlockingPool.from_url(
+        redis_url,
+        max_connections=max_connections,
+        timeout=acquire_timeout,
+        socket_timeout=socket_timeout,
+        socket_connect_timeout=connect_timeout,
+        health_check_interval=health_check_interval,
+        encoding="utf-8",
+        decode_responses=True,
+    )
+    return Redis.from_pool(pool)
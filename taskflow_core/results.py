@@ -0,0 +1,70 @@
+"""Encoding and storage layout of task results.
+
+The worker writes a result in the same transaction as the task's terminal
+status; the API serves it from ``GET /tasks/{id}/result``. Nothing on the
+``tasks`` read paths joins these tables.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+from .models import TaskResult, TaskResultChunk
+
+RESULT_INLINE_LIMIT = 64 * 1024
+RESULT_CHUNK_SIZE = 1024 * 1024
+MAX_RESULT_SIZE = 256 * 1024 * 1024
+
+
+class ResultTooLarge(ValueError):
+    """Raised when an encoded result exceeds the configured maximum size."""
+
+
+def encode_result(value: Any, *, max_size: int = MAX_RESULT_SIZE) -> tuple[bytes, str]:
+    """Return the stored bytes and content type of a handler result.
+
+    ``bytes`` are kept as-is, ``str`` is UTF-8 text and anything else is
+    encoded as JSON.
+    """
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data, content_type = bytes(value), "application/octet-stream"
+    elif isinstance(value, str):
+        data, content_type = value.encode("utf-8"), "text/plain; charset=utf-8"
+    else:
+        data = json.dumps(value, separators=(",", ":"), default=str).encode("utf-8")
+        content_type = "application/json"
+    if len(data) > max_size:
+        raise ResultTooLarge(f"Result is {len(data)} bytes, the limit is {max_size}")
+    return data, content_type
+
+
+def result_rows(
+    task_id: str,
+    data: bytes,
+    content_type: str,
+    *,
+    inline_limit: int = RESULT_INLINE_LIMIT,
+    chunk_size: int = RESULT_CHUNK_SIZE,
+) -> list[Union[TaskResult, TaskResultChunk]]:
+    """Build the rows storing ``data``: inline when small, otherwise as ordered chunks."""
+    if len(data) <= inline_limit:
+        return [TaskResult(task_id=task_id, content_type=content_type, size=len(data), data=data)]
+    chunks = [
+        TaskResultChunk(task_id=task_id, seq=seq, data=data[offset : offset + chunk_size])
+        for seq, offset in enumerate(range(0, len(data), chunk_size))
+    ]
+    header = TaskResult(
+        task_id=task_id,
+        content_type=content_type,
+        size=len(data),
+        chunk_size=chunk_size,
+    )
+    return [header, *chunks]
+
+
+def chunk_span(result: TaskResult, start: int, end: int) -> Optional[tuple[int, int]]:
+    """Return the first and last chunk numbers holding bytes ``start``..``end`` inclusive."""
+    if not result.chunk_size:
+        return None
+    return start // result.chunk_size, end // result.chunk_size
@@ -0,0 +1,86 @@
+"""Routing-key and queue naming conventions shared by publishers and consumers."""
+
+from __future__ import annotations
+
+import hashlib
+
+from .enums import TaskPriority
+
+_JUMP_MULTIPLIER = 2862933555777941757
+_UINT64_MASK = (1 << 64) - 1
+
+
+def priority_routing_key(base: str, priority: TaskPriority | str) -> str:
+    """Return the routing key that carries tasks of the given priority.
+
+    NORMAL keeps the bare base key so existing bindings and in-flight messages
+    keep flowing; other priorities get a lowercase suffix (``task.created.high``).
+    """
+    priority = TaskPriority(priority)
+    if priority is TaskPriority.NORMAL:
+        return base
+    return f"{base}.{priority.value.lower()}"
+
+
+def priority_queue_name(base: str, priority: TaskPriority | str) -> str:
+    """Return the queue name consuming tasks of the given priority."""
+    return priority_routing_key(base, priority)
+
+
+def partition_for(key: str, partitions: int) -> int:
+    """Map ``key`` to one of ``partitions`` with jump consistent hashing.
+
+    Growing from N to N+1 partitions only moves about 1/(N+1) of the keys,
+    and a key always lands on the same partition for a given N.
+    """
+    if partitions <= 1:
+        return 0
+    hashed = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+    bucket, candidate = -1, 0
+    while candidate < partitions:
+        bucket = candidate
+        hashed = (hashed * _JUMP_MULTIPLIER + 1) & _UINT64_MASK
+        candidate = int((bucket + 1) * ((1 << 31) / ((hashed >> 33) + 1)))
+    return bucket
+
+
+def partition_routing_key(
+    base: str,
+    priority: TaskPriority | str,
+    partition: int,
+    partitions: int,
+) -> str:
+    """Return the routing key of one partition of a priority lane.
+
+    With a single partition this is the plain priority key, so an
+    unpartitioned deployment keeps its existing queues.
+    """
+    routing_key = priority_routing_key(base, priority)
+    if partitions <= 1:
+        return routing_key
+    return f"{routing_key}.p{partition}"
+
+
+def partition_queue_name(
+    base: str,
+    priority: TaskPriority | str,
+    partition: int,
+    partitions: int,
+) -> str:
+    """Return the queue name consuming one partition of a priority lane."""
+    return partition_routing_key(base, priority, partition, partitions)
+
+
+def task_routing_key(
+    base: str,
+    priority: TaskPriority | str,
+    partition_key: str,
+    partitions: int,
+) -> str:
+    """Return the routing key for a task, partitioned by ``partition_key``."""
+    return partition_routing_key(
+        base,
+        priority,
+        partition_for(partition_key, partitions),
+        partitions,
+    )
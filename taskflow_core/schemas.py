@@ -2,19 +2,44 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
 
-from .enums import TaskStatus
+from .enums import DEFAULT_TASK_TYPE, TaskPriority, TaskStatus
+
+
+MAX_SCHEDULE_JITTER = 3600
+MAX_DEPENDENCIES = 100
+TASK_TYPE_PATTERN = r"^[A-Za-z0-9_.:-]+$"
 
 
 class TaskCreate(BaseModel):
-    """Payload accepted by the API when creating a new task."""
+    """Payload accepted by the API when creating a new task.
+
+    ``run_at`` defers execution; ``jitter_seconds`` adds a random delay of up
+    to that many seconds so bulk submissions for the same instant spread out.
+    ``depends_on`` lists tasks that must be DONE before this one is queued.
+    ``partition_key`` routes related tasks to the same queue partition so
+    they are delivered in order; it defaults to the task id. ``task_type``
+    selects the worker handler that runs the task.
+    """
 
     title: str = Field(..., max_length=255)
     payload: Optional[dict[str, Any]] = None
+    priority: TaskPriority = TaskPriority.NORMAL
+    task_type: str = Field(DEFAULT_TASK_TYPE, max_length=64, regex=TASK_TYPE_PATTERN)
+    run_at: Optional[datetime] = None
+    jitter_seconds: float = Field(0.0, ge=0, le=MAX_SCHEDULE_JITTER)
+    depends_on: list[str] = Field(default_factory=list, max_items=MAX_DEPENDENCIES)
+    partition_key: Optional[str] = Field(None, max_length=255)
+
+    @validator("run_at")
+    def _assume_utc(cls, value: Optional[datetime]) -> Optional[datetime]:
+        if value is not None and value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value
 
 
 class TaskRead(BaseModel):
@@ -24,21 +49,58 @@ class TaskRead(BaseModel):
     title: str
     payload: Optional[dict[str, Any]] = None
     status: TaskStatus
+    priority: TaskPriority = TaskPriority.NORMAL
     created_at: datetime
     updated_at: datetime
     finished_at: Optional[datetime] = None
+    run_at: Optional[datetime] = None
+    task_type: str = DEFAULT_TASK_TYPE
 
     class Config:
         orm_mode = True
         use_enum_values = True
 
 
+MAX_LOOKUP_IDS = 500
+
+
+class TaskLookupRequest(BaseModel):
+    """Batch of task ids to resolve, optionally projected onto a subset of fields."""
+
+    task_ids: list[str] = Field(..., min_items=1, max_items=MAX_LOOKUP_IDS)
+    fields: Optional[list[str]] = None
+
+    @validator("fields")
+    def _known_fields(cls, value: Optional[list[str]]) -> Optional[list[str]]:
+        if value is None:
+            return value
+        unknown = sorted(set(value) - set(TaskRead.__fields__))
+        if unknown:
+            raise ValueError(f"unknown fields: {', '.join(unknown)}")
+        return value
+
+
+class TaskLookupResponse(BaseModel):
+    """Tasks found by a bulk lookup, in request order, plus the ids that do not exist."""
+
+    tasks: list[dict[str, Any]]
+    missing: list[str] = Field(default_factory=list)
+
+
 class TaskCreatedMessage(BaseModel):
     """Message published to RabbitMQ when a task is created."""
 
     task_id: str
     payload: Optional[dict[str, Any]] = None
+    priority: TaskPriority = TaskPriority.NORMAL
     requested_at: datetime
+    partition_key: Optional[str] = None
+    task_type: str = DEFAULT_TASK_TYPE
+
+    @property
+    def routing_partition_key(self) -> str:
+        """Key used to pick the queue partition: the caller's key or the task id."""
+        return self.partition_key or self.task_id
 
 
 class TaskStatusMessage(BaseModel):
@@ -52,3 +114,22 @@ class TaskStatusMessage(BaseModel):
 
     class Config:
         use_enum_values = True
+
+
+class TaskThroughput(BaseModel):
+    """Tasks created and finished during one wall-clock minute."""
+
+    minute: datetime
+    created: int = 0
+    finished: int = 0
+
+
+class TaskStats(BaseModel):
+    """Aggregate task statistics served by ``GET /tasks/stats``."""
+
+    counts: dict[str, int]
+    throughput: list[TaskThroughput] = Field(default_factory=list)
+    duration_p50: Optional[float] = None
+    duration_p90: Optional[float] = None
+    duration_p99: Optional[float] = None
+    reconciled_at: Optional[datetime] = None
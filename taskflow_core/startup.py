@@ -0,0 +1,85 @@
+"""Helpers for fast, observable service start-up."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Mapping, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+MAX_CONNECT_BACKOFF = 10.0
+
+
+async def connect_with_retry(
+    name: str,
+    connect: Callable[[], Awaitable[T]],
+    *,
+    attempts: int,
+    backoff: float,
+    max_backoff: float = MAX_CONNECT_BACKOFF,
+) -> T:
+    """Call ``connect`` until it succeeds, doubling the delay between attempts."""
+    for attempt in range(1, attempts + 1):
+        try:
+            return await connect()
+        except Exception as exc:
+            if attempt == attempts:
+                logger.error("Failed to connect to %s after %s attempts", name, attempts)
+                raise
+            wait_time = min(backoff * 2 ** (attempt - 1), max_backoff)
+            logger.warning(
+                "%s unavailable (attempt %s/%s): %s. Retrying in %.2fs",
+                name,
+                attempt,
+                attempts,
+                exc,
+                wait_time,
+            )
+            await asyncio.sleep(wait_time)
+    raise RuntimeError(f"{name}: attempts must be at least 1")
+
+
+class StartupTimer:
+    """Measure start-up phases and log a one-line timing report."""
+
+    def __init__(self, service: str):
+        self._service = service
+        self._started = time.perf_counter()
+        self.durations: dict[str, float] = {}
+
+    async def measure(self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable`` and record how long it took under ``name``."""
+        started = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            self.durations[name] = time.perf_counter() - started
+
+    def report(self) -> float:
+        """Log the total start-up time with a per-phase breakdown and return the total."""
+        total = time.perf_counter() - self._started
+        phases = " ".join(f"{name}={seconds:.3f}s" for name, seconds in self.durations.items())
+        logger.info("%s ready in %.3fs (%s)", self._service, total, phases)
+        return total
+
+
+async def start_concurrently(
+    timer: StartupTimer,
+    steps: Mapping[str, Callable[[], Awaitable[Any]]],
+) -> None:
+    """Run independent start-up steps at the same time; cancel the rest if one fails."""
+    tasks = [
+        asyncio.create_task(timer.measure(name, step()), name=f"startup-{name}")
+        for name, step in steps.items()
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
@@ -0,0 +1,46 @@
+"""Short-lived Redis cache of the latest known state of each task.
+
+The API writes the state on creation and the worker after every committed
+transition, so bulk status lookups can skip MySQL for recently active tasks.
+Entries expire quickly; a lost write only serves stale state for one TTL.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from redis.asyncio import Redis
+
+from .schemas import TaskRead
+
+
+TASK_STATE_KEY_PREFIX = "task:state:"
+
+
+def task_state_key(task_id: str) -> str:
+    """Return the Redis key holding the cached state of ``task_id``."""
+    return f"{TASK_STATE_KEY_PREFIX}{task_id}"
+
+
+class TaskStateCache:
+    """Store and batch-read ``TaskRead`` snapshots keyed by task id."""
+
+    def __init__(self, redis: Redis, *, ttl: int = 60):
+        self._redis = redis
+        self._ttl = ttl
+
+    async def store(self, task: TaskRead) -> None:
+        """Cache the latest state of a task."""
+        await self._redis.set(task_state_key(task.task_id), task.json(), ex=self._ttl)
+
+    async def fetch_many(self, task_ids: Iterable[str]) -> dict[str, TaskRead]:
+        """Return cached states for the given ids with a single MGET; misses are omitted."""
+        task_ids = list(task_ids)
+        if not task_ids:
+            return {}
+        values = await self._redis.mget([task_state_key(task_id) for task_id in task_ids])
+        return {
+            task_id: TaskRead.parse_raw(value)
+            for task_id, value in zip(task_ids, values)
+            if value
+        }
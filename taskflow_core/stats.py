@@ -0,0 +1,171 @@
+"""Incrementally maintained task statistics stored in Redis.
+
+The API and worker bump counters as tasks are created and change status, so
+reading the statistics costs a handful of Redis lookups regardless of how
+many rows the ``tasks`` table holds. A periodic reconciliation against MySQL
+corrects any drift in the per-status counts.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import datetime, timezone
+from typing import Mapping, Optional, Sequence
+
+from redis.asyncio import Redis
+
+from .enums import TERMINAL_STATUSES, TaskStatus
+from .schemas import TaskStats, TaskThroughput
+
+
+STATUS_COUNTS_KEY = "task:stats:status"
+CREATED_KEY_PREFIX = "task:stats:created:"
+FINISHED_KEY_PREFIX = "task:stats:finished:"
+DURATION_KEY_PREFIX = "task:stats:duration:"
+RECONCILED_AT_KEY = "task:stats:reconciled_at"
+MINUTE_BUCKET_TTL = 2 * 60 * 60
+MAX_WINDOW_MINUTES = MINUTE_BUCKET_TTL // 60
+
+# Upper bounds (seconds) of the processing-duration histogram buckets.
+DURATION_BUCKETS: tuple[float, ...] = (
+    0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600, 1800, 3600, math.inf
+)
+
+
+def _minute(at: datetime) -> int:
+    return int(at.timestamp() // 60)
+
+
+def _bucket(seconds: float) -> str:
+    for bound in DURATION_BUCKETS:
+        if seconds <= bound:
+            return str(bound)
+    return str(math.inf)
+
+
+def histogram_percentile(histogram: Mapping[str, int], quantile: float) -> Optional[float]:
+    """Estimate a percentile as the upper bound of the bucket that contains it.
+
+    Samples in the open-ended bucket report the largest finite bound.
+    """
+    buckets = sorted((float(bound), int(count)) for bound, count in histogram.items())
+    total = sum(count for _, count in buckets)
+    if total <= 0:
+        return None
+    threshold = quantile * total
+    cumulative = 0
+    for bound, count in buckets:
+        cumulative += count
+        if cumulative >= threshold:
+            return bound if math.isfinite(bound) else DURATION_BUCKETS[-2]
+    return DURATION_BUCKETS[-2]
+
+
+class TaskStatsRecorder:
+    """Read and update the Redis counters behind ``GET /tasks/stats``."""
+
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    async def record_created(
+        self,
+        *,
+        status: TaskStatus = TaskStatus.PENDING,
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Count a newly created PENDING (or SCHEDULED) task."""
+        minute_key = f"{CREATED_KEY_PREFIX}{_minute(at or datetime.now(timezone.utc))}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(STATUS_COUNTS_KEY, TaskStatus(status).value, 1)
+            pipe.incr(minute_key)
+            pipe.expire(minute_key, MINUTE_BUCKET_TTL)
+            await pipe.execute()
+
+    async def record_transition(
+        self,
+        previous: TaskStatus,
+        current: TaskStatus,
+        *,
+        at: Optional[datetime] = None,
+        duration: Optional[float] = None,
+        count: int = 1,
+    ) -> None:
+        """Move ``count`` tasks between status counters and account for finished work."""
+        if previous == current or count <= 0:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hincrby(STATUS_COUNTS_KEY, TaskStatus(previous).value, -count)
+            pipe.hincrby(STATUS_COUNTS_KEY, TaskStatus(current).value, count)
+            if current in TERMINAL_STATUSES:
+                minute_key = f"{FINISHED_KEY_PREFIX}{_minute(at or datetime.now(timezone.utc))}"
+                pipe.incrby(minute_key, count)
+                pipe.expire(minute_key, MINUTE_BUCKET_TTL)
+                if duration is not None:
+                    histogram_key = f"{DURATION_KEY_PREFIX}{_minute(at or datetime.now(timezone.utc))}"
+                    pipe.hincrby(histogram_key, _bucket(duration), 1)
+                    pipe.expire(histogram_key, MINUTE_BUCKET_TTL)
+            await pipe.execute()
+
+    async def replace_counts(
+        self,
+        counts: Mapping[TaskStatus, int],
+        *,
+        at: Optional[datetime] = None,
+    ) -> None:
+        """Overwrite the per-status counters with authoritative values."""
+        mapping = {status.value: int(counts.get(status, 0)) for status in TaskStatus}
+        reconciled_at = (at or datetime.now(timezone.utc)).isoformat()
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hset(STATUS_COUNTS_KEY, mapping=mapping)
+            pipe.set(RECONCILED_AT_KEY, reconciled_at)
+            await pipe.execute()
+
+    async def status_count(self, status: TaskStatus) -> int:
+        """Return the current counter for one status, e.g. the PENDING backlog."""
+        value = await self._redis.hget(STATUS_COUNTS_KEY, TaskStatus(status).value)
+        return int(value or 0)
+
+    async def snapshot(
+        self,
+        *,
+        minutes: int = 15,
+        now: Optional[datetime] = None,
+    ) -> TaskStats:
+        """Return counts, per-minute throughput and duration percentiles.
+
+        Percentiles merge the per-minute duration histograms of the same
+        ``minutes`` window as the throughput, so they track recent work.
+        """
+        minutes = max(1, min(minutes, MAX_WINDOW_MINUTES))
+        current = _minute(now or datetime.now(timezone.utc))
+        window: Sequence[int] = range(current - minutes + 1, current + 1)
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(STATUS_COUNTS_KEY)
+            pipe.mget([f"{CREATED_KEY_PREFIX}{minute}" for minute in window])
+            pipe.mget([f"{FINISHED_KEY_PREFIX}{minute}" for minute in window])
+            pipe.get(RECONCILED_AT_KEY)
+            for minute in window:
+                pipe.hgetall(f"{DURATION_KEY_PREFIX}{minute}")
+            counts, created, finished, reconciled_at, *histograms = await pipe.execute()
+
+        histogram: dict[str, int] = {}
+        for minute_histogram in histograms:
+            for bound, count in minute_histogram.items():
+                histogram[bound] = histogram.get(bound, 0) + int(count)
+
+        return TaskStats(
+            counts={status.value: int(counts.get(status.value, 0)) for status in TaskStatus},
+            throughput=[
+                TaskThroughput(
+                    minute=datetime.fromtimestamp(minute * 60, tz=timezone.utc),
+                    created=int(created_count or 0),
+                    finished=int(finished_count or 0),
+                )
+                for minute, created_count, finished_count in zip(window, created, finished)
+            ],
+            duration_p50=histogram_percentile(histogram, 0.5),
+            duration_p90=histogram_percentile(histogram, 0.9),
+            duration_p99=histogram_percentile(histogram, 0.99),
+            reconciled_at=reconciled_at,
+        )